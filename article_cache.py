@@ -0,0 +1,301 @@
+"""
+기사 페이지 캐시
+
+같은 기사 URL을 발행일 검증(extract_actual_publish_date)과
+요약용 본문 추출(fetch_article_content)이 각각 다운로드/파싱하던 문제 해결
+- 정규화된 URL 기준으로 원본 바이트, 디코딩된 텍스트, 파싱 결과(meta)를 저장
+- 실행 중에는 메모리 캐시, 선택적으로 디스크 캐시(실행 간 재사용)
+- 같은 URL 동시 요청은 한 번만 다운로드 (스레드 안전)
+
+디스크 캐시 활성화:
+    환경변수 ONDA_ARTICLE_CACHE_DIR=.cache/articles
+    또는 article_cache.enable_disk_cache('.cache/articles')
+
+발행일만 필요할 때는 probe_head()로 <head>까지만 받고 연결을 끊음 (본문 다운로드 생략)
+"""
+
+import codecs
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import http_client
+import run_metrics
+from html_parser import HeadParser
+
+
+# 추적용 쿼리 파라미터 (같은 기사의 다른 URL로 취급하지 않음)
+TRACKING_PARAMS = ('utm_', 'fbclid', 'gclid', 'ref_src', 'cmpid')
+
+DISK_CACHE_TTL_HOURS = float(os.environ.get('ONDA_ARTICLE_CACHE_TTL_HOURS', '24'))
+
+# probe_head에서 받을 최대 바이트 (대부분 언론사 <head>는 이 안에 끝남)
+HEAD_PROBE_MAX_BYTES = int(os.environ.get('ONDA_HEAD_PROBE_MAX_BYTES', str(64 * 1024)))
+HEAD_PROBE_CHUNK_SIZE = 8 * 1024
+
+_memory_cache = {}
+_head_cache = {}
+_key_locks = {}
+_lock = threading.Lock()
+_disk_cache_dir = os.environ.get('ONDA_ARTICLE_CACHE_DIR') or None
+
+
+def normalize_url(url):
+    """
+    캐시 키용 URL 정규화
+    - scheme/host 소문자, fragment 제거, 추적용 파라미터 제거
+    """
+    parts = urlsplit(url.strip())
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith(TRACKING_PARAMS)
+    ]
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path or '/',
+        urlencode(query, doseq=True),
+        ''
+    ))
+
+
+def enable_disk_cache(cache_dir, ttl_hours=None):
+    """디스크 캐시 활성화 (실행 간 재사용)"""
+    global _disk_cache_dir, DISK_CACHE_TTL_HOURS
+    _disk_cache_dir = cache_dir
+    if ttl_hours is not None:
+        DISK_CACHE_TTL_HOURS = ttl_hours
+
+
+def clear_memory_cache():
+    """메모리 캐시 비우기"""
+    with _lock:
+        _memory_cache.clear()
+        _head_cache.clear()
+        _key_locks.clear()
+
+
+def detect_encoding(content, content_type=''):
+    """
+    응답 인코딩 판단
+    1. Content-Type 헤더의 charset
+    2. HTML meta 태그의 charset
+    3. UTF-8 디코드 가능 여부
+    판단 불가 시 None (호출 측에서 apparent_encoding 사용)
+    """
+    content_type = (content_type or '').lower()
+    if 'charset=' in content_type:
+        charset_match = re.search(r'charset=([^\s;]+)', content_type)
+        if charset_match:
+            return charset_match.group(1)
+
+    html_head = content[:2000].decode('latin-1', errors='replace')
+    charset_match = re.search(r'charset=["\']?([^"\'\s>]+)', html_head, re.I)
+    if charset_match:
+        return charset_match.group(1)
+
+    try:
+        content.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return None
+
+
+def _decode(content, encoding):
+    try:
+        return content.decode(encoding, errors='replace')
+    except LookupError:
+        return content.decode('utf-8', errors='replace')
+
+
+def _disk_paths(key):
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+    return (
+        os.path.join(_disk_cache_dir, f'{digest}.json'),
+        os.path.join(_disk_cache_dir, f'{digest}.html.gz'),
+    )
+
+
+def _load_from_disk(key):
+    if not _disk_cache_dir:
+        return None
+
+    info_path, body_path = _disk_paths(key)
+    try:
+        if time.time() - os.path.getmtime(info_path) > DISK_CACHE_TTL_HOURS * 3600:
+            return None
+        with open(info_path, 'r', encoding='utf-8') as f:
+            page = json.load(f)
+        with gzip.open(body_path, 'rb') as f:
+            page['content'] = f.read()
+        page['text'] = _decode(page['content'], page['encoding'])
+        return page
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_to_disk(page):
+    """페이지(원본 + meta)를 디스크 캐시에 저장 (meta 갱신 후에도 호출)"""
+    if not _disk_cache_dir or page.get('status_code') != 200:
+        return
+
+    info_path, body_path = _disk_paths(page['url'])
+    info = {k: v for k, v in page.items() if k not in ('content', 'text')}
+    try:
+        os.makedirs(_disk_cache_dir, exist_ok=True)
+        if not os.path.exists(body_path):
+            with gzip.open(body_path, 'wb') as f:
+                f.write(page['content'])
+        with open(info_path, 'w', encoding='utf-8') as f:
+            json.dump(info, f, ensure_ascii=False)
+    except OSError:
+        pass
+
+
+def _fetch(url, key, timeout):
+    response = http_client.get(url, timeout=timeout, allow_redirects=True)
+    content = response.content
+    encoding = detect_encoding(content, response.headers.get('Content-Type', ''))
+    if not encoding:
+        # apparent_encoding은 비용이 커서 앞의 판단이 모두 실패할 때만 계산
+        encoding = response.apparent_encoding or 'utf-8'
+    return {
+        'url': key,
+        'final_url': response.url,
+        'status_code': response.status_code,
+        'content_type': response.headers.get('Content-Type', ''),
+        'encoding': encoding,
+        'content': content,
+        'text': _decode(content, encoding),
+        'meta': {},
+        'fetched_at': time.time(),
+    }
+
+
+def get_page(url, timeout=10):
+    """
+    기사 페이지 가져오기 (캐시 우선)
+
+    Returns:
+        dict: {url, final_url, status_code, content_type, encoding,
+               content(bytes), text(str), meta(dict), fetched_at}
+        실패 시 None
+        요청 실패/200이 아닌 응답(404/403/5xx 등)은 캐시하지 않음 - 다음 호출에서 재시도
+    """
+    if not url:
+        return None
+
+    key = normalize_url(url)
+
+    with _lock:
+        page = _memory_cache.get(key)
+        if page is not None:
+            run_metrics.record_cache('article_page', True)
+            return page
+        key_lock = _key_locks.setdefault(key, threading.Lock())
+
+    # 같은 URL 동시 요청은 한 스레드만 다운로드
+    with key_lock:
+        with _lock:
+            page = _memory_cache.get(key)
+        if page is not None:
+            run_metrics.record_cache('article_page', True)
+            return page
+
+        page = _load_from_disk(key)
+        run_metrics.record_cache('article_page', page is not None)
+        if page is None:
+            try:
+                page = _fetch(url, key, timeout)
+            except Exception:
+                return None
+            save_to_disk(page)
+
+        if page['status_code'] == 200:
+            with _lock:
+                _memory_cache[key] = page
+        return page
+
+
+def get_cached_page(url):
+    """이미 받은 페이지 (메모리/디스크 캐시) - 없으면 None (네트워크 요청 없음)"""
+    if not url:
+        return None
+
+    key = normalize_url(url)
+    with _lock:
+        page = _memory_cache.get(key)
+    if page is not None:
+        return page
+
+    page = _load_from_disk(key)
+    if page is not None:
+        with _lock:
+            _memory_cache.setdefault(key, page)
+    return page
+
+
+def probe_head(url, timeout=5, max_bytes=None):
+    """
+    페이지 앞부분만 스트리밍으로 받아 <head> 파싱 (발행일/og 태그 확인용)
+    </head>(또는 <body>)를 만나거나 max_bytes를 넘으면 연결을 끊음
+    (Range 헤더도 보내지만 무시하는 서버가 많아 스트리밍 중단이 기본)
+
+    Returns:
+        dict: html_parser.parse_head와 같은 형식 + 'bytes_received'
+        실패 시 None (실패는 캐시하지 않음)
+    """
+    if not url:
+        return None
+
+    key = normalize_url(url)
+    with _lock:
+        head = _head_cache.get(key)
+    run_metrics.record_cache('article_head', head is not None)
+    if head is not None:
+        return head
+
+    max_bytes = max_bytes or HEAD_PROBE_MAX_BYTES
+    received = 0
+    try:
+        response = http_client.get(
+            url, timeout=timeout, allow_redirects=True, stream=True,
+            headers={'Range': f'bytes=0-{max_bytes - 1}'}
+        )
+    except Exception:
+        return None
+
+    try:
+        if response.status_code not in (200, 206):
+            return None
+
+        content_type = response.headers.get('Content-Type', '')
+        parser = HeadParser()
+        decoder = None
+        for chunk in response.iter_content(chunk_size=HEAD_PROBE_CHUNK_SIZE):
+            received += len(chunk)
+            if decoder is None:
+                encoding = detect_encoding(chunk, content_type) or 'utf-8'
+                try:
+                    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+                except LookupError:
+                    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            parser.feed(decoder.decode(chunk))
+            if parser.done or received >= max_bytes:
+                break
+    except Exception:
+        return None
+    finally:
+        response.close()
+        run_metrics.add_http_bytes(urlsplit(url).netloc, received)
+
+    head = parser.result()
+    head['bytes_received'] = received
+    with _lock:
+        _head_cache[key] = head
+    return head
@@ -0,0 +1,127 @@
+"""
+기사 레코드 (__slots__)
+
+수집 단계에서 만들어져 점수 계산 -> 중복 제거 -> 요약 -> 발송까지 전달되는 기사 객체
+- 필드가 정해져 있어 기사 수가 많아져도 dict보다 메모리를 적게 사용
+- 속성 접근 (article.score) 가능
+- 기존 코드와 호환되도록 dict처럼 사용 가능 (article['title'], article.get('score', 0), 'ai_summary' in article)
+- 정해진 필드 외의 키는 extra dict에 저장
+- JSON 저장 형식은 기존과 동일 (설정된 필드만 저장, latest_news.json / draft_info.json 호환)
+
+사용:
+    article = Article(title='...', link='...', summary='...', source='...')
+    article['score'] = 120
+    json.dump(data, f, default=article_record.json_default)
+"""
+
+from collections.abc import MutableMapping
+
+
+# 파이프라인에서 기사에 붙는 필드 (JSON 저장 시 이 순서로 기록)
+FIELDS = (
+    # 수집
+    'title', 'link', 'summary', 'source', 'search_query', 'pub_date', 'time_text', 'is_recent',
+    # 발행일 검증
+    'actual_publish_date', 'days_old',
+    # 점수/분류
+    'score', 'category', 'matched_keywords', 'impact_score', 'impact_factors',
+    'freshness_penalty', 'combined_score',
+    # AI 에디터/요약
+    'ai_summary', 'ai_selected', 'short_summary', 'detailed_summary',
+    # Slack 발송용 (link 별칭)
+    'url',
+)
+
+_FIELD_SET = frozenset(FIELDS)
+
+
+class Article(MutableMapping):
+    """기사 하나 (설정되지 않은 필드는 dict에 키가 없는 것과 같음)"""
+
+    __slots__ = FIELDS + ('extra',)
+
+    def __init__(self, data=None, **fields):
+        self.extra = None
+        if data:
+            self.update(data)
+        if fields:
+            self.update(fields)
+
+    @classmethod
+    def from_dict(cls, data):
+        """dict(JSON에서 읽은 기사 등) -> Article (이미 Article이면 그대로 반환)"""
+        if isinstance(data, cls):
+            return data
+        return cls(data)
+
+    def to_dict(self):
+        """설정된 필드 + extra를 담은 일반 dict (JSON 저장용)"""
+        return dict(self.items())
+
+    def copy(self):
+        return Article(self)
+
+    # ------------------------------------------------------------------
+    # dict 호환
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, key):
+        if key in _FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in _FIELD_SET:
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __delitem__(self, key):
+        if key in _FIELD_SET:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self.extra is not None and key in self.extra:
+            del self.extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        if key in _FIELD_SET:
+            return hasattr(self, key)
+        return self.extra is not None and key in self.extra
+
+    def get(self, key, default=None):
+        if key in _FIELD_SET:
+            return getattr(self, key, default)
+        if self.extra is not None:
+            return self.extra.get(key, default)
+        return default
+
+    def __iter__(self):
+        for key in FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self):
+        return sum(1 for key in FIELDS if hasattr(self, key)) + len(self.extra or ())
+
+    def __repr__(self):
+        return f"Article({self.to_dict()!r})"
+
+
+def json_default(obj):
+    """json.dump(default=...)용 - Article을 일반 dict로 변환"""
+    if isinstance(obj, Article):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -0,0 +1,388 @@
+"""
+점수/중복 제거 단계 규모별 벤치마크 (합성 기사 100 ~ 100,000개)
+
+onda_news_scraper의 키워드 목록, 회사 별칭(MAIN_COMPANY_GROUPS), 주제 그룹으로
+실제와 비슷한 한국어 뉴스 묶음을 만들어 단계별 시간/처리량/최대 메모리와 규모에 따른 증가율 측정
+- 한 스토리를 여러 언론사가 조금씩 다른 제목으로 보도 (중복 제거 대상)
+- 일부 스토리는 지난 7일 히스토리에 이미 있음 (filter_already_scraped 대상)
+- 관련 없는 기사도 섞음
+
+측정 단계 (파이프라인 순서, 캐시는 단계 사이에 비우지 않음 - 실제 실행과 같음):
+    article_features (get_article_features - 이후 단계가 공유하는 제목/요약 특징, 실행 단위 캐시)
+    -> filter_already_scraped -> calculate_relevance_score -> calculate_industry_impact_score
+    -> remove_duplicates -> diversify_by_company
+모든 단계에 전체 기사를 넣음 (앞 단계에서 걸러진 만큼 줄이지 않음 - 규모별 증가율을 단계끼리 비교하기 위해)
+
+증가율: log(시간 비) / log(기사 수 비) - 1이면 선형, 2면 제곱
+
+실행:
+    python benchmarks/bench_scaling.py [--sizes 100,1000,10000,100000] [--repeat 3] [--output result.json]
+    python benchmarks/bench_scaling.py --sizes 100,1000 --compare baseline.json [--tolerance 0.25]
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import onda_news_scraper as scraper  # noqa: E402
+import title_normalizer  # noqa: E402
+from article_record import Article  # noqa: E402
+
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000]
+STAGES = ['article_features', 'filter_already_scraped', 'relevance', 'impact', 'remove_duplicates', 'diversify_by_company']
+
+# 회귀 판단: 기준보다 tolerance 이상 느리고, 차이가 MIN_DELTA_SECONDS 이상일 때 (작은 측정값의 잡음 제외)
+MIN_DELTA_SECONDS = 0.005
+MIN_DELTA_KB = 256
+
+# 이보다 큰 규모는 1회만 측정 (100,000개는 1회에 수 분)
+REPEAT_MAX_SIZE = 10000
+
+
+# ============================================
+# 합성 기사
+# ============================================
+
+SOURCES = ['연합뉴스', '한국경제', '매일경제', '조선비즈', '머니투데이', '뉴시스', '이데일리', '헤럴드경제',
+           '서울경제', '아시아경제', '파이낸셜뉴스', '전자신문', '디지털타임스', '여행신문', '트래비']
+
+# 이벤트별 표현 (같은 스토리라도 매체마다 다른 표현 사용)
+EVENTS = {
+    'investment': ['투자 유치', '펀딩 성공', '시리즈B 투자', '전략적 투자'],
+    'ma': ['인수 추진', '합병 완료', '지분 인수', '매각 협상'],
+    'earnings': ['매출 증가', '영업이익 흑자전환', '거래액 성장', '실적 개선'],
+    'launch': ['신규 서비스 출시', '플랫폼 런칭', '베타 오픈', '서비스 개편'],
+    'regulation': ['규제 강화', '법안 개정', '과태료 부과', '단속 확대'],
+    'market': ['이용자 급증', '점유율 확대', '예약 증가', '객실점유율 상승'],
+}
+
+# 스토리 고유 단어 (지역 x 분야 합성어 + 키워드 목록)
+REGIONS = ['서울', '부산', '제주', '강릉', '경주', '여수', '전주', '인천', '대구', '속초', '광주', '대전', '울산',
+           '수원', '춘천', '통영', '거제', '포항', '목포', '안동', '평창', '양양', '남해', '태안', '가평',
+           '도쿄', '오사카', '방콕', '다낭', '싱가포르', '파리', '뉴욕', '하와이', '괌', '발리']
+DOMAINS = ['관광', '숙박', '호텔', '리조트', '펜션', '여행', '축제', '공항', '노선', '항만', '캠핑', '골프',
+           '온천', '면세', '카지노', '크루즈', '테마파크', '마이스', '한옥', '스테이']
+TITLE_FORMATS = [
+    '{company}, {w1} {w2} {event}…{w3} {w4}',
+    '[단독] {company} {w1} {event}, {w2}·{w3} 확대',
+    '{w1} {w2} {event} 나선 {company}…"{w3} 공략"',
+    '{company} {event} {amount}…{w1} {w2} {w3}',
+    '{w1}·{w2} {event}, {company} {w3} {w4} 본격화',
+]
+NOISE_TITLES = ['{region} 가을 {w1} 개막…관람객 {count}명 몰려', '{region} 아파트 분양가 {percent} 상승',
+                '프로야구 {region} 연고팀 {count}연승', '{region} 교통 체증 심화…출퇴근 {count}분 늘어',
+                '반도체 수출 {percent} 증가…{region} 산업단지 활기']
+TITLE_SUFFIXES = ['', '', '', ' (종합)', ' [포토]', '…업계 주목']
+
+
+def _vocabulary():
+    compounds = [region + domain for region in REGIONS for domain in DOMAINS]
+    keywords = (scraper.OTA_KEYWORDS + scraper.ACCOMMODATION_KEYWORDS + scraper.POLICY_KEYWORDS
+                + scraper.TRAVELTECH_KEYWORDS + scraper.INVESTMENT_KEYWORDS + scraper.REGULATION_KEYWORDS
+                + scraper.NEWTECH_KEYWORDS + scraper.MARKET_DATA_KEYWORDS + scraper.TITLE_COMPANY_KEYWORDS)
+    topic_words = [keyword for _, group in scraper.ARTICLE_TOPIC_GROUPS for keyword in group]
+    return compounds + keywords, keywords + topic_words
+
+
+def _story(rnd, words):
+    # 회사는 MAIN_COMPANY_GROUPS 별칭 중 하나로 표기 (매체마다 다른 별칭)
+    _, aliases = rnd.choice(scraper.MAIN_COMPANY_GROUPS)
+    return {
+        'aliases': aliases,
+        'event': rnd.choice(list(EVENTS)),
+        'words': rnd.sample(words, 5),
+        'amount': f"{rnd.choice([50, 120, 300, 500, 800, 1200])}{rnd.choice(['억', '억원', '조'])}",
+    }
+
+
+def _story_title(rnd, story):
+    # 매체마다 형식/단어 순서/표현이 조금씩 다름
+    words = story['words'][:]
+    rnd.shuffle(words)
+    title = rnd.choice(TITLE_FORMATS).format(
+        company=rnd.choice(story['aliases']), event=rnd.choice(EVENTS[story['event']]),
+        amount=story['amount'], w1=words[0], w2=words[1], w3=words[2], w4=words[3])
+    return title + rnd.choice(TITLE_SUFFIXES)
+
+
+def _summary(rnd, title, summary_words):
+    words = rnd.sample(summary_words, rnd.randint(2, 6))
+    return f"{title.split('…')[0]} 관련 소식이다. " + ' '.join(words) + ' 등 업계 전반에 영향이 예상된다.'
+
+
+def make_corpus(count, seed):
+    """
+    합성 기사 count개와 히스토리
+
+    Returns:
+        tuple: (기사 목록, 히스토리 dict - filter_already_scraped 입력 형식)
+    """
+    rnd = random.Random(seed)
+    words, summary_words = _vocabulary()
+
+    articles = []
+    history_articles = []
+    while len(articles) < count:
+        if rnd.random() < 0.15:
+            title = rnd.choice(NOISE_TITLES).format(region=rnd.choice(REGIONS), w1=rnd.choice(DOMAINS),
+                                                    count=rnd.randint(2, 900), percent=f"{rnd.randint(1, 40)}%")
+            articles.append(_article(len(articles), title, _summary(rnd, title, REGIONS), rnd))
+            continue
+
+        story = _story(rnd, words)
+        # 스토리당 1~6개 매체 보도 (소수 스토리에 보도가 몰리는 분포)
+        for _ in range(min(int(rnd.paretovariate(1.6)), 6, count - len(articles))):
+            title = _story_title(rnd, story)
+            articles.append(_article(len(articles), title, _summary(rnd, title, summary_words), rnd))
+        # 스토리 10개 중 1개는 이미 스크랩됨
+        if rnd.random() < 0.1:
+            history_articles.append({
+                'title': _story_title(rnd, story),
+                'link': f"https://news.example.com/history/{len(history_articles)}",
+            })
+
+    return articles, {'articles': history_articles, 'last_updated': None, 'store': None}
+
+
+def _article(index, title, summary, rnd):
+    source = rnd.choice(SOURCES)
+    return Article({
+        'title': title,
+        'link': f"https://news.example.com/{source}/{index}",
+        'summary': summary,
+        'source': source,
+    })
+
+
+# ============================================
+# 측정
+# ============================================
+
+def clear_caches():
+    for name in ('title_words', 'key_pattern_hits', 'extract_core_keywords',
+                 'find_core_entities', 'find_title_company', 'topic_from_text'):
+        getattr(title_normalizer, name).cache_clear()
+    scraper.ARTICLE_FEATURES.cache_clear()
+    scraper.SCORING_MATCHER._cached_match.cache_clear()
+
+
+def _features(articles):
+    for article in articles:
+        scraper.get_article_features(article)
+    return articles
+
+
+def _score(articles):
+    for article in articles:
+        article['score'] = scraper.calculate_relevance_score(article)
+    return articles
+
+
+def _impact(articles):
+    for article in articles:
+        scraper.calculate_industry_impact_score(article)
+    return articles
+
+
+def _diversify(articles):
+    for article in articles:
+        article['combined_score'] = article.get('score', 0) + article.get('impact_score', 0) * 1.5
+    articles = sorted(articles, key=lambda x: x.get('combined_score', 0), reverse=True)
+    return scraper.diversify_by_company(articles, max_per_company=1, silent=True)
+
+
+def run_pipeline(articles, history, trace_memory):
+    """
+    단계 순서대로 실행 (점수 단계는 기사에 점수를 기록, 나머지 단계의 결과 목록은 버림)
+
+    Returns:
+        dict: 단계 -> {'seconds', 'items_in', 'items_out', 'peak_kb'(trace_memory일 때)}
+    """
+    steps = [
+        ('article_features', _features),
+        ('filter_already_scraped', lambda items: scraper.filter_already_scraped(items, history, silent=True)),
+        ('relevance', _score),
+        ('impact', _impact),
+        ('remove_duplicates', lambda items: scraper.remove_duplicates(items, threshold=0.35)),
+        ('diversify_by_company', _diversify),
+    ]
+    clear_caches()
+    results = {}
+    for name, step in steps:
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        output = step(articles)
+        seconds = time.perf_counter() - start
+        entry = {'seconds': seconds, 'items_in': len(articles), 'items_out': len(output)}
+        if trace_memory:
+            entry['peak_kb'] = tracemalloc.get_traced_memory()[1] // 1024
+            tracemalloc.stop()
+        results[name] = entry
+    return results
+
+
+def measure(size, seed, repeat):
+    """
+    기사 size개 측정 - 시간은 repeat회 중 최소값, 메모리는 별도 1회 (tracemalloc이 시간을 늘리므로)
+
+    Returns:
+        tuple: (단계 -> 결과 dict, 히스토리 기사 수)
+    """
+    articles, history = make_corpus(size, seed)
+    timings = [run_pipeline([article.copy() for article in articles], history, False) for _ in range(repeat)]
+    memory = run_pipeline([article.copy() for article in articles], history, True)
+
+    results = {}
+    for name in STAGES:
+        seconds = min(run[name]['seconds'] for run in timings)
+        results[name] = {
+            'seconds': round(seconds, 6),
+            'items_in': timings[0][name]['items_in'],
+            'items_out': timings[0][name]['items_out'],
+            'throughput': round(timings[0][name]['items_in'] / seconds, 1) if seconds else None,
+            'peak_kb': memory[name]['peak_kb'],
+        }
+    return results, len(history['articles'])
+
+
+def scaling(results, sizes):
+    """단계별 증가율 - 인접한 규모 사이 지수와 전체 log-log 기울기"""
+    curves = {}
+    for name in STAGES:
+        points = [(size, results[str(size)][name]['seconds']) for size in sizes
+                  if results[str(size)][name]['seconds'] > 0]
+        steps = []
+        for (n1, t1), (n2, t2) in zip(points, points[1:]):
+            steps.append({'from': n1, 'to': n2, 'exponent': round(math.log(t2 / t1) / math.log(n2 / n1), 2)})
+        curves[name] = {'steps': steps, 'exponent': _loglog_slope(points)}
+    return curves
+
+
+def _loglog_slope(points):
+    if len(points) < 2:
+        return None
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(t) for _, t in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return round(sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance, 2)
+
+
+# ============================================
+# 기준 비교
+# ============================================
+
+def compare(current, baseline, tolerance):
+    """
+    기준 결과와 비교 (두 결과에 모두 있는 규모/단계만)
+
+    Returns:
+        list: 회귀 목록 [{'size', 'stage', 'metric', 'baseline', 'current', 'ratio'}]
+    """
+    regressions = []
+    for size, stages in current['results'].items():
+        base_stages = baseline.get('results', {}).get(size)
+        if not base_stages:
+            continue
+        for name in STAGES:
+            if name not in stages or name not in base_stages:
+                continue
+            for metric, min_delta in (('seconds', MIN_DELTA_SECONDS), ('peak_kb', MIN_DELTA_KB)):
+                base_value = base_stages[name].get(metric)
+                value = stages[name].get(metric)
+                if not base_value or value is None:
+                    continue
+                if value > base_value * (1 + tolerance) and value - base_value >= min_delta:
+                    regressions.append({'size': int(size), 'stage': name, 'metric': metric,
+                                        'baseline': base_value, 'current': value,
+                                        'ratio': round(value / base_value, 2)})
+    return regressions
+
+
+def print_report(data):
+    sizes = data['sizes']
+    print(f"{'단계':<24}" + ''.join(f"{f'{size:,}개':>14}" for size in sizes) + f"{'증가율':>8}")
+    for name in STAGES:
+        cells = ''.join(f"{data['results'][str(size)][name]['seconds']:>13.4f}s" for size in sizes)
+        exponent = data['scaling'][name]['exponent']
+        print(f"{name:<24}{cells}{'' if exponent is None else f'{exponent:>8.2f}'}")
+    print(f"\n{'처리량(기사/초)':<24}" + ''.join(f"{f'{size:,}개':>14}" for size in sizes))
+    for name in STAGES:
+        print(f"{name:<24}" + ''.join(f"{data['results'][str(size)][name]['throughput'] or 0:>14,.0f}"
+                                      for size in sizes))
+    print(f"\n{'최대 메모리(KB)':<24}" + ''.join(f"{f'{size:,}개':>14}" for size in sizes))
+    for name in STAGES:
+        print(f"{name:<24}" + ''.join(f"{data['results'][str(size)][name]['peak_kb']:>14,}" for size in sizes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='점수/중복 제거 단계 규모별 벤치마크')
+    parser.add_argument('--sizes', default=','.join(str(size) for size in DEFAULT_SIZES),
+                        help='기사 수 목록 (쉼표 구분)')
+    parser.add_argument('--repeat', type=int, default=3, help=f'규모별 반복 횟수 (최소 시간 사용, {REPEAT_MAX_SIZE:,}개 초과는 1회)')
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--output', help='결과 JSON 파일')
+    parser.add_argument('--compare', help='기준 결과 JSON (회귀 있으면 종료 코드 1)')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='회귀 판단 허용 비율 (기본 0.25 = 25%%)')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    results = {}
+    history_sizes = {}
+    for size in sizes:
+        start = time.perf_counter()
+        repeat = args.repeat if size <= REPEAT_MAX_SIZE else 1
+        results[str(size)], history_sizes[str(size)] = measure(size, args.seed, repeat)
+        print(f"기사 {size:,}개 측정 완료 ({time.perf_counter() - start:.1f}초)", file=sys.stderr)
+
+    data = {
+        'meta': {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': args.seed,
+            'repeat': args.repeat,
+        },
+        'sizes': sizes,
+        'history_sizes': history_sizes,
+        'results': results,
+        'scaling': scaling(results, sizes),
+    }
+    print_report(data)
+
+    exit_code = 0
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('meta', {}).get('seed') != args.seed:
+            print("\n주의: 기준 결과와 seed가 달라 입력 기사가 다릅니다.")
+        regressions = compare(data, baseline, args.tolerance)
+        data['regressions'] = regressions
+        print(f"\n기준 비교 ({args.compare}, 허용 {args.tolerance:.0%})")
+        for item in regressions:
+            print(f"  회귀: {item['stage']} {item['size']:,}개 {item['metric']} "
+                  f"{item['baseline']} -> {item['current']} ({item['ratio']}x)")
+        if not regressions:
+            print("  회귀 없음")
+        exit_code = 1 if regressions else 0
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
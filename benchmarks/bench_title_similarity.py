@@ -0,0 +1,221 @@
+"""
+제목 유사도/같은 스토리/핵심 키워드 비교 - 기사 쌍당 비용 벤치마크
+
+이전 방식 (매 비교마다 정규식/불용어/엔티티 목록 생성 + 토큰화)과
+현재 방식 (title_normalizer 사전 컴파일 + 제목별 토큰 캐시)의 쌍당 비용 비교
+두 방식의 판단 결과가 같은지도 함께 확인
+
+실행:
+    python benchmarks/bench_title_similarity.py [--articles 300] [--seed 7]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import onda_news_scraper as scraper  # noqa: E402
+import title_normalizer  # noqa: E402
+
+
+# ============================================
+# 이전 방식 (기사 쌍마다 모든 것을 다시 계산)
+# ============================================
+
+def legacy_similarity(title1, title2):
+    def clean_and_split(text):
+        text = re.sub(r'[^\w\s]', '', text.lower())
+        return set(text.split())
+
+    words1 = clean_and_split(title1)
+    words2 = clean_and_split(title2)
+    if not words1 or not words2:
+        return 0
+
+    jaccard = len(words1 & words2) / len(words1 | words2)
+
+    key_patterns = [
+        r'야놀자', r'여기어때', r'에어비앤비', r'아고다', r'부킹', r'트립닷컴',
+        r'마이리얼트립', r'nol', r'\d+억', r'\d+조', r'\d+%'
+    ]
+    title1_lower = title1.lower()
+    title2_lower = title2.lower()
+    shared_keys = 0
+    for pattern in key_patterns:
+        if re.search(pattern, title1_lower) and re.search(pattern, title2_lower):
+            shared_keys += 1
+    if shared_keys >= 2:
+        jaccard = max(jaccard, 0.6)
+    return jaccard
+
+
+def legacy_topic(article):
+    text = (article['title'] + ' ' + article.get('summary', '')).lower()
+    company_patterns = ['야놀자', '여기어때', '에어비앤비', '아고다', '부킹닷컴',
+                        '트립닷컴', '마이리얼트립', 'nol', '놀', '온다', 'onda']
+    companies = [company for company in company_patterns if company in text]
+    amounts = re.findall(r'\d+억|\d+조|\d+만', text)
+    event_type = None
+    if any(kw in text for kw in ['투자', '펀딩', '시리즈']):
+        event_type = 'investment'
+    elif any(kw in text for kw in ['인수', '합병', 'm&a']):
+        event_type = 'ma'
+    elif any(kw in text for kw in ['출시', '런칭', '오픈']):
+        event_type = 'launch'
+    elif any(kw in text for kw in ['실적', '매출', '영업이익']):
+        event_type = 'earnings'
+    return {'companies': companies, 'amounts': amounts, 'event_type': event_type}
+
+
+def legacy_same_story(article1, article2):
+    topic1 = legacy_topic(article1)
+    topic2 = legacy_topic(article2)
+
+    shared_companies = set(topic1['companies']) & set(topic2['companies'])
+    if shared_companies and topic1['event_type'] == topic2['event_type'] and topic1['event_type'] is not None:
+        return True
+    if shared_companies and set(topic1['amounts']) & set(topic2['amounts']):
+        return True
+
+    title1 = article1['title'].lower()
+    title2 = article2['title'].lower()
+    companies_in_title = ['야놀자', '여기어때', '에어비앤비', '아고다', '부킹닷컴',
+                          '트립닷컴', '마이리얼트립', 'nol', '놀유니버스', '온다']
+    title1_company = None
+    title2_company = None
+    for company in companies_in_title:
+        if company in title1 and title1_company is None:
+            title1_company = company
+        if company in title2 and title2_company is None:
+            title2_company = company
+
+    if title1_company and title1_company == title2_company:
+        words1 = set(re.sub(r'[^\w\s]', '', title1).split())
+        words2 = set(re.sub(r'[^\w\s]', '', title2).split())
+        stopwords = {'의', '를', '을', '이', '가', '은', '는', '에', '에서', '와', '과', '로', '으로', '도', '만', '더', '등'}
+        if len((words1 & words2) - stopwords) >= 3:
+            return True
+    return False
+
+
+def legacy_same_core_keywords(title1, title2):
+    stopwords = {
+        '의', '를', '을', '이', '가', '은', '는', '에', '에서', '와', '과',
+        '로', '으로', '도', '만', '더', '등', '및', '또', '그', '저', '이런',
+        '것', '수', '중', '후', '전', '약', '각', '매', '내', '외', '상', '하',
+        '대', '소', '신', '구', '위', '아래', '앞', '뒤', '간', '별', '당',
+        '말', '년', '월', '일', '시', '분', '초', '명', '개', '곳', '번',
+        '절반', '이상', '최대', '최소', '약', '경험', '집중', '새해', '올해'
+    }
+    important_entities = [
+        '야놀자', '야놀자리서치', '여기어때', '에어비앤비', '부킹닷컴', '익스피디아',
+        '트립닷컴', '아고다', '호텔스닷컴', '마이리얼트립', '온다', 'onda',
+        '네이버', '카카오', '쏘카', '인터파크'
+    ]
+
+    def extract_keywords(title):
+        title_clean = re.sub(r'\d+\.?\d*%?', '', title)
+        title_clean = re.sub(r'[^\w\s가-힣]', ' ', title_clean)
+        return set(w for w in title_clean.lower().split() if len(w) >= 2 and w not in stopwords)
+
+    def find_entities(title):
+        title_lower = title.lower()
+        return set(entity.lower() for entity in important_entities if entity.lower() in title_lower)
+
+    kw1 = extract_keywords(title1)
+    kw2 = extract_keywords(title2)
+    common_entities = find_entities(title1) & find_entities(title2)
+    if not kw1 or not kw2:
+        return False
+    common = kw1 & kw2
+    smaller_set = min(len(kw1), len(kw2))
+    if common_entities and len(common) >= 2:
+        return True
+    if smaller_set > 0 and len(common) / smaller_set >= 0.5:
+        return True
+    return len(common) >= 3
+
+
+def legacy_pair(article1, article2):
+    return (legacy_similarity(article1['title'], article2['title']),
+            legacy_same_story(article1, article2),
+            legacy_same_core_keywords(article1['title'], article2['title']))
+
+
+# ============================================
+# 현재 방식
+# ============================================
+
+def current_pair(article1, article2):
+    return (scraper.calculate_similarity(article1['title'], article2['title']),
+            scraper.is_same_story(article1, article2),
+            scraper.has_same_core_keywords(article1['title'], article2['title']))
+
+
+def clear_caches():
+    for name in ('title_words', 'key_pattern_hits', 'extract_core_keywords',
+                 'find_core_entities', 'find_title_company', 'topic_from_text'):
+        getattr(title_normalizer, name).cache_clear()
+    scraper.ARTICLE_FEATURES.cache_clear()
+    scraper.SCORING_MATCHER._cached_match.cache_clear()
+
+
+# ============================================
+# 합성 기사
+# ============================================
+
+def make_articles(count, seed):
+    rnd = random.Random(seed)
+    vocabulary = (scraper.OTA_KEYWORDS + scraper.ACCOMMODATION_KEYWORDS + scraper.POLICY_KEYWORDS
+                  + scraper.INVESTMENT_KEYWORDS + scraper.MARKET_DATA_KEYWORDS
+                  + ['500억', '3조', '35%', '놀유니버스', '출시', '실적', '인수', '발표', '확대', '증가', '전망'])
+    articles = []
+    for _ in range(count):
+        title = ' '.join(rnd.choice(vocabulary) for _ in range(rnd.randint(4, 9)))
+        summary = ' '.join(rnd.choice(vocabulary) for _ in range(rnd.randint(0, 12)))
+        articles.append({'title': title, 'summary': summary})
+    return articles
+
+
+def run(pair_func, articles):
+    results = []
+    start = time.perf_counter()
+    for i, article1 in enumerate(articles):
+        for article2 in articles[:i]:
+            results.append(pair_func(article1, article2))
+    return results, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='기사 쌍 비교 비용 벤치마크')
+    parser.add_argument('--articles', type=int, default=300, help='기사 수 (쌍 수 = n(n-1)/2)')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    articles = make_articles(args.articles, args.seed)
+    pairs = args.articles * (args.articles - 1) // 2
+
+    legacy_results, legacy_time = run(legacy_pair, articles)
+    clear_caches()
+    cold_results, cold_time = run(current_pair, articles)
+    warm_results, warm_time = run(current_pair, articles)
+
+    print(f"기사 {args.articles}개, 비교 {pairs:,}쌍")
+    print(f"{'방식':<28}{'전체(s)':>10}{'쌍당(us)':>12}")
+    for label, elapsed in (('이전 (매번 토큰화)', legacy_time),
+                           ('현재 (캐시 비어 있음)', cold_time),
+                           ('현재 (캐시 채워짐)', warm_time)):
+        print(f"{label:<28}{elapsed:>10.3f}{elapsed / pairs * 1e6:>12.2f}")
+    print(f"속도 향상: {legacy_time / cold_time:.1f}x (캐시 비어 있음), {legacy_time / warm_time:.1f}x (캐시 채워짐)")
+
+    same = legacy_results == cold_results == warm_results
+    print(f"판단 결과 일치: {'예' if same else '아니오'}")
+    return 0 if same else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,220 @@
+"""
+녹화된 응답으로 전체 파이프라인 재생 - 종단 간 벤치마크
+
+record: 실제 onda_news_scraper 실행의 HTTP/LLM 응답을 카세트 폴더에 녹화
+replay: 네트워크 없이 같은 입력으로 파이프라인 실행 (수집 -> 필터 -> 점수 -> 중복 제거 -> 요약 -> 저장)
+        + TOP 20 HTML 페이지 렌더링, 호스트별 지연 주입
+
+재생 시
+- 시계를 녹화 시각으로 고정 (발행일/신선도 판단이 녹화 때와 같도록)
+- 목록 캐시(listing_cache)/히스토리는 사용하지 않음 (실행마다 같은 입력)
+- 임시 폴더에서 실행 (latest_news.json 등 결과 파일이 작업 폴더를 덮어쓰지 않음)
+
+실행:
+    python benchmarks/replay_pipeline.py record cassettes/today -- --force
+    python benchmarks/replay_pipeline.py replay cassettes/today [--latency recorded] [--runs 3] [--output result.json]
+
+    --latency: recorded (녹화 당시 응답 시간) / 0 (기본, 지연 없음) / 0.2 /
+               default=0.05,www.google.com=0.5,llm=1.0 (호스트별, llm은 모델 호출)
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 목록 캐시는 녹화/재생 모두 끔 (캐시에서 나온 목록은 녹화되지 않음)
+os.environ['ONDA_LISTING_CACHE_DISABLED'] = '1'
+
+import http_replay  # noqa: E402
+
+
+def frozen_datetime(recorded_at):
+    """now()가 녹화 시각부터 흐르는 datetime (재생 실행 시작 = 녹화 시각)"""
+    started = time.monotonic()
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            current = datetime.fromtimestamp(recorded_at.timestamp() + time.monotonic() - started)
+            if tz is not None:
+                current = current.astimezone(tz)
+            return cls(*current.timetuple()[:6], current.microsecond, tzinfo=current.tzinfo)
+
+    return FrozenDatetime
+
+
+def run_main(argv):
+    """onda_news_scraper.main()을 명령행 인자로 실행"""
+    import onda_news_scraper
+
+    saved = sys.argv
+    sys.argv = ['onda_news_scraper.py'] + argv
+    try:
+        onda_news_scraper.main()
+    finally:
+        sys.argv = saved
+
+
+# ============================================
+# 녹화
+# ============================================
+
+def record(args):
+    cassette_dir = os.path.abspath(args.cassette)
+    http_replay.configure('record', cassette_dir)
+
+    start = time.perf_counter()
+    run_main(args.onda_args)
+    elapsed = time.perf_counter() - start
+
+    http_count = len(os.listdir(os.path.join(cassette_dir, 'http')))
+    llm_count = len(os.listdir(os.path.join(cassette_dir, 'llm')))
+    print(f"\n녹화 완료: {cassette_dir} (HTTP {http_count}개, LLM {llm_count}개, {elapsed:.1f}초)")
+    return 0
+
+
+# ============================================
+# 재생
+# ============================================
+
+def replay_once(cassette_dir, latency, recorded_at, verbose):
+    import article_cache
+    import history_store
+    import onda_news_scraper
+    import run_metrics
+    import slack_sender
+
+    # 실행마다 같은 상태에서 시작 (카세트 사용 순서, 세션, 기사/특징 캐시)
+    http_replay.configure('replay', cassette_dir, latency)
+    onda_news_scraper.ARTICLE_FEATURES.cache_clear()
+    onda_news_scraper.SCORING_MATCHER._cached_match.cache_clear()
+    article_cache.clear_memory_cache()
+
+    clock = frozen_datetime(recorded_at) if recorded_at else datetime
+    modules = (onda_news_scraper, history_store, slack_sender)
+    saved = [module.datetime for module in modules]
+    for module in modules:
+        module.datetime = clock
+
+    work_dir = tempfile.mkdtemp(prefix='onda_replay_')
+    saved_cwd = os.getcwd()
+    os.chdir(work_dir)
+    try:
+        output = io.StringIO()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(sys.stdout if verbose else output):
+            run_main(['--force', '--no-history', '--silent'])
+        pipeline_seconds = time.perf_counter() - start
+        metrics = run_metrics.snapshot()
+
+        # 렌더링 (Slack 링크용 TOP 20 HTML 페이지)
+        with open('latest_news.json', 'r', encoding='utf-8') as f:
+            latest = json.load(f)
+        articles = latest['top_3'] + latest['top_20']
+        start = time.perf_counter()
+        slack_sender.generate_news_html_page(articles, output_dir=work_dir, filename='news.html')
+        render_seconds = time.perf_counter() - start
+    finally:
+        os.chdir(saved_cwd)
+        shutil.rmtree(work_dir, ignore_errors=True)
+        for module, original in zip(modules, saved):
+            module.datetime = original
+
+    return {
+        'pipeline_seconds': round(pipeline_seconds, 4),
+        'render_seconds': round(render_seconds, 4),
+        'stages': {entry['name']: entry['seconds'] for entry in metrics['stages']},
+        'http_calls': metrics['totals']['http_calls'],
+        'http_errors': sum(entry['errors'] for entry in metrics['http'].values()),
+        'llm_calls': sum(entry['calls'] for entry in metrics['llm'].values()),
+        'articles': len(articles),
+        'top_links': [article['link'] for article in articles],
+    }
+
+
+def replay(args):
+    cassette_dir = os.path.abspath(args.cassette)
+    if not os.path.isdir(os.path.join(cassette_dir, 'http')):
+        print(f"카세트 폴더가 아닙니다: {cassette_dir}")
+        return 1
+
+    http_replay.configure('replay', cassette_dir, args.latency)
+    meta = http_replay.read_meta()
+    # 녹화 때와 같은 LLM 분기를 타도록 키 자리만 채움 (실제 호출은 카세트에서 응답)
+    for name in meta['llm_keys']:
+        os.environ.setdefault(name, 'replay')
+
+    runs = [replay_once(cassette_dir, args.latency, meta['recorded_at'], args.verbose) for _ in range(args.runs)]
+
+    # 입력이 같으면 결과도 같아야 함
+    deterministic = all(run['top_links'] == runs[0]['top_links'] for run in runs)
+    stage_names = list(runs[0]['stages'])
+    result = {
+        'cassette': cassette_dir,
+        'recorded_at': meta['recorded_at'].isoformat() if meta['recorded_at'] else None,
+        'latency': args.latency,
+        'runs': args.runs,
+        'deterministic': deterministic,
+        'pipeline_seconds': _summary([run['pipeline_seconds'] for run in runs]),
+        'render_seconds': _summary([run['render_seconds'] for run in runs]),
+        'stages': {name: _summary([run['stages'].get(name, 0) for run in runs]) for name in stage_names},
+        'http_calls': runs[0]['http_calls'],
+        'http_errors': runs[0]['http_errors'],
+        'llm_calls': runs[0]['llm_calls'],
+        'articles': runs[0]['articles'],
+    }
+
+    print(f"재생 {args.runs}회 (지연: {args.latency}) - 기사 {result['articles']}개, "
+          f"HTTP {result['http_calls']}회 (녹화 없음 {result['http_errors']}), LLM {result['llm_calls']}회")
+    print(f"{'단계':<22}{'중앙값(s)':>11}{'최소(s)':>10}{'최대(s)':>10}")
+    rows = list(result['stages'].items()) + [('(렌더링)', result['render_seconds']),
+                                             ('(전체)', result['pipeline_seconds'])]
+    for name, entry in rows:
+        print(f"{name:<22}{entry['median']:>11.3f}{entry['min']:>10.3f}{entry['max']:>10.3f}")
+    print(f"실행 간 결과 일치: {'예' if deterministic else '아니오'}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    return 0 if deterministic else 1
+
+
+def _summary(values):
+    return {'median': round(statistics.median(values), 4), 'min': round(min(values), 4), 'max': round(max(values), 4)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='녹화된 응답으로 파이프라인 재생 벤치마크')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = commands.add_parser('record', help='실제 실행을 녹화 (-- 뒤는 onda_news_scraper 인자)')
+    record_parser.add_argument('cassette', help='카세트 폴더')
+    record_parser.add_argument('onda_args', nargs=argparse.REMAINDER)
+
+    replay_parser = commands.add_parser('replay', help='녹화된 응답으로 재생')
+    replay_parser.add_argument('cassette', help='카세트 폴더')
+    replay_parser.add_argument('--latency', default='0', help='주입 지연 (recorded / 초 / 호스트=초,...)')
+    replay_parser.add_argument('--runs', type=int, default=3)
+    replay_parser.add_argument('--output', help='결과 JSON 파일')
+    replay_parser.add_argument('--verbose', action='store_true', help='파이프라인 출력 표시')
+
+    args = parser.parse_args()
+    if args.command == 'record':
+        if args.onda_args[:1] == ['--']:
+            args.onda_args = args.onda_args[1:]
+        return record(args)
+    return replay(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
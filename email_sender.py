@@ -3,11 +3,28 @@
 뉴스 수집 결과를 이메일로 전송
 """
 
+import os
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timezone, timedelta
 
+# SMTP 서버 변경 (로컬 모의 서버 등 - benchmarks/mock_services.py)
+# ONDA_SMTP_HOST가 있으면 Gmail/Outlook 대신 이 서버로 전송
+# ONDA_SMTP_STARTTLS=0이면 TLS와 로그인 생략 - ONDA_SMTP_HOST를 지정했을 때만 적용
+# (실제 Gmail/Outlook 서버에 계정 정보가 평문으로 전송되지 않도록)
+SMTP_HOST_OVERRIDE = os.environ.get('ONDA_SMTP_HOST')
+SMTP_PORT_OVERRIDE = int(os.environ.get('ONDA_SMTP_PORT', '587'))
+SMTP_STARTTLS = not (SMTP_HOST_OVERRIDE and os.environ.get('ONDA_SMTP_STARTTLS', '1') == '0')
+
+
+def _smtp_server(default_host, default_port):
+    """(서버, 포트) - ONDA_SMTP_HOST가 있으면 그 서버"""
+    if SMTP_HOST_OVERRIDE:
+        return SMTP_HOST_OVERRIDE, SMTP_PORT_OVERRIDE
+    return default_host, default_port
+
+
 def create_html_email(articles):
     """
     뉴스 기사들을 HTML 이메일 형식으로 변환
@@ -145,8 +162,7 @@ def send_email_gmail(to_email, subject, html_content):
         return False
 
     # Gmail 설정
-    smtp_server = "smtp.gmail.com"
-    smtp_port = 587
+    smtp_server, smtp_port = _smtp_server("smtp.gmail.com", 587)
     sender_email = GMAIL_EMAIL
     sender_password = GMAIL_PASSWORD
 
@@ -163,8 +179,9 @@ def send_email_gmail(to_email, subject, html_content):
     try:
         # SMTP 서버 연결 및 전송
         with smtplib.SMTP(smtp_server, smtp_port) as server:
-            server.starttls()  # TLS 암호화
-            server.login(sender_email, sender_password)
+            if SMTP_STARTTLS:
+                server.starttls()  # TLS 암호화
+                server.login(sender_email, sender_password)  # TLS 없이는 로그인하지 않음
             server.send_message(message)
 
         print(f"[SUCCESS] 이메일 전송 성공: {to_email}")
@@ -494,8 +511,7 @@ def send_email_outlook(to_email, subject, html_content):
         print("email_config.py 파일에 Outlook 계정 정보를 입력해주세요.")
         return False
 
-    smtp_server = "smtp.office365.com"
-    smtp_port = 587
+    smtp_server, smtp_port = _smtp_server("smtp.office365.com", 587)
     sender_email = OUTLOOK_EMAIL
     sender_password = OUTLOOK_PASSWORD
 
@@ -509,8 +525,9 @@ def send_email_outlook(to_email, subject, html_content):
 
     try:
         with smtplib.SMTP(smtp_server, smtp_port) as server:
-            server.starttls()
-            server.login(sender_email, sender_password)
+            if SMTP_STARTTLS:
+                server.starttls()
+                server.login(sender_email, sender_password)
             server.send_message(message)
 
         print(f"[SUCCESS] 이메일 전송 성공: {to_email}")
@@ -0,0 +1,153 @@
+"""
+스크랩 히스토리 저장소 (SQLite)
+
+scrape_history.json 전체를 매번 읽고/쓰던 방식을 대체
+- 정규화된 링크 인덱스: 링크 중복 확인 O(1)
+- 만료: scraped_at 기준 7일(7 x 24시간) - scraped_day 인덱스 범위 삭제 한 번으로 정리
+- 추가는 새 항목만 INSERT (전체 재작성 없음)
+- 기존 scrape_history.json이 있으면 최초 1회 자동 이전 (.migrated로 이름 변경)
+"""
+
+import json
+import os
+import sqlite3
+from datetime import datetime, timedelta
+
+from article_cache import normalize_url
+
+
+DB_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scrape_history.sqlite3')
+LEGACY_JSON_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scrape_history.json')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    link TEXT NOT NULL,
+    link_norm TEXT NOT NULL,
+    title TEXT NOT NULL,
+    scraped_at TEXT NOT NULL,
+    scraped_day TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_history_link_norm ON history(link_norm);
+CREATE INDEX IF NOT EXISTS idx_history_scraped_day ON history(scraped_day);
+
+-- 이전 버전의 제목 토큰 테이블 (읽는 곳이 없어 제거)
+DROP TABLE IF EXISTS title_tokens;
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _safe_normalize(link):
+    try:
+        return normalize_url(link)
+    except ValueError:
+        return link
+
+
+class HistoryStore:
+    """
+    SQLite 기반 스크랩 히스토리
+
+    사용:
+        store = HistoryStore()
+        store.prune(days=7)
+        store.has_link(url)
+        store.add([{'title': ..., 'link': ..., 'scraped_at': ...}])
+    """
+
+    def __init__(self, db_file=DB_FILE, legacy_json_file=LEGACY_JSON_FILE):
+        self.db_file = db_file
+        self.conn = sqlite3.connect(db_file)
+        self.conn.executescript(_SCHEMA)
+        self.conn.commit()
+
+        if legacy_json_file and os.path.exists(legacy_json_file):
+            self.migrate_from_json(legacy_json_file)
+
+    def close(self):
+        self.conn.close()
+
+    # ------------------------------------------------------------------
+    # 마이그레이션
+    # ------------------------------------------------------------------
+
+    def migrate_from_json(self, json_file):
+        """
+        기존 scrape_history.json 가져오기 (1회)
+        성공하면 원본 파일을 .migrated로 이름 변경
+        """
+        try:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+        except (OSError, ValueError):
+            return 0
+
+        entries = legacy.get('articles', [])
+        for entry in entries:
+            if entry.get('title') and entry.get('link') and entry.get('scraped_at'):
+                self._insert(entry['title'], entry['link'], entry['scraped_at'])
+        if legacy.get('last_updated'):
+            self._set_meta('last_updated', legacy['last_updated'])
+        self.conn.commit()
+
+        try:
+            os.replace(json_file, json_file + '.migrated')
+        except OSError:
+            pass
+        return len(entries)
+
+    # ------------------------------------------------------------------
+    # 조회/추가/정리
+    # ------------------------------------------------------------------
+
+    def _insert(self, title, link, scraped_at):
+        self.conn.execute(
+            "INSERT INTO history (link, link_norm, title, scraped_at, scraped_day) VALUES (?, ?, ?, ?, ?)",
+            (link, _safe_normalize(link), title, scraped_at, scraped_at[:10])
+        )
+
+    def _set_meta(self, key, value):
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def get_meta(self, key):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def prune(self, days):
+        """
+        days x 24시간보다 오래된 항목 삭제 (scraped_at 기준 - 기존 JSON 로더와 같은 기준)
+        scraped_day 인덱스로 범위를 좁힌 뒤 scraped_at으로 정확히 비교 (ISO 형식 문자열 비교)
+        """
+        cutoff = datetime.now() - timedelta(days=days)
+        deleted = self.conn.execute(
+            "DELETE FROM history WHERE scraped_day <= ? AND scraped_at <= ?",
+            (cutoff.strftime('%Y-%m-%d'), cutoff.isoformat())
+        ).rowcount
+        self.conn.commit()
+        return deleted
+
+    def has_link(self, link):
+        """정규화된 링크로 중복 확인 (인덱스 조회)"""
+        row = self.conn.execute(
+            "SELECT 1 FROM history WHERE link_norm = ? LIMIT 1", (_safe_normalize(link),)
+        ).fetchone()
+        return row is not None
+
+    def entries(self):
+        """전체 항목 (오래된 순) - [{'title', 'link', 'scraped_at'}]"""
+        rows = self.conn.execute("SELECT title, link, scraped_at FROM history ORDER BY id").fetchall()
+        return [{'title': title, 'link': link, 'scraped_at': scraped_at} for title, link, scraped_at in rows]
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM history").fetchone()[0]
+
+    def add(self, entries):
+        """항목 추가 (새 항목만 INSERT) - entries: [{'title', 'link', 'scraped_at'}]"""
+        for entry in entries:
+            self._insert(entry['title'], entry['link'], entry['scraped_at'])
+        self._set_meta('last_updated', datetime.now().isoformat())
+        self.conn.commit()
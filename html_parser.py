@@ -0,0 +1,160 @@
+"""
+HTML 파싱 백엔드
+
+- parse(html): CSS 선택자용 BeautifulSoup 트리
+  lxml이 설치되어 있으면 lxml 빌더(html.parser보다 수 배 빠름), 없으면 html.parser
+- parse_head(html): <head>만 읽어 meta 태그/JSON-LD/title 추출 (발행일, og 태그 확인용)
+  selectolax가 설치되어 있으면 사용, 없으면 표준 라이브러리 파서가 </head>(또는 <body>)에서 중단
+  수백 KB 페이지 전체를 트리로 만들지 않음
+
+설정 (환경변수):
+    ONDA_HTML_PARSER: auto(기본) / lxml / html.parser
+
+사용:
+    soup = html_parser.parse(response.text)
+    head = html_parser.parse_head(page_text)
+    html_parser.meta_content(head, property='article:published_time')
+"""
+
+import os
+import re
+import time
+from html.parser import HTMLParser
+
+from bs4 import BeautifulSoup
+
+import run_metrics
+
+# lxml/selectolax는 선택 사항 (설치되어 있으면 사용)
+try:
+    import lxml  # noqa: F401
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+try:
+    from selectolax.parser import HTMLParser as SelectolaxParser
+except ImportError:
+    SelectolaxParser = None
+
+
+PARSER_SETTING = os.environ.get('ONDA_HTML_PARSER', 'auto')
+
+# </head> 또는 <body 위치 (head만 필요할 때 여기까지만 파싱)
+_HEAD_END_RE = re.compile(r'</head\s*>|<body[\s>]', re.I)
+
+
+def get_tree_builder():
+    """BeautifulSoup 빌더 이름 (설정 + 설치 여부 기준)"""
+    if PARSER_SETTING != 'html.parser' and HAS_LXML:
+        return 'lxml'
+    return 'html.parser'
+
+
+def parse(html):
+    """전체 문서 파싱 (select/select_one/find/get_text 사용 가능한 BeautifulSoup)"""
+    start = time.perf_counter()
+    soup = BeautifulSoup(html, get_tree_builder())
+    run_metrics.add_time('html_parse', time.perf_counter() - start)
+    return soup
+
+
+# ============================================
+# head 전용 파싱
+# ============================================
+
+class HeadParser(HTMLParser):
+    """
+    <head> 안의 meta/JSON-LD/title만 모으는 스트리밍 파서
+
+    feed()로 조각을 나눠 넣을 수 있고 </head> 또는 <body>를 만나면 done=True
+    (이후 feed는 무시) - 네트워크에서 받는 대로 넣다가 done이면 다운로드 중단 가능
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.done = False
+        self.metas = []
+        self.json_ld = []
+        self.title = ''
+        self._capture = None  # 'json_ld' / 'title'
+        self._buffer = []
+
+    def feed(self, data):
+        if not self.done:
+            super().feed(data)
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if tag == 'body':
+            self.done = True
+        elif tag == 'meta':
+            self.metas.append({name: value or '' for name, value in attrs})
+        elif tag == 'script' and dict(attrs).get('type') == 'application/ld+json':
+            self._capture = 'json_ld'
+            self._buffer = []
+        elif tag == 'title' and not self.title:
+            self._capture = 'title'
+            self._buffer = []
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        if tag == 'head':
+            self.done = True
+        if self._capture == 'json_ld' and tag == 'script':
+            self.json_ld.append(''.join(self._buffer))
+            self._capture = None
+        elif self._capture == 'title' and tag == 'title':
+            self.title = ''.join(self._buffer).strip()
+            self._capture = None
+
+    def handle_data(self, data):
+        if self._capture:
+            self._buffer.append(data)
+
+    def result(self):
+        return {'metas': self.metas, 'json_ld': self.json_ld, 'title': self.title}
+
+
+def _parse_head_selectolax(head_html):
+    tree = SelectolaxParser(head_html)
+    title_node = tree.css_first('title')
+    return {
+        'metas': [{k: v or '' for k, v in node.attributes.items()} for node in tree.css('meta')],
+        'json_ld': [node.text() for node in tree.css('script') if node.attributes.get('type') == 'application/ld+json'],
+        'title': title_node.text(strip=True) if title_node else '',
+    }
+
+
+def parse_head(html):
+    """
+    <head> 부분만 파싱
+
+    Returns:
+        dict: {'metas': [meta 태그 속성 dict ...], 'json_ld': [스크립트 원문 ...], 'title': str}
+    """
+    with run_metrics.timer('head_parse'):
+        match = _HEAD_END_RE.search(html)
+        head_html = html[:match.start()] if match else html
+
+        if SelectolaxParser is not None and PARSER_SETTING != 'html.parser':
+            return _parse_head_selectolax(head_html)
+
+        parser = HeadParser()
+        parser.feed(head_html)
+        parser.close()
+        return parser.result()
+
+
+def meta_content(head, **attrs):
+    """
+    parse_head 결과에서 속성이 모두 일치하는 첫 meta 태그의 content (없으면 None)
+    예: meta_content(head, property='og:title')
+    """
+    for meta in head['metas']:
+        if all(meta.get(name) == value for name, value in attrs.items()):
+            return meta.get('content') or None
+    return None
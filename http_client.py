@@ -0,0 +1,182 @@
+"""
+공용 HTTP 클라이언트
+
+모든 외부 요청(구글/네이버 검색, 기사 원문, Slack API)이 하나의 세션을 공유하여
+호스트별 keep-alive 연결을 재사용 (매 요청마다 TCP/TLS 핸드셰이크 반복 방지)
+
+- 호스트별 연결 풀 (HTTPAdapter pool_maxsize)
+- 재시도 + 지수 백오프 (연결 오류, 429/5xx - 멱등 메서드만)
+  읽기 타임아웃은 재시도하지 않음 (호출 측 timeout이 요청 전체 시간의 상한이 되도록)
+  백오프/Retry-After 대기는 상한까지만 (429 한 번에 수집 워커가 오래 멈추지 않도록)
+  429를 직접 처리하는 API(Slack)는 register_self_rate_limited로 등록 - 429 재시도 제외
+- 기본 헤더 (User-Agent, Accept-Language)
+- 요청마다 호스트별 호출 수/받은 바이트/응답 시간 기록 (run_metrics)
+
+사용:
+    import http_client
+    response = http_client.get(url, timeout=5)
+    response = http_client.post(url, headers=headers, json=payload)
+"""
+
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import http_replay
+import run_metrics
+
+
+DEFAULT_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+
+DEFAULT_HEADERS = {
+    'User-Agent': DEFAULT_USER_AGENT,
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+}
+
+DEFAULT_TIMEOUT = 10
+
+# 연결 풀 설정
+# - POOL_CONNECTIONS: 캐시할 호스트별 풀 개수 (기사 원문은 언론사마다 호스트가 다름)
+# - POOL_MAXSIZE: 호스트 하나당 유지할 keep-alive 연결 수 (동시 수집 워커 수 이상)
+POOL_CONNECTIONS = int(os.environ.get('ONDA_HTTP_POOL_CONNECTIONS', '64'))
+POOL_MAXSIZE = int(os.environ.get('ONDA_HTTP_POOL_MAXSIZE', '16'))
+
+# 재시도 설정 (backoff: 0.5s, 1s, 2s ... 최대 RETRY_BACKOFF_MAX)
+RETRY_TOTAL = int(os.environ.get('ONDA_HTTP_RETRIES', '2'))
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_BACKOFF_MAX = 2.0
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# 429/503의 Retry-After 대기 상한(초) - 더 길게 요구하면 이 시간만 기다린 뒤 재시도
+RETRY_AFTER_MAX = float(os.environ.get('ONDA_HTTP_RETRY_AFTER_MAX', '5'))
+
+_session = None
+_session_lock = threading.Lock()
+
+# 429를 직접 처리하는 API 주소 접두어 (register_self_rate_limited)
+_self_rate_limited_prefixes = set()
+
+
+class CappedRetry(Retry):
+    """Retry-After 대기를 RETRY_AFTER_MAX로 제한"""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, RETRY_AFTER_MAX)
+
+
+def _build_retry(status_codes=RETRY_STATUS_CODES, retry_after=True):
+    """
+    재시도 정책 (POST는 중복 발송 위험이 있어 재시도하지 않음)
+    연결 오류/상태 코드만 재시도 - 읽기 타임아웃은 재시도하지 않음
+    retry_after=False: Retry-After가 있는 429/503도 status_codes에 없으면 재시도하지 않음
+    """
+    return CappedRetry(
+        total=RETRY_TOTAL,
+        read=0,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        backoff_max=RETRY_BACKOFF_MAX,
+        status_forcelist=status_codes,
+        allowed_methods=frozenset(['GET', 'HEAD', 'OPTIONS']),
+        respect_retry_after_header=retry_after,
+        raise_on_status=False,
+    )
+
+
+def _build_adapter(retry):
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    # 녹화/재생 모드면 어댑터를 감쌈 (http_replay)
+    return http_replay.wrap_adapter(adapter)
+
+
+def _mount_self_rate_limited(session, prefix):
+    status_codes = tuple(code for code in RETRY_STATUS_CODES if code != 429)
+    session.mount(prefix, _build_adapter(_build_retry(status_codes, retry_after=False)))
+
+
+def _build_session():
+    """연결 풀/재시도/기본 헤더가 설정된 세션 생성"""
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+
+    adapter = _build_adapter(_build_retry())
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    for prefix in _self_rate_limited_prefixes:
+        _mount_self_rate_limited(session, prefix)
+    return session
+
+
+def register_self_rate_limited(prefix):
+    """
+    429를 호출 측에서 직접 처리하는 API 등록 (예: Slack - slack_client의 토큰 버킷/Retry-After 대기)
+    prefix로 시작하는 요청은 429를 재시도하지 않고 그대로 반환
+    """
+    with _session_lock:
+        _self_rate_limited_prefixes.add(prefix)
+        if _session is not None:
+            _mount_self_rate_limited(_session, prefix)
+
+
+def get_session():
+    """프로세스 전체에서 공유하는 세션 반환 (최초 호출 시 생성)"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def close_session():
+    """세션과 연결 풀 정리"""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def request(method, url, **kwargs):
+    """
+    공용 세션으로 요청
+
+    headers는 기본 헤더 위에 덮어쓰기, timeout 미지정 시 DEFAULT_TIMEOUT 적용
+    """
+    kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+    host = urlsplit(url).netloc
+    start = time.perf_counter()
+    try:
+        response = get_session().request(method, url, **kwargs)
+    except requests.RequestException:
+        run_metrics.record_http(host, 0, time.perf_counter() - start, error=True)
+        raise
+
+    # 스트리밍 응답은 본문을 읽지 않았으므로 받은 양은 호출 측에서 기록
+    received = 0 if kwargs.get('stream') else len(response.content)
+    run_metrics.record_http(host, received, time.perf_counter() - start, error=response.status_code >= 400)
+    return response
+
+
+def get(url, **kwargs):
+    """GET 요청"""
+    return request('GET', url, **kwargs)
+
+
+def post(url, **kwargs):
+    """POST 요청"""
+    return request('POST', url, **kwargs)
@@ -0,0 +1,298 @@
+"""
+HTTP / LLM 응답 녹화-재생 (오프라인 벤치마크용)
+
+실제 실행(구글/네이버/언론사/Slack/LLM)의 응답을 카세트 폴더에 녹화하고
+같은 입력으로 전체 파이프라인을 네트워크 없이 재생
+
+- HTTP: http_client 세션의 전송 어댑터를 감싸서 녹화/재생 (requests를 쓰는 모든 요청)
+- LLM: llm_cache.cached에서 캐시 키 기준으로 녹화/재생 (SDK는 requests를 쓰지 않음)
+- 카세트: 요청마다 gzip JSON 파일 하나 (http/, llm/) + meta.json (녹화 시각)
+- 요청 매칭: (메서드, URL, 본문) 해시 -> 없으면 (메서드, URL) 녹화 순서대로
+  (Slack 멱등 키처럼 실행마다 바뀌는 본문 대응)
+- 재생 시 호스트별 지연 주입 (녹화 당시 응답 시간 또는 고정값)
+
+설정 (환경변수, http_client 세션 생성 전에 읽음):
+    ONDA_HTTP_RECORD=<카세트 폴더>: 녹화
+    ONDA_HTTP_REPLAY=<카세트 폴더>: 재생 (녹화에 없는 요청은 연결 오류)
+    ONDA_REPLAY_LATENCY: 재생 지연
+        recorded (녹화 당시 응답 시간) / 0.2 (모든 호스트) /
+        default=0.05,www.google.com=0.5,llm=1.0 (호스트별, llm은 모델 호출)
+
+사용:
+    python benchmarks/replay_pipeline.py record cassettes/today -- --force
+    python benchmarks/replay_pipeline.py replay cassettes/today --latency recorded --runs 3
+"""
+
+import base64
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+MODE = None  # None / 'record' / 'replay'
+CASSETTE_DIR = None
+LATENCY = {}  # {'default': 초, 호스트: 초} 또는 {'recorded': True}
+LLM_KEY_ENV = ('OPENAI_API_KEY', 'ANTHROPIC_API_KEY')
+
+_lock = threading.Lock()
+_sequence = {}      # 녹화: (메서드, URL) 키별 다음 번호
+_replay_index = {}  # 재생: 본문 해시 키 -> 파일 목록, (메서드, URL) 키 -> 파일 목록
+_replay_used = {}   # 재생: 키별 사용한 개수
+
+
+def parse_latency(spec):
+    """ONDA_REPLAY_LATENCY 형식 -> LATENCY dict"""
+    spec = (spec or '').strip()
+    if not spec:
+        return {}
+    if spec == 'recorded':
+        return {'recorded': True}
+    if '=' not in spec:
+        return {'default': float(spec)}
+    latency = {}
+    for part in spec.split(','):
+        host, _, seconds = part.partition('=')
+        latency[host.strip()] = float(seconds)
+    return latency
+
+
+def _start(mode, cassette_dir, latency):
+    global MODE, CASSETTE_DIR, LATENCY
+
+    MODE = mode
+    CASSETTE_DIR = cassette_dir
+    LATENCY = parse_latency(latency) if isinstance(latency, str) else (latency or {})
+    with _lock:
+        _sequence.clear()
+        _replay_index.clear()
+        _replay_used.clear()
+
+    if mode == 'record':
+        os.makedirs(os.path.join(cassette_dir, 'http'), exist_ok=True)
+        os.makedirs(os.path.join(cassette_dir, 'llm'), exist_ok=True)
+        _write(os.path.join(cassette_dir, 'meta.json'), {
+            'version': 1,
+            'recorded_at': datetime.now().isoformat(),
+            # 녹화 때 켜져 있던 LLM 경로 (재생 시 같은 분기를 타도록)
+            'llm_keys': [name for name in LLM_KEY_ENV if os.environ.get(name)],
+        }, compress=False)
+    elif mode == 'replay':
+        _load_index()
+
+
+def configure(mode, cassette_dir=None, latency=None):
+    """
+    녹화/재생 시작 (mode=None이면 해제)
+    이미 만들어진 공용 세션은 닫아서 다음 요청부터 새 어댑터 사용
+    """
+    import http_client
+
+    _start(mode, cassette_dir, latency)
+    http_client.close_session()
+
+
+def read_meta():
+    """카세트 정보 {'recorded_at': datetime 또는 None, 'llm_keys': [...]}"""
+    try:
+        with open(os.path.join(CASSETTE_DIR, 'meta.json'), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError, TypeError):
+        meta = {}
+    try:
+        recorded = datetime.fromisoformat(meta['recorded_at'])
+    except (KeyError, TypeError, ValueError):
+        recorded = None
+    return {'recorded_at': recorded, 'llm_keys': meta.get('llm_keys', [])}
+
+
+# ============================================
+# 카세트 파일
+# ============================================
+
+def _write(path, data, compress=True):
+    raw = json.dumps(data, ensure_ascii=False).encode('utf-8')
+    if compress:
+        with gzip.open(path, 'wb') as f:
+            f.write(raw)
+    else:
+        with open(path, 'wb') as f:
+            f.write(raw)
+
+
+def _read(path):
+    with gzip.open(path, 'rb') as f:
+        return json.loads(f.read().decode('utf-8'))
+
+
+def _digest(*parts):
+    sha = hashlib.sha1()
+    for part in parts:
+        sha.update(part if isinstance(part, bytes) else str(part).encode('utf-8'))
+        sha.update(b'\x00')
+    return sha.hexdigest()[:20]
+
+
+def _request_keys(request):
+    """(본문 포함 키, 메서드+URL 키)"""
+    body = request.body or b''
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    return _digest(request.method, request.url, body), _digest(request.method, request.url)
+
+
+def _load_index():
+    """재생용 색인 (파일 이름: <메서드+URL 키>-<번호>-<본문 키>.json.gz)"""
+    http_dir = os.path.join(CASSETTE_DIR, 'http')
+    try:
+        names = sorted(os.listdir(http_dir))
+    except OSError:
+        names = []
+
+    entries = []
+    for name in names:
+        if not name.endswith('.json.gz'):
+            continue
+        url_key, number, body_key = name[:-len('.json.gz')].split('-')
+        entries.append((url_key, int(number), body_key, os.path.join(http_dir, name)))
+
+    with _lock:
+        for url_key, _, body_key, path in sorted(entries):
+            _replay_index.setdefault(('body', body_key), []).append(path)
+            _replay_index.setdefault(('url', url_key), []).append(path)
+
+
+def _next_recording(request):
+    body_key, url_key = _request_keys(request)
+    with _lock:
+        for key in (('body', body_key), ('url', url_key)):
+            paths = _replay_index.get(key)
+            if paths:
+                used = _replay_used.get(key, 0)
+                _replay_used[key] = used + 1
+                # 녹화보다 많이 요청하면 마지막 응답 반복
+                return paths[min(used, len(paths) - 1)]
+    return None
+
+
+def _latency_for(host, recorded_seconds):
+    if LATENCY.get('recorded'):
+        return recorded_seconds
+    return LATENCY.get(host, LATENCY.get('default', 0))
+
+
+# ============================================
+# HTTP 전송 어댑터
+# ============================================
+
+class RecordReplayAdapter(BaseAdapter):
+    """녹화: 실제 어댑터로 보내고 응답 저장 / 재생: 저장된 응답 반환 (네트워크 사용 안 함)"""
+
+    def __init__(self, inner):
+        super().__init__()
+        self.inner = inner
+
+    def send(self, request, **kwargs):
+        if MODE == 'replay':
+            return self._replay(request)
+
+        start = time.perf_counter()
+        response = self.inner.send(request, **kwargs)
+        elapsed = time.perf_counter() - start
+        if MODE == 'record':
+            self._record(request, response, elapsed)
+        return response
+
+    def close(self):
+        self.inner.close()
+
+    def _record(self, request, response, elapsed):
+        body_key, url_key = _request_keys(request)
+        with _lock:
+            number = _sequence.get(url_key, 0)
+            _sequence[url_key] = number + 1
+
+        content = response.content  # 스트리밍 응답도 전체를 읽어서 저장 (이후 iter_content는 저장된 본문 사용)
+        _write(os.path.join(CASSETTE_DIR, 'http', f'{url_key}-{number:04d}-{body_key}.json.gz'), {
+            'method': request.method,
+            'url': request.url,
+            'status_code': response.status_code,
+            'reason': response.reason,
+            'headers': dict(response.headers),
+            'final_url': response.url,
+            'body': base64.b64encode(content).decode('ascii'),
+            'elapsed': elapsed,
+        })
+
+    def _replay(self, request):
+        path = _next_recording(request)
+        if path is None:
+            raise requests.ConnectionError(f'녹화에 없는 요청: {request.method} {request.url}', request=request)
+
+        data = _read(path)
+        delay = _latency_for(urlsplit(request.url).netloc, data['elapsed'])
+        if delay:
+            time.sleep(delay)
+
+        response = requests.Response()
+        response.status_code = data['status_code']
+        response.reason = data['reason']
+        response.headers = CaseInsensitiveDict(data['headers'])
+        # 녹화 시 이미 압축 해제된 본문이므로 인코딩 헤더 제거
+        response.headers.pop('Content-Encoding', None)
+        response.url = data['final_url']
+        response.request = request
+        response._content = base64.b64decode(data['body'])
+        response._content_consumed = True
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+
+def wrap_adapter(adapter):
+    """녹화/재생 중이면 어댑터를 감싸서 반환 (아니면 그대로)"""
+    if MODE in ('record', 'replay'):
+        return RecordReplayAdapter(adapter)
+    return adapter
+
+
+# ============================================
+# LLM 응답
+# ============================================
+
+def replay_llm(key):
+    """재생: 녹화된 모델 응답 (없으면 LookupError - 호출 측의 API 오류 처리로 넘어감)"""
+    path = os.path.join(CASSETTE_DIR, 'llm', f'{key}.json.gz')
+    try:
+        data = _read(path)
+    except OSError:
+        raise LookupError(f'녹화에 없는 LLM 응답: {key}') from None
+
+    delay = _latency_for('llm', data['elapsed'])
+    if delay:
+        time.sleep(delay)
+    return data['response']
+
+
+def record_llm(key, template, model, response, elapsed):
+    """녹화: 모델 응답 저장 (llm_cache에서 가져온 응답도 저장, elapsed=0)"""
+    _write(os.path.join(CASSETTE_DIR, 'llm', f'{key}.json.gz'), {
+        'template': template,
+        'model': model,
+        'response': response,
+        'elapsed': elapsed,
+    })
+
+
+# 환경변수로 시작 (세션 생성 전)
+if os.environ.get('ONDA_HTTP_REPLAY'):
+    _start('replay', os.environ['ONDA_HTTP_REPLAY'], os.environ.get('ONDA_REPLAY_LATENCY'))
+elif os.environ.get('ONDA_HTTP_RECORD'):
+    _start('record', os.environ['ONDA_HTTP_RECORD'], None)
@@ -0,0 +1,89 @@
+"""
+키워드 그룹 매칭 (Aho-Corasick)
+
+점수/분류 함수들이 키워드 목록마다 `kw in text`를 반복하던 방식을 대체
+- 모든 키워드 그룹을 import 시 하나의 오토마톤으로 한 번만 컴파일
+- 텍스트를 한 번 훑어서 모든 그룹의 매칭 결과를 반환 (비용은 키워드 수가 아니라 텍스트 길이에 비례)
+- 같은 텍스트는 결과를 캐시하므로 여러 점수 함수가 같은 매칭 결과를 공유
+
+대소문자 처리는 호출 측 책임: 키워드는 등록한 그대로 비교
+(소문자 텍스트와 비교하려면 키워드도 소문자로 등록, 대문자가 섞인 키워드는 소문자 텍스트와 매칭되지 않음)
+
+사용:
+    matcher = KeywordMatcher({'ota': ['야놀자', '아고다'], 'policy': ['규제']})
+    hits = matcher.match('야놀자 규제 이슈')
+    # {'ota': (0,), 'policy': (0,)} - 그룹별 매칭된 키워드 번호 (목록 순서)
+"""
+
+from collections import deque
+from functools import lru_cache
+
+
+class KeywordMatcher:
+    """여러 키워드 그룹을 한 번에 찾는 Aho-Corasick 오토마톤"""
+
+    def __init__(self, groups, cache_size=4096):
+        self.groups = {name: list(keywords) for name, keywords in groups.items()}
+
+        # 트라이 구성 (상태 0 = 루트)
+        self._goto = [{}]
+        self._outputs = [[]]
+        for name, keywords in self.groups.items():
+            for index, keyword in enumerate(keywords):
+                if not keyword:
+                    continue
+                state = 0
+                for ch in keyword:
+                    next_state = self._goto[state].get(ch)
+                    if next_state is None:
+                        next_state = len(self._goto)
+                        self._goto[state][ch] = next_state
+                        self._goto.append({})
+                        self._outputs.append([])
+                    state = next_state
+                # 같은 목록에 같은 키워드가 여러 번 있어도 번호별로 각각 기록
+                self._outputs[state].append((name, index))
+
+        # 실패 링크 (너비 우선) + 실패 경로의 출력 병합
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(ch, 0)
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[self._fail[next_state]]
+
+        self._outputs = [tuple(output) for output in self._outputs]
+        self._cached_match = lru_cache(maxsize=cache_size)(self._match)
+
+    def _match(self, text):
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+
+        found = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+
+        hits = {}
+        for name, index in found:
+            hits.setdefault(name, []).append(index)
+        return {name: tuple(sorted(indices)) for name, indices in hits.items()}
+
+    def match(self, text):
+        """
+        텍스트에서 모든 그룹의 키워드 찾기 (결과는 캐시되므로 수정하지 말 것)
+
+        Returns:
+            dict: {그룹 이름: 매칭된 키워드 번호 튜플 (목록 순서)} - 매칭 없는 그룹은 생략
+        """
+        return self._cached_match(text)
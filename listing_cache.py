@@ -0,0 +1,162 @@
+"""
+목록 페이지 캐시 (조건부 GET, SQLite)
+
+네이버 섹션/검색 결과 페이지를 실행할 때마다 (아침 수동 재실행 포함) 전체 다시 받던 문제 해결
+- URL별로 ETag/Last-Modified와 파싱된 기사 목록을 저장
+- 다음 요청에 If-None-Match/If-Modified-Since를 보내고 304면 저장된 기사 목록 재사용 (다시 파싱하지 않음)
+- 짧은 TTL(기본 30분) 안의 재실행은 요청 없이 저장된 목록 사용
+- 기사가 하나도 파싱되지 않은 응답(봇 차단 등)은 저장하지 않음
+
+설정 (환경변수):
+    ONDA_LISTING_CACHE_PATH: 캐시 파일 경로 (기본: .listing_cache.sqlite3)
+    ONDA_LISTING_CACHE_TTL_MINUTES: 요청 없이 재사용하는 시간 (기본 30, 0이면 항상 조건부 GET)
+    ONDA_LISTING_CACHE_MAX_AGE_DAYS: 보관 일수 (기본 2)
+    ONDA_LISTING_CACHE_DISABLED=1: 캐시 사용 안 함 (항상 전체 다운로드)
+
+사용:
+    articles = listing_cache.fetch(url, parse_page, headers=headers, timeout=10)
+    # parse_page(html) -> 기사 목록 (저장하지 않을 응답이면 None)
+    # 파싱 결과가 URL 외의 인자에 따라 달라지면 parse_key로 구분 (예: parse_key=f'display={display}')
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import http_client
+import run_metrics
+from article_record import Article, json_default
+
+
+CACHE_PATH = os.environ.get(
+    'ONDA_LISTING_CACHE_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.listing_cache.sqlite3')
+)
+TTL_MINUTES = float(os.environ.get('ONDA_LISTING_CACHE_TTL_MINUTES', '30'))
+MAX_AGE_DAYS = float(os.environ.get('ONDA_LISTING_CACHE_MAX_AGE_DAYS', '2'))
+DISABLED = os.environ.get('ONDA_LISTING_CACHE_DISABLED', '') == '1'
+
+# 실행 중 캐시 사용 현황 (fresh: 요청 없음, not_modified: 304, fetched: 전체 다운로드)
+stats = {'fresh': 0, 'not_modified': 0, 'fetched': 0}
+
+_conn = None
+_lock = threading.Lock()
+
+
+def _connect():
+    """캐시 DB 연결 (최초 호출 시 테이블 생성 + 오래된 항목 정리)"""
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(CACHE_PATH, check_same_thread=False)
+        _conn.execute("""
+            CREATE TABLE IF NOT EXISTS listing_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                articles TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                validated_at REAL NOT NULL
+            )
+        """)
+        _conn.execute("DELETE FROM listing_cache WHERE validated_at < ?", (time.time() - MAX_AGE_DAYS * 86400,))
+        _conn.commit()
+    return _conn
+
+
+def _load(key):
+    """저장된 항목 (없으면 None)"""
+    try:
+        with _lock:
+            row = _connect().execute(
+                "SELECT etag, last_modified, articles, validated_at FROM listing_cache WHERE url = ?", (key,)
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None:
+        return None
+    return {'etag': row[0], 'last_modified': row[1], 'articles': row[2], 'validated_at': row[3]}
+
+
+def _store(key, etag, last_modified, articles):
+    now = time.time()
+    try:
+        with _lock:
+            conn = _connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO listing_cache (url, etag, last_modified, articles, fetched_at, validated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, etag, last_modified, json.dumps(articles, ensure_ascii=False, default=json_default), now, now)
+            )
+            conn.commit()
+    except sqlite3.Error:
+        pass
+
+
+def _touch(key):
+    """304 응답 - 검증 시각만 갱신"""
+    try:
+        with _lock:
+            conn = _connect()
+            conn.execute("UPDATE listing_cache SET validated_at = ? WHERE url = ?", (time.time(), key))
+            conn.commit()
+    except sqlite3.Error:
+        pass
+
+
+def _articles(entry):
+    """저장된 기사 목록 -> 새 Article 목록 (호출 측에서 수정해도 캐시에 영향 없음)"""
+    return [Article.from_dict(item) for item in json.loads(entry['articles'])]
+
+
+def _count(name):
+    with _lock:
+        stats[name] += 1
+    run_metrics.record_cache('listing', name != 'fetched')
+
+
+def fetch(url, parse, headers=None, timeout=10, parse_key=''):
+    """
+    목록 페이지의 기사 목록 (캐시 우선, 조건부 GET)
+
+    Args:
+        url: 목록 페이지 URL
+        parse: 응답 HTML -> 기사 목록 함수 (None 반환 시 저장하지 않음)
+        headers: 추가 요청 헤더
+        timeout: 요청 타임아웃(초)
+        parse_key: parse 결과를 바꾸는 URL 외 인자 (URL과 함께 캐시 키 - 다른 인자의 파싱 결과 재사용 방지)
+
+    Returns:
+        list: Article 목록 (요청 예외는 그대로 전달)
+    """
+    if DISABLED:
+        response = http_client.get(url, headers=headers, timeout=timeout)
+        return parse(response.text) or []
+
+    key = f'{url} {parse_key}' if parse_key else url
+    entry = _load(key)
+    if entry and time.time() - entry['validated_at'] < TTL_MINUTES * 60:
+        _count('fresh')
+        return _articles(entry)
+
+    request_headers = dict(headers or {})
+    if entry:
+        if entry['etag']:
+            request_headers['If-None-Match'] = entry['etag']
+        if entry['last_modified']:
+            request_headers['If-Modified-Since'] = entry['last_modified']
+
+    response = http_client.get(url, headers=request_headers, timeout=timeout)
+    if response.status_code == 304 and entry:
+        _touch(key)
+        _count('not_modified')
+        return _articles(entry)
+
+    _count('fetched')
+    articles = parse(response.text)
+    if not articles:
+        return []
+    if response.status_code == 200:
+        _store(key, response.headers.get('ETag'), response.headers.get('Last-Modified'), articles)
+    return articles
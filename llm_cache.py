@@ -0,0 +1,152 @@
+"""
+LLM 응답 캐시 (SQLite)
+
+같은 기사를 다시 요약하거나 재실행할 때 모델을 다시 호출하지 않도록
+(프롬프트 템플릿, 템플릿 버전, 모델, 프롬프트 내용 해시) 기준으로 응답을 저장
+- 프롬프트에 기사 제목/원문이 포함되므로 내용이 바뀌면 자동으로 새로 호출
+- 템플릿을 수정하면 버전을 올려서 기존 캐시 무효화
+- TTL(기본 14일) 및 최대 항목 수 기준으로 오래된 항목 정리
+
+설정 (환경변수):
+    ONDA_LLM_CACHE_PATH: 캐시 파일 경로 (기본: .llm_cache.sqlite3)
+    ONDA_LLM_CACHE_TTL_DAYS: 보관 일수 (기본 14)
+    ONDA_LLM_CACHE_MAX_ENTRIES: 최대 항목 수 (기본 5000)
+    ONDA_LLM_CACHE_DISABLED=1: 캐시 사용 안 함
+
+사용:
+    text = llm_cache.cached('short_summary', 1, 'gpt-4o-mini', prompt,
+                            lambda: call_model(prompt))
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+import http_replay
+import run_metrics
+
+
+CACHE_PATH = os.environ.get(
+    'ONDA_LLM_CACHE_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.llm_cache.sqlite3')
+)
+TTL_DAYS = float(os.environ.get('ONDA_LLM_CACHE_TTL_DAYS', '14'))
+MAX_ENTRIES = int(os.environ.get('ONDA_LLM_CACHE_MAX_ENTRIES', '5000'))
+DISABLED = os.environ.get('ONDA_LLM_CACHE_DISABLED', '') == '1'
+
+_conn = None
+_lock = threading.Lock()
+
+
+def _connect():
+    """캐시 DB 연결 (최초 호출 시 테이블 생성 + 만료 항목 정리)"""
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(CACHE_PATH, check_same_thread=False)
+        _conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                template TEXT NOT NULL,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        _conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache(accessed_at)")
+        _evict(_conn)
+        _conn.commit()
+    return _conn
+
+
+def _evict(conn):
+    """TTL 지난 항목 삭제 후, 최대 항목 수를 넘으면 오래 사용하지 않은 항목부터 삭제"""
+    conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (time.time() - TTL_DAYS * 86400,))
+    conn.execute("""
+        DELETE FROM llm_cache WHERE key IN (
+            SELECT key FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+        )
+    """, (MAX_ENTRIES,))
+
+
+def make_key(template, version, model, content):
+    """캐시 키 = sha256(템플릿 이름, 버전, 모델, 프롬프트 내용)"""
+    raw = f"{template}\x00{version}\x00{model}\x00{content}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def get(key):
+    """캐시된 응답 반환 (없거나 만료되었으면 None)"""
+    if DISABLED:
+        return None
+    try:
+        with _lock:
+            conn = _connect()
+            row = conn.execute(
+                "SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] < time.time() - TTL_DAYS * 86400:
+                return None
+            conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            conn.commit()
+            return row[0]
+    except sqlite3.Error:
+        return None
+
+
+def put(key, template, model, response):
+    """응답 저장"""
+    if DISABLED or not response:
+        return
+    try:
+        with _lock:
+            conn = _connect()
+            now = time.time()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, template, model, response, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, template, model, response, now, now)
+            )
+            _evict(conn)
+            conn.commit()
+    except sqlite3.Error:
+        pass
+
+
+def cached(template, version, model, content, call):
+    """
+    캐시에 있으면 저장된 응답, 없으면 call()을 실행하고 결과 저장
+
+    Args:
+        template: 프롬프트 템플릿 이름 (예: 'short_summary')
+        version: 템플릿 버전 (프롬프트 수정 시 올림)
+        model: 모델 이름
+        content: 모델에 보내는 전체 프롬프트 (system 메시지 포함)
+        call: 모델을 호출하여 응답 텍스트를 반환하는 함수
+
+    Returns:
+        str: 응답 텍스트 (call()의 예외는 그대로 전달)
+    """
+    key = make_key(template, version, model, content)
+
+    # 녹화 재생 중에는 녹화된 응답만 사용 (http_replay)
+    if http_replay.MODE == 'replay':
+        return http_replay.replay_llm(key)
+
+    response = get(key)
+    run_metrics.record_cache('llm', response is not None)
+    if response is not None:
+        if http_replay.MODE == 'record':
+            http_replay.record_llm(key, template, model, response, 0)
+        return response
+
+    start = time.perf_counter()
+    response = call()
+    elapsed = time.perf_counter() - start
+    run_metrics.record_llm_call(model, elapsed)
+    put(key, template, model, response)
+    if http_replay.MODE == 'record':
+        http_replay.record_llm(key, template, model, response, elapsed)
+    return response
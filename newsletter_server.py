@@ -5,31 +5,45 @@ WeeklyON 뉴스레터 생성 서버
 1. 링크만 입력하면 자동으로 기사 내용 추출
 2. AI로 요약 생성 (호스피탈리티 트렌드: 500자, 키워드 뉴스: 한줄)
 
+요청마다 스레드로 처리 (정적 파일은 API 호출을 기다리지 않음)
+같은 기사 요청이 동시에 들어오면 한 번만 가져오고 요약 (URL별 / URL+요약 타입별 합류)
+
+API:
+    POST /api/fetch-article   {url, summary_type}  -> JSON 하나
+    POST /api/fetch-articles  {items: [{id, url, summary_type}, ...]}
+        -> NDJSON 스트림 (기사별로 완료되는 대로 한 줄씩, 마지막 줄 {"done": true, ...})
+
 실행: python newsletter_server.py
 브라우저에서: http://localhost:8000
 """
 
 import http.server
-import socketserver
 import json
 import re
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import parse_qs, urlparse
-import requests
-from bs4 import BeautifulSoup
+
+import html_parser
+import http_client
+import llm_cache
 
 
 PORT = 8000
 
+# 일괄 가져오기 (/api/fetch-articles) 동시 처리 수 / 최대 기사 수
+BATCH_MAX_WORKERS = int(os.environ.get('ONDA_NEWSLETTER_BATCH_WORKERS', '6'))
+BATCH_MAX_ITEMS = 20
+
+# 요약 프롬프트 버전 (프롬프트 수정 시 올리면 llm_cache의 기존 응답 무효화)
+SUMMARY_PROMPT_VERSION = 1
+
 
 def fetch_article(url):
     """기사 URL에서 제목, 본문 추출"""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_client.get(url, timeout=10)
 
         # 인코딩 처리
         encoding = None
@@ -53,7 +67,7 @@ def fetch_article(url):
                 encoding = response.apparent_encoding or 'utf-8'
 
         response.encoding = encoding
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = html_parser.parse(response.text)
 
         # 제목 추출
         title = ''
@@ -188,13 +202,15 @@ def summarize_article(content, title, summary_type='short'):
             import openai
             openai.api_key = openai_key
 
-            response = openai.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=max_tokens,
-                temperature=0.3
-            )
-            summary = response.choices[0].message.content.strip()
+            summary = llm_cache.cached(
+                f'newsletter_{summary_type}', SUMMARY_PROMPT_VERSION, 'gpt-4o-mini', prompt,
+                lambda: openai.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[{"role": "user", "content": prompt}],
+                    max_tokens=max_tokens,
+                    temperature=0.3
+                ).choices[0].message.content
+            ).strip()
             return summary.strip('"\'')
         except Exception as e:
             print(f"OpenAI error: {e}")
@@ -205,12 +221,14 @@ def summarize_article(content, title, summary_type='short'):
             import anthropic
             client = anthropic.Anthropic(api_key=anthropic_key)
 
-            response = client.messages.create(
-                model="claude-3-haiku-20240307",
-                max_tokens=max_tokens,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            summary = response.content[0].text.strip()
+            summary = llm_cache.cached(
+                f'newsletter_{summary_type}', SUMMARY_PROMPT_VERSION, 'claude-3-haiku-20240307', prompt,
+                lambda: client.messages.create(
+                    model="claude-3-haiku-20240307",
+                    max_tokens=max_tokens,
+                    messages=[{"role": "user", "content": prompt}]
+                ).content[0].text
+            ).strip()
             return summary.strip('"\'')
         except Exception as e:
             print(f"Anthropic error: {e}")
@@ -237,6 +255,75 @@ def summarize_article(content, title, summary_type='short'):
         return title[:80] if title else ''
 
 
+# ============================================
+# 동시 요청 합류
+# ============================================
+
+class SingleFlight:
+    """같은 키의 작업이 진행 중이면 새로 실행하지 않고 그 결과를 기다림"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, func):
+        """
+        func() 결과 반환 (같은 key로 진행 중인 호출이 있으면 그 결과 공유, 예외도 그대로 전달)
+        결과는 공유되므로 수정하지 말 것
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = {'done': threading.Event(), 'result': None, 'error': None}
+                self._calls[key] = call
+
+        if leader:
+            try:
+                call['result'] = func()
+            except Exception as e:
+                call['error'] = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call['done'].set()
+        else:
+            call['done'].wait()
+
+        if call['error'] is not None:
+            raise call['error']
+        return call['result']
+
+
+_fetch_flight = SingleFlight()
+_summary_flight = SingleFlight()
+
+
+def process_article(url, summary_type='short'):
+    """
+    기사 가져오기 + 요약 (동시 요청 합류)
+    - 같은 URL은 요약 타입이 달라도 한 번만 가져옴
+    - 같은 (URL, 요약 타입)은 한 번만 요약
+
+    Returns:
+        dict: fetch_article 결과 + summary (요청마다 새 dict)
+    """
+    def fetch_and_summarize():
+        fetched = _fetch_flight.do(url, lambda: fetch_article(url))
+        result = dict(fetched)
+        if result['success']:
+            result['summary'] = summarize_article(result['content'], result['title'], summary_type)
+        return result
+
+    return dict(_summary_flight.do((url, summary_type), fetch_and_summarize))
+
+
+class NewsletterServer(http.server.ThreadingHTTPServer):
+    """요청마다 스레드 (종료 시 처리 중인 요청을 기다리지 않음)"""
+    daemon_threads = True
+    allow_reuse_address = True
+
+
 class NewsletterHandler(http.server.SimpleHTTPRequestHandler):
 
     def do_GET(self):
@@ -257,23 +344,61 @@ class NewsletterHandler(http.server.SimpleHTTPRequestHandler):
                 self.send_json({'success': False, 'error': 'URL required'})
                 return
 
-            # 기사 가져오기
-            result = fetch_article(url)
-
-            if result['success']:
-                # 요약 생성
-                summary = summarize_article(
-                    result['content'],
-                    result['title'],
-                    summary_type
-                )
-                result['summary'] = summary
+            # 기사 가져오기 + 요약 생성
+            result = process_article(url, summary_type)
 
             self.send_json(result)
             return
 
+        if self.path == '/api/fetch-articles':
+            content_length = int(self.headers['Content-Length'])
+            data = json.loads(self.rfile.read(content_length).decode('utf-8'))
+            self.stream_articles(data.get('items', []))
+            return
+
         self.send_error(404)
 
+    def stream_articles(self, items):
+        """
+        여러 기사를 동시에 가져와 요약하고 완료되는 대로 NDJSON 한 줄씩 전송
+        각 줄: process_article 결과 + id(요청의 id, 없으면 순서) + index
+        """
+        items = [item for item in items if item.get('url')][:BATCH_MAX_ITEMS]
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson; charset=utf-8')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+
+        executor = ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS)
+        futures = {
+            executor.submit(process_article, item['url'], item.get('summary_type', 'short')): (index, item)
+            for index, item in enumerate(items)
+        }
+        succeeded = 0
+        try:
+            for future in as_completed(futures):
+                index, item = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {'success': False, 'error': str(e)}
+                result.pop('content', None)  # 본문은 화면에서 쓰지 않음
+                result.update(id=item.get('id', index), index=index, url=item['url'])
+                succeeded += 1 if result.get('success') else 0
+                self.write_line(result)
+            self.write_line({'done': True, 'count': len(items), 'succeeded': succeeded})
+        except (BrokenPipeError, ConnectionResetError):
+            # 브라우저가 연결을 끊음 - 남은 작업 취소
+            pass
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def write_line(self, data):
+        self.wfile.write(json.dumps(data, ensure_ascii=False).encode('utf-8') + b'\n')
+        self.wfile.flush()
+
     def send_json(self, data):
         self.send_response(200)
         self.send_header('Content-Type', 'application/json; charset=utf-8')
@@ -292,7 +417,7 @@ class NewsletterHandler(http.server.SimpleHTTPRequestHandler):
 def main():
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
-    with socketserver.TCPServer(("", PORT), NewsletterHandler) as httpd:
+    with NewsletterServer(("", PORT), NewsletterHandler) as httpd:
         print("=" * 50)
         print("WeeklyON 뉴스레터 생성 서버")
         print("=" * 50)
@@ -8,15 +8,32 @@ B2B Hospitality Tech 기업 ONDA를 위한 맞춤 뉴스 수집기
 3. 숙박업 및 관련 스타트업 뉴스
 """
 
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
+from datetime import datetime
 import argparse
 import re
 import os
 import json
-from urllib.parse import quote
+import sqlite3
+import threading
+import time
+from collections import deque, namedtuple
+from itertools import combinations
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
+from urllib.parse import quote, urlsplit
 from email_sender import create_onda_html_email, send_email_gmail
+import http_client
+import article_cache
+import html_parser
+import llm_cache
+import listing_cache
+import run_metrics
+from history_store import HistoryStore
+from keyword_matcher import KeywordMatcher
+from article_record import Article, json_default
+from title_normalizer import (
+    STORY_STOPWORDS, title_words, key_pattern_hits, extract_core_keywords,
+    find_core_entities, find_title_company, topic_from_text,
+)
 # Slack 발송은 워크플로우에서 직접 처리 (CLI 옵션 비활성화됨)
 
 # .env 파일 로드 (python-dotenv가 설치되어 있으면 사용)
@@ -36,56 +53,68 @@ except ImportError:
 # 스크랩 히스토리 관리 (중복 기사 방지)
 # ============================================
 
-HISTORY_FILE = os.path.join(os.path.dirname(__file__), 'scrape_history.json')
+HISTORY_FILE = os.path.join(os.path.dirname(__file__), 'scrape_history.json')  # 구버전 (SQLite로 자동 이전)
+HISTORY_DB_FILE = os.path.join(os.path.dirname(__file__), 'scrape_history.sqlite3')
 HISTORY_DAYS = 7  # 7일간 히스토리 유지
 
+# 뉴스 소스 주소 (로컬 모의 서버로 바꿀 때 환경변수로 지정 - benchmarks/mock_services.py)
+NAVER_API_URL = os.environ.get('ONDA_NAVER_API_URL', 'https://openapi.naver.com').rstrip('/')
+NAVER_SEARCH_URL = os.environ.get('ONDA_NAVER_SEARCH_URL', 'https://search.naver.com').rstrip('/')
+NAVER_NEWS_URL = os.environ.get('ONDA_NAVER_NEWS_URL', 'https://news.naver.com').rstrip('/')
+GOOGLE_SEARCH_URL = os.environ.get('ONDA_GOOGLE_SEARCH_URL', 'https://www.google.com').rstrip('/')
+
+
+def _open_history_store():
+    return HistoryStore(db_file=HISTORY_DB_FILE, legacy_json_file=HISTORY_FILE)
+
 
 def load_scrape_history():
     """
     스크랩 히스토리 로드
+    SQLite 저장소에서 읽고, 7일(7 x 24시간) 이상 지난 항목은 삭제로 정리
+    (기존 scrape_history.json은 최초 1회 자동 이전)
     """
-    if not os.path.exists(HISTORY_FILE):
-        return {'articles': [], 'last_updated': None}
-
     try:
-        with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
-            history = json.load(f)
-
-        # 오래된 항목 제거 (7일 이상)
-        cutoff = datetime.now() - timedelta(days=HISTORY_DAYS)
-        history['articles'] = [
-            a for a in history['articles']
-            if datetime.fromisoformat(a['scraped_at']) > cutoff
-        ]
-
-        return history
-    except Exception:
-        return {'articles': [], 'last_updated': None}
+        store = _open_history_store()
+        store.prune(HISTORY_DAYS)
+        return {
+            'articles': store.entries(),
+            'last_updated': store.get_meta('last_updated'),
+            'store': store
+        }
+    except (sqlite3.Error, OSError, ValueError) as e:
+        print(f"히스토리 로드 실패 (이전 스크랩 기사 제외 없이 진행): {e}")
+        return {'articles': [], 'last_updated': None, 'store': None}
 
 
 def save_scrape_history(history):
     """
     스크랩 히스토리 저장
+    add_to_history로 추가된 새 항목만 INSERT (전체 재작성 없음)
     """
     history['last_updated'] = datetime.now().isoformat()
     try:
-        with open(HISTORY_FILE, 'w', encoding='utf-8') as f:
-            json.dump(history, f, ensure_ascii=False, indent=2)
+        if history.get('store') is None:
+            history['store'] = _open_history_store()
+        history['store'].add(history.get('pending', []))
+        history['pending'] = []
     except Exception as e:
         print(f"히스토리 저장 실패: {e}")
 
 
 def add_to_history(articles, history):
     """
-    스크랩한 기사를 히스토리에 추가
+    스크랩한 기사를 히스토리에 추가 (save_scrape_history 호출 시 저장)
     """
     now = datetime.now().isoformat()
     for article in articles:
-        history['articles'].append({
+        entry = {
             'title': article['title'],
             'link': article['link'],
             'scraped_at': now
-        })
+        }
+        history['articles'].append(entry)
+        history.setdefault('pending', []).append(entry)
     return history
 
 
@@ -113,84 +142,90 @@ def is_already_scraped(article, history):
     - 같은 링크
     - 또는 제목 유사도 50% 이상 (기존 70%에서 하향)
     - 또는 핵심 키워드가 동일한 경우
-    """
-    for hist_article in history['articles']:
-        # 같은 링크면 중복
-        if article['link'] == hist_article['link']:
-            return True
+    - 또는 같은 스토리인 경우
 
-        # 제목 유사도 체크 (50% 이상이면 중복 - 기존 70%에서 하향)
-        similarity = calculate_similarity(article['title'], hist_article['title'])
-        if similarity >= 0.5:
-            return True
+    여러 기사를 확인할 때는 HistoryDedupIndex를 사용 (히스토리 토큰화 1회)
+    """
+    return HistoryDedupIndex(history).is_scraped(article)
 
-        # 핵심 키워드 기반 중복 체크 (새로 추가)
-        # 제목에서 핵심 키워드 추출하여 비교
-        if has_same_core_keywords(article['title'], hist_article['title']):
-            return True
 
-        # 같은 스토리인지 체크
-        # (히스토리 기사는 summary가 없을 수 있으므로 간단히 체크)
-        hist_as_article = {'title': hist_article['title'], 'summary': ''}
-        if is_same_story(article, hist_as_article):
-            return True
-
-    return False
+class HistoryDedupIndex:
+    """
+    히스토리 중복 판단용 역색인
 
+    히스토리 제목을 한 번만 토큰화하고, 토큰/엔티티 -> 항목 역색인을 만들어
+    새 기사는 후보 토큰을 공유하는 항목과만 비교 (결과는 전체 비교와 동일)
 
-def has_same_core_keywords(title1, title2):
-    """
-    두 제목이 같은 핵심 키워드를 공유하는지 확인
-    예: "해외숙박 예약 플랫폼 이용자 절반 이상 피해 경험"
-        "해외숙박 예약 플랫폼 이용자 54.6% 피해 경험"
-    -> 핵심 키워드: 해외숙박, 플랫폼, 이용자, 피해 -> 중복
+    후보 키 (각 중복 규칙이 참이 되려면 반드시 하나 이상 공유해야 하는 것):
+    - ('w', 제목 단어): 제목 유사도, 같은 스토리(제목 공통 단어 3개)
+    - ('p', 핵심 패턴): 핵심 패턴 2개 공유 시 유사도 보정
+    - ('k', 핵심 키워드): has_same_core_keywords (모든 분기가 공통 키워드 1개 이상 필요)
+    - ('c', 회사명): 같은 스토리(같은 회사 + 이벤트/금액)
     """
-    import re
 
-    # 불용어 (의미 없는 단어)
-    stopwords = {
-        '의', '를', '을', '이', '가', '은', '는', '에', '에서', '와', '과',
-        '로', '으로', '도', '만', '더', '등', '및', '또', '그', '저', '이런',
-        '것', '수', '중', '후', '전', '약', '각', '매', '내', '외', '상', '하',
-        '대', '소', '신', '구', '위', '아래', '앞', '뒤', '간', '별', '당',
-        '말', '년', '월', '일', '시', '분', '초', '명', '개', '곳', '번',
-        '절반', '이상', '최대', '최소', '약', '경험', '집중', '새해', '올해'
-    }
+    def __init__(self, history):
+        self.links = set()  # 정규화된 링크 (추적 파라미터/대소문자 차이 무시, HistoryStore와 같은 기준)
+        self.entries = []
+        self.postings = {}
 
-    # 중요 회사명/브랜드 (이것만 같아도 같은 주제일 가능성 높음)
-    important_entities = [
-        '야놀자', '야놀자리서치', '여기어때', '에어비앤비', '부킹닷컴', '익스피디아',
-        '트립닷컴', '아고다', '호텔스닷컴', '마이리얼트립', '온다', 'onda',
-        '네이버', '카카오', '쏘카', '인터파크'
-    ]
+        for hist_article in history['articles']:
+            self.links.add(self._link_key(hist_article['link']))
+            # 히스토리 기사는 summary가 없을 수 있으므로 제목만 사용
+            features = get_article_features({'title': hist_article['title'], 'summary': ''})
+            idx = len(self.entries)
+            self.entries.append(features)
+            for key in self._candidate_keys(features):
+                self.postings.setdefault(key, []).append(idx)
 
-    # 핵심 키워드 추출 (2글자 이상, 숫자/% 제외, 불용어 제외)
-    def extract_keywords(title):
-        # 숫자와 % 제거
-        title_clean = re.sub(r'\d+\.?\d*%?', '', title)
-        # 특수문자 제거 (한글, 영문, 숫자만 남김)
-        title_clean = re.sub(r'[^\w\s가-힣]', ' ', title_clean)
-        # 단어 분리
-        words = title_clean.lower().split()
-        # 2글자 이상, 불용어 제외
-        keywords = set(w for w in words if len(w) >= 2 and w not in stopwords)
-        return keywords
-
-    def find_entities(title):
-        """제목에서 중요 엔티티(회사명) 찾기"""
-        title_lower = title.lower()
+    @staticmethod
+    def _link_key(link):
+        try:
+            return article_cache.normalize_url(link)
+        except ValueError:
+            return link
+
+    @staticmethod
+    def _candidate_keys(features):
+        keys = {('w', w) for w in features.words}
+        keys.update(('p', p) for p in features.key_hits)
+        keys.update(('k', k) for k in features.core_keywords)
+        keys.update(('c', c) for c in features.topic['companies'])
+        return keys
+
+    def candidates(self, features):
+        """토큰을 하나라도 공유하는 히스토리 항목 번호"""
         found = set()
-        for entity in important_entities:
-            if entity.lower() in title_lower:
-                found.add(entity.lower())
+        for key in self._candidate_keys(features):
+            found.update(self.postings.get(key, ()))
         return found
 
-    kw1 = extract_keywords(title1)
-    kw2 = extract_keywords(title2)
+    def is_scraped(self, article):
+        # 같은 링크면 중복 (정규화된 링크 비교)
+        if self._link_key(article['link']) in self.links:
+            return True
+
+        features = get_article_features(article)
+        for idx in self.candidates(features):
+            hist = self.entries[idx]
+
+            # 제목 유사도 체크 (50% 이상이면 중복 - 기존 70%에서 하향)
+            if features.similarity(hist) >= 0.5:
+                return True
+
+            # 핵심 키워드 기반 중복 체크
+            if features.same_core_keywords(hist):
+                return True
+
+            # 같은 스토리인지 체크
+            if features.same_story(hist):
+                return True
 
+        return False
+
+
+def core_keywords_match(kw1, entities1, kw2, entities2):
+    """미리 추출한 핵심 키워드/엔티티로 has_same_core_keywords 판단"""
     # 중요 엔티티(회사명) 체크 - 같은 회사가 언급되면 중복 가능성 높음
-    entities1 = find_entities(title1)
-    entities2 = find_entities(title2)
     common_entities = entities1 & entities2
 
     if not kw1 or not kw2:
@@ -215,21 +250,44 @@ def has_same_core_keywords(title1, title2):
     return False
 
 
-def filter_already_scraped(articles, history, silent=False):
+def has_same_core_keywords(title1, title2):
     """
-    이미 스크랩한 기사 필터링
+    두 제목이 같은 핵심 키워드를 공유하는지 확인
+    예: "해외숙박 예약 플랫폼 이용자 절반 이상 피해 경험"
+        "해외숙박 예약 플랫폼 이용자 54.6% 피해 경험"
+    -> 핵심 키워드: 해외숙박, 플랫폼, 이용자, 피해 -> 중복
     """
-    new_articles = []
-    skipped = 0
+    return core_keywords_match(
+        extract_core_keywords(title1), find_core_entities(title1),
+        extract_core_keywords(title2), find_core_entities(title2)
+    )
+
+
+def iter_unscraped(articles, history, counts=None):
+    """
+    이미 스크랩한 기사 제외 (스트리밍 단계 - 기사를 하나씩 받아서 통과한 기사만 yield)
+    제외한 개수는 counts['scraped']에 누적
+    """
+    counts = counts if counts is not None else {}
+    counts.setdefault('scraped', 0)
+    index = HistoryDedupIndex(history)
 
     for article in articles:
-        if is_already_scraped(article, history):
-            skipped += 1
+        if index.is_scraped(article):
+            counts['scraped'] += 1
         else:
-            new_articles.append(article)
+            yield article
+
+
+def filter_already_scraped(articles, history, silent=False):
+    """
+    이미 스크랩한 기사 필터링
+    """
+    counts = {}
+    new_articles = list(iter_unscraped(articles, history, counts))
 
-    if not silent and skipped > 0:
-        print(f"   -> 이전 스크랩 기사 {skipped}개 제외")
+    if not silent and counts['scraped'] > 0:
+        print(f"   -> 이전 스크랩 기사 {counts['scraped']}개 제외")
 
     return new_articles
 
@@ -315,6 +373,391 @@ MARKET_DATA_KEYWORDS = [
     '이용자', '예약', '객실점유율', 'ADR', 'RevPAR'
 ]
 
+# ============================================
+# 점수/분류용 키워드 그룹 (calculate_industry_impact_score 등)
+# 모든 그룹을 import 시 하나의 매처로 컴파일 -> 기사당 텍스트 한 번만 훑음
+# ============================================
+
+# 관련도 점수 보너스 (숙박/여행 맥락일 때만, 목록 순서대로 첫 번째 하나)
+RELEVANCE_INVESTMENT_BONUS_KEYWORDS = ['투자유치', '펀딩', '시리즈a', '시리즈b', '시리즈c']
+RELEVANCE_POLICY_BONUS_KEYWORDS = ['규제 완화', '규제 강화', '법안', '허용', '금지', '단속']
+
+# 관련 기사 판단용 추가 키워드 (OTA/숙박/정책/트래블테크 키워드 외)
+RELEVANT_EXTRA_KEYWORDS = ['관광', '여행', '투어', '레저']
+
+# 숙박업 직접 관련 정책
+ACCOMMODATION_POLICY_KEYWORDS = [
+    '숙박업법', '공유숙박', '생활숙박', '숙박업 규제', '숙박시설',
+    '호텔업', '숙박업 허가', '숙박업 등록', '객실 규제'
+]
+
+# 일반 관광 정책 (숙박과 직접 관련 없음)
+GENERAL_TOURISM_KEYWORDS = [
+    '관광진흥', '관광정책', 'K-관광', '관광산업', '인바운드', '아웃바운드',
+    '관광객 유치', '관광 활성화'
+]
+
+# 제목에 있으면 보너스인 키워드
+TITLE_IMPACT_KEYWORDS = INVESTMENT_KEYWORDS + REGULATION_KEYWORDS[:5] + ['출시', '런칭', '오픈']
+
+# 제목 회사명/업계 키워드
+TITLE_COMPANY_KEYWORDS = [
+    # 주요 OTA/플랫폼
+    '야놀자', '여기어때', '에어비앤비', '아고다', '부킹닷컴', '트립닷컴',
+    '마이리얼트립', '호텔스닷컴', '익스피디아', '트립어드바이저',
+    # 호텔 체인
+    '메리어트', '힐튼', '아코르', '하얏트', '신라호텔', '롯데호텔',
+    # 업계 키워드
+    '숙박업', '호텔업', 'OTA', '여행업', '관광업', '호스피탈리티'
+]
+
+# ONDA 핵심 비즈니스와 직접 관련된 B2B 솔루션/IT 키워드
+B2B_SOLUTION_KEYWORDS = [
+    # 숙박 솔루션
+    'pms', 'cms', 'rms', '채널매니저', '채널 매니저', '예약 시스템',
+    '숙박 솔루션', '호텔 솔루션', '숙박업 솔루션', '통합 관리',
+    '객실 관리', '예약 관리', '재고 관리', '요금 관리',
+    # B2B 키워드
+    'b2b', 'saas', 'api', '연동', '플랫폼 연동', 'ota 연동',
+    # 업계 행사
+    '호텔페어', '호텔쇼', '관광박람회', 'itb', 'wtm',
+    # 기술 키워드
+    '자동화', 'ai 도입', '디지털 전환', 'dx', '클라우드'
+]
+
+# 호스피탈리티 업계의 AI 도입, 디지털 전환 관련
+AI_HOSPITALITY_KEYWORDS = [
+    # AI + 숙박/호텔 조합
+    'ai 호텔', 'ai 숙박', 'ai 예약', 'ai 플랫폼', 'ai 도입',
+    '인공지능 호텔', '인공지능 숙박', '인공지능 예약',
+    # 숙박업 디지털 전환
+    '숙박 ai', '호텔 ai', '숙박플랫폼', '플랫폼 탈출',
+    '직접 예약', 'd2c', '자체 예약', '수수료 절감',
+    # 챗봇/자동화
+    '호텔 챗봇', '숙박 챗봇', '예약 챗봇', '자동 응대',
+    # 데이터/분석
+    '수요 예측', '가격 최적화', '동적 가격', '레비뉴 매니지먼트'
+]
+
+# 회사별 중요도 점수 (업계 기업 소식 우선)
+# Tier 0: 자사 ONDA (+80점) - 상향
+# Tier 1: 국내 대형 OTA (+60점) - 상향: 야놀자, 여기어때, 마이리얼트립
+# Tier 2: 국내 주요 플랫폼 (+50점) - 상향: 네이버, 카카오, 쏘카, 인터파크트리플
+# Tier 3: 글로벌 대형 OTA (+50점) - 상향: 에어비앤비, 부킹홀딩스, 익스피디아, 트립닷컴
+# Tier 4: 글로벌 메타서치/검색 (+40점) - 상향
+# Tier 5: 국내 중소 플랫폼 (+45점) - 상향
+# Tier 6: 글로벌 숙박/호텔 플랫폼 (+35점) - 상향
+# Tier 7: 호텔 체인/숙박업체 (+40점) - 신규 추가
+# 업계 키워드: PMS, CMS, GDS 등 (+35점)
+COMPANY_TIERS = {
+    # Tier 0: 자사 (최고 우선순위)
+    0: {
+        'score': 80,
+        'label': '자사',
+        'keywords': ['온다', 'onda']
+    },
+    # Tier 1: 국내 대형 OTA (시총/기업가치 높음)
+    1: {
+        'score': 60,
+        'label': '국내대형OTA',
+        'keywords': ['야놀자', 'nol', '놀유니버스', '여기어때', '마이리얼트립', '마리트']
+    },
+    # Tier 2: 국내 주요 플랫폼 (대기업/상장사)
+    2: {
+        'score': 50,
+        'label': '국내플랫폼',
+        'keywords': ['네이버', '카카오', '쏘카', '인터파크트리플', '인터파크', '위메프', '티몬']
+    },
+    # Tier 3: 글로벌 대형 OTA (시총 수십~수백조)
+    3: {
+        'score': 50,
+        'label': '글로벌대형OTA',
+        'keywords': ['에어비앤비', 'airbnb', '부킹닷컴', 'booking.com', '부킹홀딩스',
+                    '익스피디아', 'expedia', '트립닷컴', 'trip.com']
+    },
+    # Tier 4: 글로벌 메타서치/검색엔진 (트래픽 대형)
+    4: {
+        'score': 40,
+        'label': '메타서치',
+        'keywords': ['구글호텔', 'google hotel', '트립어드바이저', 'tripadvisor',
+                    '스카이스캐너', 'skyscanner', '카약', 'kayak', '트리바고', 'trivago',
+                    '호텔스컴바인', '메타서치', '여행 검색 엔진', '호텔 검색 플랫폼']
+    },
+    # Tier 5: 국내 중소 플랫폼 (국내라 해외보다 우선)
+    5: {
+        'score': 45,
+        'label': '국내중소OTA',
+        'keywords': ['트립비토즈', '타이드스퀘어', '크리에이트립', '세시간전',
+                    '더케이교직원나라', '교직원나라']
+    },
+    # Tier 6: 글로벌 숙박/호텔 플랫폼
+    6: {
+        'score': 35,
+        'label': '글로벌숙박',
+        'keywords': ['아고다', 'agoda', '호텔스닷컴', 'hotels.com']
+    },
+    # Tier 7: 호텔 체인/숙박업체 (점수 낮춤 - B2B 고객 아님)
+    7: {
+        'score': 15,
+        'label': '호텔체인',
+        'keywords': ['메리어트', 'marriott', '힐튼', 'hilton', '아코르', 'accor',
+                    'ihg', '하얏트', 'hyatt', '신라호텔', '롯데호텔', '파라다이스호텔',
+                    '조선호텔', '그랜드하얏트', '호텔신라', '워커힐']
+    },
+    # Tier 8: 중소형 숙박 (ONDA 주요 고객층)
+    8: {
+        'score': 35,
+        'label': '중소형숙박',
+        'keywords': ['펜션', '모텔', '게스트하우스', '민박', '풀빌라', '호스텔',
+                    '중소형 숙박', '소형 숙박', '개인 숙박', '독채', '한옥스테이']
+    },
+}
+
+# Tier 순서대로 펼친 (tier 정보, 키워드) 목록 - 가장 앞의 매칭이 우선순위가 가장 높은 회사
+COMPANY_TIER_KEYWORDS = [
+    (COMPANY_TIERS[tier], keyword)
+    for tier in sorted(COMPANY_TIERS.keys())
+    for keyword in COMPANY_TIERS[tier]['keywords']
+]
+
+# 업계 키워드 (회사 특정 안되어도 업계 전체 이슈면 중요)
+INDUSTRY_KEYWORDS = {
+    'score': 35,
+    'label': '업계이슈',
+    'keywords': ['여행/숙박/호텔업계', '여행/숙박/호텔산업', '숙박 위탁 운영', '숙박 예약',
+                '생활형 숙박시설', 'gds', 'pms', 'cms', 'ota', '온라인여행사',
+                '호스피탈리티', '숙박업', '숙박산업', '호텔산업', '객실 점유율',
+                'adr', 'revpar', '채널매니저', '예약 시스템']
+}
+
+# 프로모션/이벤트/할인 (일반적인 마케팅 기사는 뉴스 가치가 낮음)
+IMPACT_PROMO_KEYWORDS = [
+    '할인', '프로모션', '이벤트', '쿠폰', '특가', '세일',
+    '얼리버드', '최대 할인', '% 할인', '무료', '경품',
+    '추첨', '응모', '선착순', '한정', '페스타', '위크'
+]
+
+# 호텔 B2C (패키지, 뷔페, F&B, 다이닝 등은 B2B 숙박 IT와 관련 낮음)
+HOTEL_B2C_KEYWORDS = [
+    # 패키지/상품
+    '패키지', '상품 출시', '신년 패키지', '연말 패키지', '겨울 패키지',
+    '해돋이', '새해맞이', '연말연시',
+    # F&B/다이닝
+    '뷔페', 'f&b', '다이닝', '레스토랑', '조식', '브런치',
+    '먹거리', '맛집', '미식', '셰프', '메뉴',
+    # 호텔 시설/서비스 (B2C)
+    '스파', '수영장', '피트니스', '웨딩', '연회', '컨벤션',
+    '호캉스', '스테이케이션', '휴식'
+]
+
+HOTEL_INDUSTRY_KEYWORDS = ['호텔업계', '호텔·리조트', '특급호텔', '5성급', '호텔 업계']
+
+# 중요 발표 (기자간담회, 신제품 출시 등)
+MAJOR_EVENT_KEYWORDS = [
+    '기자간담회', '기자회견', '컨퍼런스', '신제품', '신규 서비스',
+    '플랫폼 개편', '리브랜딩', '합작', '제휴', 'MOU', '협약'
+]
+
+# 지방정부/지방공기업 (ONDA 비즈니스와 관련 낮음)
+LOCAL_GOV_KEYWORDS = [
+    '지자체', '도청', '시청', '군청', '구청',
+    '도지사', '시장', '군수', '구청장',
+    '지방관광공사', '도관광공사', '시관광공사',
+    # 지방관광공사/재단 (전체 - 인천 등 누락분 추가)
+    '경기관광공사', '강원관광재단', '충남관광재단', '충북관광재단',
+    '전남관광재단', '전북관광재단', '경남관광재단', '경북관광공사',
+    '인천관광공사', '부산관광공사', '대구관광재단', '대전관광공사',
+    '광주관광재단', '울산관광재단', '제주관광공사', '세종관광재단',
+    # 지역 이슈
+    '지역 관광', '지역 축제', '지역 행사', '군 축제', '읍면동',
+    '관광안내소', '관광 인프라', '지역 명소', '옹진군', '선재도'
+]
+
+# 신년사/취임사 등 일반 행정 기사
+CEREMONIAL_KEYWORDS = [
+    '신년사', '취임사', '이취임', '시무식', '기념식',
+    '신년 인사', '신년 메시지', '새해 인사', '새해 메시지',
+    '시정연설', '도정연설', '군정연설', '구정연설'
+]
+
+# 직접적 지원책 (지방정부 페널티 감소) - 숙박업 직접 관련만
+DIRECT_SUPPORT_KEYWORDS = [
+    '숙박업 지원', '숙박시설 지원', '숙박업체 지원',
+    '소상공인 지원', '창업 지원', '융자', '대출 지원',
+    '숙박업 보조금', '숙박 지원금'
+]
+
+# 비판/이슈 기사 (기자 취재 기사, 플랫폼 횡포/갑질, 논란 등)
+CRITICAL_KEYWORDS = [
+    '갑질', '횡포', '논란', '피해', '불만', '분쟁', '고발',
+    '제재', '과징금', '벌금', '소송', '고소', '수사', '조사',
+    '의혹', '비판', '문제점', '부작용', '위법', '불법',
+    '독점', '불공정', '폭리', '착취', '임금체불', '해고'
+]
+
+# 사건/사고, 해외 지명
+INCIDENT_KEYWORDS = ['폭발', '화재', '사망', '부상', '참사', '재난', '테러', '총격', '붕괴', '침몰', '추락']
+FOREIGN_KEYWORDS = ['스위스', '미국', '일본', '중국', '유럽', '태국', '베트남', '프랑스', '독일', '영국', '호주', '뉴질랜드', '캐나다', '멕시코', '브라질', '인도네시아', '필리핀', '말레이시아', '이탈리아', '스페인']
+
+# 정치 기사 (정치인 개인의 사적 이슈, 수사, 기소, 스캔들 등은 산업 뉴스와 무관)
+POLITICS_KEYWORDS = [
+    # 정치인/정당 관련 (한국)
+    '대통령', '전 대통령', '국회의원', '장관', '전 장관',
+    '여당', '야당', '민주당', '국민의힘', '정치인',
+    # 해외 정치인 (추가)
+    '트럼프', 'trump', '바이든', 'biden', '오바마', '시진핑',
+    '푸틴', '마크롱', '기시다', '백악관', 'white house',
+    # 정치 스캔들/수사 관련 (강화)
+    '기소', '구속', '체포', '영장', '검찰', '경찰 수사',
+    '뇌물', '횡령', '배임', '비리', '스캔들', '탄핵',
+    '청문회', '국정감사', '특검', '공소', '재판', '불구속',
+    '피의자', '혐의', '압수수색',
+    # 성범죄/스캔들 관련 (추가)
+    '엡스타인', 'epstein', '성범죄', '성추행', '성폭행',
+    # 정치인 가족/측근 (강화)
+    '문다혜', '문재인', '윤석열', '김건희',
+    '딸', '아들', '부인', '남편', '측근', '비서', '사위', '며느리',
+    # 선거 관련
+    '대선', '총선', '지방선거', '후보', '공천', '출마'
+]
+
+# 호스피탈리티/숙박 맥락 키워드
+HOSPITALITY_CONTEXT_KEYWORDS = [
+    # 숙박 관련
+    '숙박', '호텔', '객실', '예약', '체크인', '체크아웃', '숙소',
+    '리조트', '펜션', '게스트하우스', '모텔', '민박', '풀빌라',
+    # 여행 관련
+    '여행', '관광', '투어', '휴양', '휴가', '여행객', '관광객',
+    # 플랫폼/서비스 관련
+    'OTA', '플랫폼', '앱', '예약 서비스', '숙박 플랫폼',
+    # 업계 관련
+    '호스피탈리티', '숙박업', '호텔업', '여행업', '관광업',
+    # 비즈니스 관련
+    '투자', '펀딩', '인수', '합병', '실적', '매출', '영업이익'
+]
+
+# 비관련 맥락 키워드 (이 키워드가 많으면 숙박/여행과 관련 없을 가능성)
+UNRELATED_CONTEXT_KEYWORDS = [
+    # 스포츠
+    '야구', '축구', '농구', '배구', '경기장', '스타디움', '관중',
+    '프로야구', 'KBO', 'K리그', '올림픽', '월드컵',
+    # 연예/엔터
+    '드라마', '영화', '콘서트', '공연', '연예인', '아이돌', '배우',
+    # 정치
+    '국회', '정당', '선거', '후보',
+    # 기타
+    '주식', '코스피', '코스닥', '부동산', '아파트', '분양'
+]
+
+# 주요 회사 그룹 (같은 그룹은 동일 회사로 취급, get_main_company용)
+# 주의: 순서가 중요함! 더 구체적인 키워드를 먼저 체크
+MAIN_COMPANY_GROUPS = [
+    # Tier 1: 국내 대형 OTA (야놀자를 먼저 체크해야 "야놀자리서치...온다" 같은 기사에서 야놀자로 분류됨)
+    ('야놀자', ['야놀자', 'nol', '놀유니버스', '놀 유니버스', '야놀자리서치', '야놀자클라우드']),
+    # Tier 0: 자사 (온다는 동사로 오인될 수 있어 나중에 체크)
+    ('온다', ['onda']),  # '온다'는 동사와 혼동되므로 영문만 사용
+    ('여기어때', ['여기어때', '위드이노베이션']),
+    ('마이리얼트립', ['마이리얼트립', '마리트']),
+    # Tier 2: 국내 주요 플랫폼
+    ('네이버', ['네이버']),
+    ('카카오', ['카카오']),
+    ('쏘카', ['쏘카', 'socar']),
+    ('인터파크', ['인터파크트리플', '인터파크']),
+    ('티몬', ['티몬', 'tmon']),
+    ('위메프', ['위메프']),
+    # Tier 3: 글로벌 대형 OTA
+    ('에어비앤비', ['에어비앤비', 'airbnb']),
+    ('부킹닷컴', ['부킹닷컴', 'booking.com', '부킹홀딩스', '부킹']),
+    ('익스피디아', ['익스피디아', 'expedia']),
+    ('트립닷컴', ['트립닷컴', 'trip.com']),
+    # Tier 4: 글로벌 메타서치
+    ('구글호텔', ['구글호텔', 'google hotel']),
+    ('트립어드바이저', ['트립어드바이저', 'tripadvisor']),
+    ('스카이스캐너', ['스카이스캐너', 'skyscanner']),
+    ('카약', ['카약', 'kayak']),
+    ('트리바고', ['트리바고', 'trivago']),
+    ('호텔스컴바인', ['호텔스컴바인']),
+    # Tier 5: 국내 중소 OTA
+    ('트립비토즈', ['트립비토즈']),
+    ('타이드스퀘어', ['타이드스퀘어']),
+    ('크리에이트립', ['크리에이트립']),
+    ('세시간전', ['세시간전']),
+    ('더케이교직원나라', ['더케이교직원나라', '교직원나라']),
+    # Tier 6: 글로벌 숙박
+    ('아고다', ['아고다', 'agoda']),
+    ('호텔스닷컴', ['호텔스닷컴', 'hotels.com']),
+]
+
+# 주요 이슈/주제 키워드 그룹 (get_article_topic용, 순서대로 우선)
+ARTICLE_TOPIC_GROUPS = [
+    ('생활숙박시설', ['생활숙박시설', '생숙', '레지던스', '주거용', '불법숙박', '숙박시설 규제']),
+    ('외국인관광객', ['외국인 관광객', '외래 관광객', '인바운드', '방한 관광객', '관광객 유치']),
+    ('항공', ['항공', '비행기', '공항', '노선', '취항', '항공권']),
+    ('크루즈', ['크루즈', '유람선', '선박']),
+    ('카지노', ['카지노', '복합리조트', 'ir']),
+    ('면세점', ['면세점', '면세']),
+    ('호캉스', ['호캉스', '스테이케이션', '호텔 패키지']),
+    ('투자유치', ['투자 유치', '시리즈', '펀딩', '투자금']),
+    ('인수합병', ['인수', '합병', 'm&a', '매각']),
+    ('ipo', ['ipo', '상장', '기업공개']),
+    ('실적발표', ['실적', '매출', '영업이익', '분기']),
+]
+
+# (그룹 이름, 키워드) 로 펼친 목록 - 가장 앞의 매칭이 우선
+MAIN_COMPANY_ALIASES = [(name, alias) for name, aliases in MAIN_COMPANY_GROUPS for alias in aliases]
+ARTICLE_TOPIC_KEYWORDS = [(name, kw) for name, keywords in ARTICLE_TOPIC_GROUPS for kw in keywords]
+
+
+def _lowered(keywords):
+    return [kw.lower() for kw in keywords]
+
+
+# 텍스트는 항상 소문자로 변환 후 매칭
+# - 기존에 kw.lower()로 비교하던 그룹은 소문자로 등록
+# - kw 그대로 비교하던 그룹은 그대로 등록 (대문자가 섞인 키워드는 기존처럼 매칭되지 않음)
+SCORING_MATCHER = KeywordMatcher({
+    'onda': ['온다', 'onda'],
+    'ota': _lowered(OTA_KEYWORDS),
+    'traveltech': _lowered(TRAVELTECH_KEYWORDS),
+    'accommodation': _lowered(ACCOMMODATION_KEYWORDS),
+    'policy': _lowered(POLICY_KEYWORDS),
+    'relevance_investment': RELEVANCE_INVESTMENT_BONUS_KEYWORDS,
+    'relevance_policy': RELEVANCE_POLICY_BONUS_KEYWORDS,
+    'relevant_extra': _lowered(RELEVANT_EXTRA_KEYWORDS),
+    'investment': _lowered(INVESTMENT_KEYWORDS),
+    'regulation': _lowered(REGULATION_KEYWORDS),
+    'accommodation_policy': ACCOMMODATION_POLICY_KEYWORDS,
+    'general_tourism': GENERAL_TOURISM_KEYWORDS,
+    'newtech': _lowered(NEWTECH_KEYWORDS),
+    'market_data': _lowered(MARKET_DATA_KEYWORDS),
+    'title_impact': _lowered(TITLE_IMPACT_KEYWORDS),
+    'title_company': _lowered(TITLE_COMPANY_KEYWORDS),
+    'b2b_solution': _lowered(B2B_SOLUTION_KEYWORDS),
+    'ai_hospitality': _lowered(AI_HOSPITALITY_KEYWORDS),
+    'company_tier': _lowered(kw for _, kw in COMPANY_TIER_KEYWORDS),
+    'industry': _lowered(INDUSTRY_KEYWORDS['keywords']),
+    'promo': IMPACT_PROMO_KEYWORDS,
+    'hotel_b2c': HOTEL_B2C_KEYWORDS,
+    'hotel_industry': HOTEL_INDUSTRY_KEYWORDS,
+    'major_event': MAJOR_EVENT_KEYWORDS,
+    'local_gov': LOCAL_GOV_KEYWORDS,
+    'ceremonial': CEREMONIAL_KEYWORDS,
+    'direct_support': DIRECT_SUPPORT_KEYWORDS,
+    'critical': CRITICAL_KEYWORDS,
+    'incident': INCIDENT_KEYWORDS,
+    'foreign': FOREIGN_KEYWORDS,
+    'politics': POLITICS_KEYWORDS,
+    'hospitality_context': HOSPITALITY_CONTEXT_KEYWORDS,
+    'unrelated_context': UNRELATED_CONTEXT_KEYWORDS,
+    'main_company': [alias for _, alias in MAIN_COMPANY_ALIASES],
+    'article_topic': [kw for _, kw in ARTICLE_TOPIC_KEYWORDS],
+})
+
+
+def match_keywords(text):
+    """소문자 텍스트의 키워드 그룹 매칭 결과 ({그룹: 키워드 번호 튜플}, 같은 텍스트는 캐시)"""
+    return SCORING_MATCHER.match(text)
+
 # ============================================
 # 비뉴스 도메인 필터 (블로그, 브런치 등 제외)
 # ============================================
@@ -414,6 +857,63 @@ def is_low_value_article(article):
     return False
 
 
+NON_NEWS_FILTER_COUNTS = ('non_news', 'old', 'promo', 'low_value')
+
+
+def _non_news_reason(article):
+    """제외 사유 (NON_NEWS_FILTER_COUNTS 중 하나, 통과하면 None)"""
+    # 1. 비뉴스 소스 필터링
+    if is_non_news_source(article.get('link', '')):
+        return 'non_news'
+
+    # 2. 시간 범위 내 기사만 포함
+    if not article.get('is_recent', False):
+        return 'old'
+
+    # 3. 홍보성 기사 필터링
+    if is_promotional_article(article):
+        return 'promo'
+
+    # 4. 낮은 가치 기사 필터링
+    if is_low_value_article(article):
+        return 'low_value'
+
+    return None
+
+
+def iter_news_articles(articles, counts=None):
+    """
+    비뉴스/오래된/홍보성/낮은 가치 기사 제외 (스트리밍 단계)
+    사유별 제외 개수는 counts['non_news'], counts['old'], ...에 누적
+    """
+    counts = counts if counts is not None else {}
+    for name in NON_NEWS_FILTER_COUNTS:
+        counts.setdefault(name, 0)
+
+    for article in articles:
+        reason = _non_news_reason(article)
+        if reason:
+            counts[reason] += 1
+        else:
+            yield article
+
+
+def print_non_news_counts(counts):
+    """iter_news_articles 사유별 제외 개수 출력"""
+    # 월요일 여부에 따른 시간 범위 표시
+    hours_limit = 68 if is_monday() else 24
+
+    if counts['non_news'] > 0:
+        print(f"   -> 비뉴스 소스(블로그/브런치) {counts['non_news']}개 제외")
+    if counts['old'] > 0:
+        time_desc = f"{hours_limit}시간" if hours_limit != 24 else "24시간"
+        print(f"   -> {time_desc} 이상 된 기사 {counts['old']}개 제외")
+    if counts['promo'] > 0:
+        print(f"   -> 홍보성/패키지 기사 {counts['promo']}개 제외")
+    if counts['low_value'] > 0:
+        print(f"   -> 낮은 가치 기사 {counts['low_value']}개 제외")
+
+
 def filter_non_news_and_old_articles(articles, silent=False):
     """
     비뉴스 소스, 오래된 기사, 홍보성 기사 필터링
@@ -425,48 +925,11 @@ def filter_non_news_and_old_articles(articles, silent=False):
     - 홍보성/패키지 기사 제외
     - 낮은 가치 기사 제외
     """
-    filtered = []
-    non_news_count = 0
-    old_count = 0
-    promo_count = 0
-    low_value_count = 0
-
-    # 월요일 여부에 따른 시간 범위 표시
-    hours_limit = 68 if is_monday() else 24
-
-    for article in articles:
-        # 1. 비뉴스 소스 필터링
-        if is_non_news_source(article.get('link', '')):
-            non_news_count += 1
-            continue
-
-        # 2. 시간 범위 내 기사만 포함
-        if not article.get('is_recent', False):
-            old_count += 1
-            continue
-
-        # 3. 홍보성 기사 필터링
-        if is_promotional_article(article):
-            promo_count += 1
-            continue
-
-        # 4. 낮은 가치 기사 필터링
-        if is_low_value_article(article):
-            low_value_count += 1
-            continue
-
-        filtered.append(article)
+    counts = {}
+    filtered = list(iter_news_articles(articles, counts))
 
     if not silent:
-        if non_news_count > 0:
-            print(f"   -> 비뉴스 소스(블로그/브런치) {non_news_count}개 제외")
-        if old_count > 0:
-            time_desc = f"{hours_limit}시간" if hours_limit != 24 else "24시간"
-            print(f"   -> {time_desc} 이상 된 기사 {old_count}개 제외")
-        if promo_count > 0:
-            print(f"   -> 홍보성/패키지 기사 {promo_count}개 제외")
-        if low_value_count > 0:
-            print(f"   -> 낮은 가치 기사 {low_value_count}개 제외")
+        print_non_news_counts(counts)
 
     return filtered
 
@@ -489,7 +952,7 @@ def get_naver_news_search(query, display=30):
 
 def _get_naver_news_api(query, display, client_id, client_secret):
     """네이버 뉴스 검색 API"""
-    url = "https://openapi.naver.com/v1/search/news.json"
+    url = f"{NAVER_API_URL}/v1/search/news.json"
     headers = {
         'X-Naver-Client-Id': client_id,
         'X-Naver-Client-Secret': client_secret
@@ -501,7 +964,8 @@ def _get_naver_news_api(query, display, client_id, client_secret):
     }
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        with _host_limit(url):
+            response = http_client.get(url, headers=headers, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
 
@@ -539,16 +1003,16 @@ def _get_naver_news_api(query, display, client_id, client_secret):
                     time_text = "1시간 전"  # 파싱 실패 시 최근으로 간주
                     is_recent = True
 
-            articles.append({
-                'title': title,
-                'link': item.get('originallink', item.get('link', '')),
-                'summary': description,
-                'source': item.get('source', '네이버뉴스'),
-                'search_query': query,
-                'pub_date': pub_date,
-                'time_text': time_text,
-                'is_recent': is_recent
-            })
+            articles.append(Article(
+                title=title,
+                link=item.get('originallink', item.get('link', '')),
+                summary=description,
+                source=item.get('source', '네이버뉴스'),
+                search_query=query,
+                pub_date=pub_date,
+                time_text=time_text,
+                is_recent=is_recent
+            ))
 
         return articles
 
@@ -557,131 +1021,137 @@ def _get_naver_news_api(query, display, client_id, client_secret):
         return []
 
 
+def _parse_naver_search_page(html, query, display):
+    """네이버 뉴스 검색 결과 페이지 -> 기사 목록 (봇 차단 페이지면 None)"""
+    if 'captcha' in html.lower() or '비정상적인' in html:
+        print(f"  [Naver 웹] 봇 차단 감지 ({query})")
+        return None
+
+    soup = html_parser.parse(html)
+
+    articles = []
+    news_items = soup.select('div.news_area')
+    if not news_items:
+        news_items = soup.select('li.bx')
+    if not news_items:
+        news_items = soup.select('div.news_wrap')
+
+    for item in news_items[:display]:
+        try:
+            title_elem = item.select_one('a.news_tit')
+            if not title_elem:
+                title_elem = item.select_one('a.api_txt_lines')
+            if not title_elem:
+                title_elem = item.select_one('a.news_tit_link')
+            if not title_elem:
+                continue
+
+            title = title_elem.get_text(strip=True)
+            link = title_elem.get('href', '')
+
+            summary_elem = item.select_one('div.news_dsc')
+            if not summary_elem:
+                summary_elem = item.select_one('div.api_txt_lines.dsc_txt_wrap')
+            if not summary_elem:
+                summary_elem = item.select_one('a.api_txt_lines.dsc_txt_wrap')
+            summary = summary_elem.get_text(strip=True) if summary_elem else ""
+
+            press_elem = item.select_one('a.info.press')
+            if not press_elem:
+                press_elem = item.select_one('a.info')
+            if not press_elem:
+                press_elem = item.select_one('span.info')
+            press = press_elem.get_text(strip=True) if press_elem else "알 수 없음"
+            press = press.replace('언론사 선정', '').strip()
+
+            if title and link:
+                articles.append(Article(
+                    title=title,
+                    link=link,
+                    summary=summary,
+                    source=press,
+                    search_query=query
+                ))
+        except Exception:
+            continue
+
+    return articles
+
+
 def _get_naver_news_scraping(query, display=30):
-    """네이버 뉴스 검색 (웹 스크래핑 - fallback)"""
+    """네이버 뉴스 검색 (웹 스크래핑 - fallback, 조건부 GET 캐시 사용)"""
     encoded_query = quote(query)
-    url = f"https://search.naver.com/search.naver?where=news&query={encoded_query}&sort=1"
+    url = f"{NAVER_SEARCH_URL}/search.naver?where=news&query={encoded_query}&sort=1"
 
     headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
     }
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        if 'captcha' in response.text.lower() or '비정상적인' in response.text:
-            print(f"  [Naver 웹] 봇 차단 감지 ({query})")
-            return []
-
-        articles = []
-        news_items = soup.select('div.news_area')
-        if not news_items:
-            news_items = soup.select('li.bx')
-        if not news_items:
-            news_items = soup.select('div.news_wrap')
+        with _host_limit(url):
+            return listing_cache.fetch(
+                url, lambda html: _parse_naver_search_page(html, query, display),
+                headers=headers, timeout=10, parse_key=f'display={display}'
+            )
+    except Exception as e:
+        print(f"  [Naver 웹] 오류 ({query}): {e}")
+        return []
 
-        for item in news_items[:display]:
-            try:
-                title_elem = item.select_one('a.news_tit')
-                if not title_elem:
-                    title_elem = item.select_one('a.api_txt_lines')
-                if not title_elem:
-                    title_elem = item.select_one('a.news_tit_link')
-                if not title_elem:
-                    continue
 
-                title = title_elem.get_text(strip=True)
-                link = title_elem.get('href', '')
+def _parse_naver_section_page(html):
+    """네이버 뉴스 섹션 페이지 -> 기사 목록"""
+    soup = html_parser.parse(html)
 
-                summary_elem = item.select_one('div.news_dsc')
-                if not summary_elem:
-                    summary_elem = item.select_one('div.api_txt_lines.dsc_txt_wrap')
-                if not summary_elem:
-                    summary_elem = item.select_one('a.api_txt_lines.dsc_txt_wrap')
-                summary = summary_elem.get_text(strip=True) if summary_elem else ""
+    articles = []
 
-                press_elem = item.select_one('a.info.press')
-                if not press_elem:
-                    press_elem = item.select_one('a.info')
-                if not press_elem:
-                    press_elem = item.select_one('span.info')
-                press = press_elem.get_text(strip=True) if press_elem else "알 수 없음"
-                press = press.replace('언론사 선정', '').strip()
+    # sa_text 클래스로 기사 찾기
+    news_items = soup.select('div.sa_text')
 
-                if title and link:
-                    articles.append({
-                        'title': title,
-                        'link': link,
-                        'summary': summary,
-                        'source': press,
-                        'search_query': query
-                    })
-            except Exception:
+    for item in news_items[:30]:
+        try:
+            # 제목
+            title_elem = item.select_one('strong.sa_text_strong')
+            if not title_elem:
                 continue
+            title = title_elem.get_text(strip=True)
 
-        return articles
-    except Exception as e:
-        print(f"  [Naver 웹] 오류 ({query}): {e}")
-        return []
+            # 링크
+            link_elem = item.select_one('a.sa_text_title')
+            if not link_elem:
+                link_elem = item.select_one('a')
+            link = link_elem.get('href', '') if link_elem else ""
+
+            # 요약
+            summary_elem = item.select_one('div.sa_text_lede')
+            summary = summary_elem.get_text(strip=True) if summary_elem else ""
+
+            # 언론사
+            press_elem = item.select_one('div.sa_text_press')
+            press = press_elem.get_text(strip=True) if press_elem else "네이버뉴스"
+
+            if title and link:
+                articles.append(Article(
+                    title=title,
+                    link=link,
+                    summary=summary,
+                    source=press,
+                    search_query='section'
+                ))
+        except Exception:
+            continue
+
+    return articles
 
 
 def get_naver_section_news(section_id="105"):
     """
-    네이버 뉴스 섹션에서 기사 수집
+    네이버 뉴스 섹션에서 기사 수집 (조건부 GET 캐시 사용)
     105: IT/과학, 101: 경제
     """
-    url = f"https://news.naver.com/section/{section_id}"
-
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-    }
+    url = f"{NAVER_NEWS_URL}/section/{section_id}"
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        articles = []
-
-        # sa_text 클래스로 기사 찾기
-        news_items = soup.select('div.sa_text')
-
-        for item in news_items[:30]:
-            try:
-                # 제목
-                title_elem = item.select_one('strong.sa_text_strong')
-                if not title_elem:
-                    continue
-                title = title_elem.get_text(strip=True)
-
-                # 링크
-                link_elem = item.select_one('a.sa_text_title')
-                if not link_elem:
-                    link_elem = item.select_one('a')
-                link = link_elem.get('href', '') if link_elem else ""
-
-                # 요약
-                summary_elem = item.select_one('div.sa_text_lede')
-                summary = summary_elem.get_text(strip=True) if summary_elem else ""
-
-                # 언론사
-                press_elem = item.select_one('div.sa_text_press')
-                press = press_elem.get_text(strip=True) if press_elem else "네이버뉴스"
-
-                if title and link:
-                    articles.append({
-                        'title': title,
-                        'link': link,
-                        'summary': summary,
-                        'source': press,
-                        'search_query': 'section'
-                    })
-            except Exception:
-                continue
-
-        return articles
+        return listing_cache.fetch(url, _parse_naver_section_page, timeout=10)
     except Exception as e:
         print(f"네이버 섹션 뉴스 오류: {e}")
         return []
@@ -693,16 +1163,16 @@ def get_google_news_search(query, num_results=15):
     """
     encoded_query = quote(query)
     # 최근 3일 뉴스 (tbs=qdr:d3) - 신선도 유지
-    url = f"https://www.google.com/search?q={encoded_query}&tbm=nws&hl=ko&tbs=qdr:d3"
+    url = f"{GOOGLE_SEARCH_URL}/search?q={encoded_query}&tbm=nws&hl=ko&tbs=qdr:d3"
 
     headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Accept-Language': 'ko-KR,ko;q=0.9'
     }
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        with _host_limit(url):
+            response = http_client.get(url, headers=headers, timeout=10)
+        soup = html_parser.parse(response.text)
 
         articles = []
 
@@ -771,15 +1241,15 @@ def get_google_news_search(query, num_results=15):
                             is_recent = True
 
                 if title and link:
-                    articles.append({
-                        'title': title,
-                        'link': link,
-                        'summary': summary,
-                        'source': source,
-                        'search_query': query,
-                        'time_text': time_text,
-                        'is_recent': is_recent
-                    })
+                    articles.append(Article(
+                        title=title,
+                        link=link,
+                        summary=summary,
+                        source=source,
+                        search_query=query,
+                        time_text=time_text,
+                        is_recent=is_recent
+                    ))
             except Exception:
                 continue
 
@@ -789,64 +1259,231 @@ def get_google_news_search(query, num_results=15):
         return []
 
 
+# 기사 본문 선택자 (여러 언론사 레이아웃 대응)
+ARTICLE_BODY_SELECTORS = [
+    'article',
+    'div.article_body',
+    'div.article-body',
+    'div.news_body',
+    'div.article_txt',
+    'div#articleBodyContents',
+    'div.content',
+    'div.article-content',
+    'div.view_txt',
+    'div.newsct_article',
+]
+
+# URL 내 날짜 패턴 (발행일 확인 시 가장 먼저 시도 - 네트워크 요청 없음)
+URL_DATE_PATTERNS = [
+    r'/(\d{4})/(\d{2})/(\d{2})/',
+    r'/(\d{4})(\d{2})(\d{2})',
+    r'[=/](\d{4})-(\d{2})-(\d{2})',
+    r'[=/](\d{4})\.(\d{2})\.(\d{2})',
+]
+
+
+def _parse_ld_json_date(raw):
+    """JSON-LD 원문에서 datePublished(YYYY-MM-DD) 찾기 - 없으면 None"""
+    try:
+        data = json.loads(raw)
+        if isinstance(data, dict) and 'datePublished' in data:
+            return data['datePublished'][:10]
+        if isinstance(data, list):
+            for item in data:
+                if isinstance(item, dict) and 'datePublished' in item:
+                    return item['datePublished'][:10]
+    except:
+        pass
+    return None
+
+
+def _find_publish_date_in_head(head):
+    """<head>의 meta/JSON-LD에서 발행일 찾기 (html_parser.parse_head 결과) - 없으면 None"""
+    # 1. meta article:published_time (가장 신뢰할 수 있음)
+    published = html_parser.meta_content(head, property='article:published_time')
+    if published:
+        return published[:10]
+
+    # 2. meta datePublished
+    published = html_parser.meta_content(head, itemprop='datePublished')
+    if published:
+        return published[:10]
+
+    # 3. JSON-LD structured data
+    for raw in head['json_ld']:
+        published = _parse_ld_json_date(raw)
+        if published:
+            return published
+
+    return None
+
+
+def _find_publish_date(soup):
+    """파싱된 페이지에서 발행일(YYYY-MM-DD) 찾기 - 없으면 None"""
+    # 1. meta article:published_time (가장 신뢰할 수 있음)
+    meta = soup.find('meta', {'property': 'article:published_time'})
+    if meta and meta.get('content'):
+        return meta['content'][:10]
+
+    # 2. meta datePublished
+    meta = soup.find('meta', {'itemprop': 'datePublished'})
+    if meta and meta.get('content'):
+        return meta['content'][:10]
+
+    # 3. JSON-LD structured data
+    for script in soup.find_all('script', type='application/ld+json'):
+        published = _parse_ld_json_date(script.text)
+        if published:
+            return published
+
+    # 4. time 태그의 datetime 속성
+    time_tag = soup.find('time', datetime=True)
+    if time_tag:
+        return time_tag['datetime'][:10]
+
+    return None
+
+
+def _extract_body_text(soup):
+    """파싱된 페이지에서 기사 본문 추출 (soup의 불필요한 태그를 제거함)"""
+    # 불필요한 태그 제거
+    for tag in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe']):
+        tag.decompose()
+
+    # 기사 본문 찾기 (여러 선택자 시도)
+    content = ""
+    for sel in ARTICLE_BODY_SELECTORS:
+        elem = soup.select_one(sel)
+        if elem:
+            content = elem.get_text(separator=' ', strip=True)
+            break
+
+    # 못 찾으면 body에서 가장 긴 텍스트 블록 찾기
+    if not content or len(content) < 100:
+        paragraphs = soup.find_all('p')
+        content = ' '.join([p.get_text(strip=True) for p in paragraphs if len(p.get_text(strip=True)) > 50])
+
+    return content[:3000]  # 최대 3000자
+
+
+def _parse_full_page(page):
+    """페이지 전체를 파싱하여 발행일(아직 없으면)과 본문을 page['meta']에 저장"""
+    meta = page['meta']
+    soup = html_parser.parse(page['text'])
+    # 발행일을 먼저 찾고 (JSON-LD script 필요), 본문 추출 시 태그 제거
+    if 'publish_date' not in meta:
+        meta['publish_date'] = _find_publish_date(soup)
+    meta['content'] = _extract_body_text(soup)
+    meta['parsed'] = True
+    article_cache.save_to_disk(page)
+
+
+def page_publish_date(page):
+    """
+    캐시된 기사 페이지의 발행일 (결과는 page['meta']에 저장)
+    대부분 <head>의 meta/JSON-LD에 있으므로 head만 먼저 파싱하고,
+    없을 때만 전체를 파싱 (이때 본문도 함께 추출)
+    """
+    meta = page['meta']
+    if 'publish_date' in meta:
+        return meta['publish_date']
+
+    publish_date = _find_publish_date_in_head(html_parser.parse_head(page['text']))
+    if publish_date:
+        meta['publish_date'] = publish_date
+        article_cache.save_to_disk(page)
+    else:
+        _parse_full_page(page)
+    return meta['publish_date']
+
+
+def page_content(page):
+    """캐시된 기사 페이지의 본문 (결과는 page['meta']에 저장, 발행일 검증과 공유)"""
+    meta = page['meta']
+    if 'content' not in meta:
+        _parse_full_page(page)
+    return meta['content']
+
+
+def _publish_date_from_url(url):
+    """URL의 날짜 패턴 (YYYY-MM-DD) - 실제 날짜가 아니면 None"""
+    for pattern in URL_DATE_PATTERNS:
+        match = re.search(pattern, url)
+        if match:
+            date_str = f'{match.group(1)}-{match.group(2)}-{match.group(3)}'
+            try:
+                published = datetime.strptime(date_str, '%Y-%m-%d')
+            except ValueError:
+                continue
+            # 기사 번호 등 날짜가 아닌 숫자 제외
+            if 2000 <= published.year <= datetime.now().year + 1:
+                return date_str
+    return None
+
+
 def extract_actual_publish_date(url, timeout=5):
     """
     기사 URL에서 실제 발행일 추출 (구글 뉴스 time_text 검증용)
 
+    전송량을 줄이기 위해 가벼운 방법부터 시도:
+    1. URL의 날짜 패턴 (네트워크 요청 없음)
+    2. 이미 받은 페이지 (article_cache 메모리/디스크)
+    3. <head>까지만 스트리밍으로 받아 meta/JSON-LD 확인 (article_cache.probe_head)
+    4. 전체 페이지 (본문의 time 태그까지 확인, 요약 단계와 공유)
+
     Returns:
         str: YYYY-MM-DD 형식 날짜 또는 None
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-
     try:
-        response = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        publish_date = _publish_date_from_url(url)
+        if publish_date:
+            return publish_date
+
+        page = article_cache.get_cached_page(url)
+        if page is not None:
+            return page_publish_date(page)
+
+        head = article_cache.probe_head(url, timeout=timeout)
+        if head is not None:
+            publish_date = _find_publish_date_in_head(head)
+            if publish_date:
+                return publish_date
+
+        page = article_cache.get_page(url, timeout=timeout)
+        if page is None:
+            return None
+        return page_publish_date(page)
+    except Exception:
+        return None
 
-        # 1. meta article:published_time (가장 신뢰할 수 있음)
-        meta = soup.find('meta', {'property': 'article:published_time'})
-        if meta and meta.get('content'):
-            return meta['content'][:10]
 
-        # 2. meta datePublished
-        meta = soup.find('meta', {'itemprop': 'datePublished'})
-        if meta and meta.get('content'):
-            return meta['content'][:10]
+def check_article_freshness(url, max_days=2):
+    """
+    URL의 실제 발행일로 신선도 판단 (기사 dict는 수정하지 않음 - 병렬 검증 워커용)
 
-        # 3. JSON-LD structured data
-        for script in soup.find_all('script', type='application/ld+json'):
-            try:
-                data = json.loads(script.text)
-                if isinstance(data, dict) and 'datePublished' in data:
-                    return data['datePublished'][:10]
-                if isinstance(data, list):
-                    for item in data:
-                        if isinstance(item, dict) and 'datePublished' in item:
-                            return item['datePublished'][:10]
-            except:
-                pass
-
-        # 4. time 태그의 datetime 속성
-        time_tag = soup.find('time', datetime=True)
-        if time_tag:
-            return time_tag['datetime'][:10]
-
-        # 5. URL에서 날짜 패턴 추출 (fallback)
-        date_patterns = [
-            r'/(\d{4})/(\d{2})/(\d{2})/',
-            r'/(\d{4})(\d{2})(\d{2})',
-            r'[=/](\d{4})-(\d{2})-(\d{2})',
-            r'[=/](\d{4})\.(\d{2})\.(\d{2})',
-        ]
-        for pattern in date_patterns:
-            match = re.search(pattern, url)
-            if match:
-                return f'{match.group(1)}-{match.group(2)}-{match.group(3)}'
+    Returns:
+        tuple: (is_fresh: bool, actual_date: str or None, days_old: int or None)
+    """
+    if not url:
+        return False, None, None
 
-        return None
-    except Exception:
-        return None
+    actual_date = extract_actual_publish_date(url)
+    if not actual_date:
+        return True, None, None  # 날짜를 못 찾으면 일단 통과 (time_text에 의존)
+
+    try:
+        pub_date = datetime.strptime(actual_date, '%Y-%m-%d')
+        days_old = (datetime.now() - pub_date).days
+        return days_old <= max_days, actual_date, days_old
+    except ValueError:
+        return True, actual_date, None
+
+
+def _apply_freshness(article, actual_date, days_old):
+    """검증 결과를 기사에 기록"""
+    if days_old is not None:
+        article['actual_publish_date'] = actual_date
+        article['days_old'] = days_old
 
 
 def verify_article_freshness(article, max_days=2):
@@ -860,24 +1497,134 @@ def verify_article_freshness(article, max_days=2):
     Returns:
         tuple: (is_fresh: bool, actual_date: str or None)
     """
-    url = article.get('link') or article.get('url')
-    if not url:
-        return False, None
+    is_fresh, actual_date, days_old = check_article_freshness(article.get('link') or article.get('url'), max_days)
+    _apply_freshness(article, actual_date, days_old)
+    return is_fresh, actual_date
+
+
+# ============================================
+# 발행일 검증 병렬 처리 설정
+# ============================================
+
+# 검증 단계 전체 제한 시간 (초) - 이 시간 안에 끝나지 않은 기사는 정책에 따라 처리
+FRESHNESS_DEADLINE_SECONDS = 20
+
+# 기한 초과 기사 처리 정책
+# - pass: 통과 (날짜를 못 찾은 기사와 동일하게 취급)
+# - drop: 제외하고 다음 순위에서 보충
+# - defer: 보충 후에도 자리가 남으면 맨 뒤에 추가
+FRESHNESS_TIMEOUT_POLICIES = ('pass', 'drop', 'defer')
+
+# 보충 후보를 미리 검증해 둘 개수 (투기적 검증)
+FRESHNESS_LOOKAHEAD = 10
+
+FRESHNESS_MAX_WORKERS = 10
 
-    actual_date = extract_actual_publish_date(url)
-    if not actual_date:
-        return True, None  # 날짜를 못 찾으면 일단 통과 (time_text에 의존)
+
+def verify_articles_freshness(articles, backfill_candidates=None, target=20, max_days=2,
+                              deadline=FRESHNESS_DEADLINE_SECONDS, timeout_policy='pass',
+                              lookahead=FRESHNESS_LOOKAHEAD, max_workers=FRESHNESS_MAX_WORKERS,
+                              silent=False):
+    """
+    여러 기사의 실제 발행일을 병렬로 검증
+
+    - articles 전체를 동시에 검증하고, 전체 제한 시간(deadline)을 넘긴 기사는
+      timeout_policy(pass/drop/defer)에 따라 처리
+    - 오래된 기사가 제외되면 backfill_candidates 순서대로 보충
+      (다음 lookahead개 후보는 처음부터 미리 검증 시작)
+    - 워커는 결과만 반환하고 기사 dict(actual_publish_date/days_old)는 기한 안에 끝난 결과만
+      메인 스레드에서 기록 (기한 초과 후 남은 워커가 다음 단계의 기사를 수정하지 않음)
+
+    Returns:
+        tuple: (verified_articles, removed_old, timed_out)
+    """
+    if timeout_policy not in FRESHNESS_TIMEOUT_POLICIES:
+        raise ValueError(f"timeout_policy must be one of {FRESHNESS_TIMEOUT_POLICIES}: {timeout_policy}")
+
+    end_time = time.monotonic() + deadline
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def check(url):
+        return check_article_freshness(url, max_days), time.monotonic()
+
+    def submit(article):
+        return executor.submit(check, article.get('link') or article.get('url'))
+
+    def wait_result(future):
+        """전체 기한 안에서 결과 대기 (기한 초과 시 None)"""
+        try:
+            result, finished = future.result(timeout=max(0, end_time - time.monotonic()))
+        except FutureTimeoutError:
+            return None
+        return result if finished <= end_time else None
 
     try:
-        pub_date = datetime.strptime(actual_date, '%Y-%m-%d')
-        days_old = (datetime.now() - pub_date).days
+        futures = [submit(article) for article in articles]
 
-        article['actual_publish_date'] = actual_date
-        article['days_old'] = days_old
+        # 보충 후보 투기적 검증 (이미 TOP에 있는 기사 제외)
+        top_titles = set(a['title'] for a in articles)
+        backfill_iter = iter([a for a in (backfill_candidates or []) if a['title'] not in top_titles])
+        speculative = deque()
 
-        return days_old <= max_days, actual_date
-    except:
-        return True, actual_date
+        def fill_speculative():
+            while len(speculative) < lookahead:
+                article = next(backfill_iter, None)
+                if article is None:
+                    break
+                speculative.append((article, submit(article)))
+
+        fill_speculative()
+
+        verified = []
+        deferred = []
+        removed_old = 0
+        timed_out = 0
+
+        def handle(article, result):
+            nonlocal removed_old, timed_out
+            if result is None:
+                timed_out += 1
+                if timeout_policy == 'pass':
+                    verified.append(article)
+                elif timeout_policy == 'defer':
+                    deferred.append(article)
+                return
+
+            is_fresh, actual_date, days_old = result
+            _apply_freshness(article, actual_date, days_old)
+            if is_fresh:
+                verified.append(article)
+            else:
+                removed_old += 1
+                if not silent:
+                    print(f"   ⚠ 오래된 기사 제외: {actual_date} - {article['title'][:30]}...")
+
+        for article, future in zip(articles, futures):
+            handle(article, wait_result(future))
+
+        # 제외된 만큼 다음 순위에서 보충
+        if len(verified) < target and len(verified) < len(articles):
+            seen_titles = set(a['title'] for a in verified)
+            while len(verified) < target and speculative:
+                article, future = speculative.popleft()
+                fill_speculative()
+                if article['title'] in seen_titles:
+                    continue
+                before = len(verified)
+                handle(article, wait_result(future))
+                if len(verified) > before:
+                    seen_titles.add(article['title'])
+
+        # 기한 초과로 보류된 기사는 자리가 남을 때만 추가
+        for article in deferred:
+            if len(verified) >= target:
+                break
+            verified.append(article)
+
+        return verified[:target], removed_old, timed_out
+    finally:
+        # 남은 검증(기한 초과/불필요한 투기적 검증)은 기다리지 않음
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 def is_too_old_article(article):
@@ -927,147 +1674,274 @@ def is_relevant_article(article):
     if is_too_old_article(article):
         return False
 
-    text = (article['title'] + ' ' + article.get('summary', '')).lower()
+    hits = get_article_features(article).hits
 
     # 필수 키워드 - 이 중 하나라도 있어야 함
-    must_have_keywords = (
-        OTA_KEYWORDS +
-        ACCOMMODATION_KEYWORDS +
-        POLICY_KEYWORDS +
-        TRAVELTECH_KEYWORDS +
-        ['관광', '여행', '투어', '레저']
-    )
+    # (OTA + 숙박업 + 정책 + 트래블테크 + 관광/여행/투어/레저)
+    must_have_groups = ('ota', 'accommodation', 'policy', 'traveltech', 'relevant_extra')
+    return any(group in hits for group in must_have_groups)
+
+
+# ============================================
+# 동시 수집 설정 (쿼리 x 소스 병렬 요청)
+# ============================================
+
+# 전체 동시 요청 수 (환경변수 ONDA_COLLECT_WORKERS로 조정)
+COLLECT_MAX_WORKERS = int(os.environ.get('ONDA_COLLECT_WORKERS', '8'))
+
+# 스트리밍 수집: 완료됐지만 아직 처리하지 않은 결과를 최대 몇 개까지 앞서 받을지
+# (동시 요청 수 + 이 값만큼만 제출 - 처리가 느려도 결과가 무한정 쌓이지 않음)
+COLLECT_STREAM_BUFFER = int(os.environ.get('ONDA_STREAM_BUFFER', '32'))
+
+# 호스트별 동시 요청 제한 (봇 차단 방지) - 검색 함수가 실제로 요청하는 주소의 호스트 기준
+# 환경변수 예: ONDA_HOST_CONCURRENCY="www.google.com=2,openapi.naver.com=4"
+COLLECT_HOST_LIMITS = {
+    urlsplit(GOOGLE_SEARCH_URL).netloc: 2,
+    urlsplit(NAVER_API_URL).netloc: 4,
+    urlsplit(NAVER_SEARCH_URL).netloc: 2,
+}
+COLLECT_DEFAULT_HOST_LIMIT = 4
+
+for _item in os.environ.get('ONDA_HOST_CONCURRENCY', '').split(','):
+    if '=' in _item:
+        _host, _limit = _item.split('=', 1)
+        try:
+            COLLECT_HOST_LIMITS[_host.strip()] = max(1, int(_limit))
+        except ValueError:
+            pass
+
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
+
+
+def _get_host_semaphore(host):
+    """호스트별 동시 요청 세마포어 (최초 사용 시 생성)"""
+    with _host_semaphores_lock:
+        semaphore = _host_semaphores.get(host)
+        if semaphore is None:
+            limit = COLLECT_HOST_LIMITS.get(host, COLLECT_DEFAULT_HOST_LIMIT)
+            semaphore = threading.BoundedSemaphore(limit)
+            _host_semaphores[host] = semaphore
+        return semaphore
+
+
+def _host_limit(url):
+    """url 호스트의 동시 요청 세마포어 (with 블록 안에서 요청)"""
+    return _get_host_semaphore(urlsplit(url).netloc)
 
-    for keyword in must_have_keywords:
-        if keyword.lower() in text:
+
+def iter_sources_concurrently(tasks, max_workers=None, buffer_size=None):
+    """
+    (func, args) 작업 목록을 병렬 실행하고 결과를 입력 순서대로 하나씩 yield
+    (호스트별 동시 요청 제한은 각 검색 함수가 실제 요청 주소 기준으로 적용)
+
+    앞 작업의 결과가 나오는 즉시 넘겨주므로 호출 측은 뒤 작업이 끝나기 전에 처리 시작 가능
+    제출은 동시 요청 수 + buffer_size개까지만 (소비가 느리면 뒤 작업 제출을 미룸)
+    """
+    if not tasks:
+        return
+
+    max_workers = max_workers or COLLECT_MAX_WORKERS
+    if buffer_size is None:
+        buffer_size = COLLECT_STREAM_BUFFER
+    window = max_workers + max(0, buffer_size)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+        task_iter = iter(tasks)
+        pending = deque()
+
+        def submit_next():
+            task = next(task_iter, None)
+            if task is None:
+                return False
+            func, args = task
+            pending.append(executor.submit(func, *args))
             return True
 
-    return False
+        while len(pending) < window and submit_next():
+            pass
+
+        while pending:
+            future = pending.popleft()
+            with run_metrics.timer('stream.fetch_wait'):
+                result = future.result()
+            submit_next()  # 소비하기 전에 다음 작업 제출 (처리 중에도 수집 계속)
+            yield result
+
+
+def fetch_sources_concurrently(tasks, max_workers=None):
+    """
+    (func, args) 작업 목록을 병렬 실행
+
+    결과는 완료 순서와 관계없이 입력 순서대로 반환 (순차 실행과 동일한 순서 보장)
+    """
+    return list(iter_sources_concurrently(tasks, max_workers=max_workers))
+
+
+# 키워드 검색 쿼리 - ONDA 비즈니스 관련 핵심 키워드
+# 이메일 버전과 동일하게 맞춤 (검색어에서 "뉴스" 제거 → 투자/M&A 기사 수집 향상)
+SEARCH_QUERIES = [
+    # === 1순위: OTA 플랫폼 (핵심 - 회사명 단독 검색) ===
+    "야놀자",  # "야놀자 뉴스" → "야놀자" (투자, M&A 기사 포함)
+    "여기어때",  # "여기어때 뉴스" → "여기어때"
+    "에어비앤비 한국",
+    "아고다 한국",
+    "부킹닷컴 한국",
+    "트립닷컴 한국",
+    "익스피디아 한국",
+
+    # === 2순위: 숙박업 ===
+    "호텔 업계 뉴스",
+    "숙박업",
+    "리조트 뉴스",
+
+    # === 3순위: 산업 이슈/규제 ===
+    "숙박업 규제",
+    "공유숙박",
+    "관광공사",
+
+    # === 4순위: 트래블테크/B2B ===
+    "트래블테크",
+    "호스피탈리티 테크",
+    "숙박 플랫폼",
+
+    # === 5순위: ONDA 직접 ===
+    "온다 ONDA 숙박"
+]
 
 
-def collect_all_news(silent=False):
+def iter_collected_news(silent=False, max_workers=None, counts=None):
     """
-    구글 뉴스에서 ONDA 관련 뉴스 수집
+    구글/네이버 검색 결과를 쿼리 순서대로 하나씩 yield (스트리밍 수집 단계)
+
+    모든 쿼리 x 소스 요청은 병렬로 보내고, 앞 쿼리의 (구글, 네이버) 결과가 모이면
+    뒤 쿼리를 기다리지 않고 바로 넘겨줌 - 순서는 순차 실행과 같음 (쿼리 순 -> 구글 -> 네이버)
+    소스별 통과 개수는 counts['google'], counts['naver']에 누적
     """
-    all_articles = []
-
-    # 키워드 검색 쿼리 - ONDA 비즈니스 관련 핵심 키워드
-    # 이메일 버전과 동일하게 맞춤 (검색어에서 "뉴스" 제거 → 투자/M&A 기사 수집 향상)
-    search_queries = [
-        # === 1순위: OTA 플랫폼 (핵심 - 회사명 단독 검색) ===
-        "야놀자",  # "야놀자 뉴스" → "야놀자" (투자, M&A 기사 포함)
-        "여기어때",  # "여기어때 뉴스" → "여기어때"
-        "에어비앤비 한국",
-        "아고다 한국",
-        "부킹닷컴 한국",
-        "트립닷컴 한국",
-        "익스피디아 한국",
-
-        # === 2순위: 숙박업 ===
-        "호텔 업계 뉴스",
-        "숙박업",
-        "리조트 뉴스",
-
-        # === 3순위: 산업 이슈/규제 ===
-        "숙박업 규제",
-        "공유숙박",
-        "관광공사",
-
-        # === 4순위: 트래블테크/B2B ===
-        "트래블테크",
-        "호스피탈리티 테크",
-        "숙박 플랫폼",
-
-        # === 5순위: ONDA 직접 ===
-        "온다 ONDA 숙박"
-    ]
+    counts = counts if counts is not None else {}
+    counts.setdefault('google', 0)
+    counts.setdefault('naver', 0)
+
+    total_queries = len(SEARCH_QUERIES)
+    if not silent:
+        print(f"   {total_queries}개 쿼리 x 2개 소스 병렬 검색 중...")
+
+    # 쿼리별로 (구글, 네이버) 순서로 작업 구성
+    tasks = []
+    for query in SEARCH_QUERIES:
+        tasks.append((get_google_news_search, (query, 10)))
+        tasks.append((get_naver_news_search, (query, 10)))
+
+    results = iter_sources_concurrently(tasks, max_workers=max_workers)
 
-    total_queries = len(search_queries)
-    google_count = 0
-    naver_count = 0
+    for idx, query in enumerate(SEARCH_QUERIES, 1):
+        google_articles = next(results)
+        naver_articles = next(results)
 
-    for idx, query in enumerate(search_queries, 1):
         if not silent:
-            print(f"   [{idx}/{total_queries}] '{query}' 검색 중...")
+            print(f"   [{idx}/{total_queries}] '{query}' 구글 {len(google_articles)}개, 네이버 {len(naver_articles)}개")
 
-        # 구글 뉴스 검색
-        google_articles = get_google_news_search(query, num_results=10)
+        # 구글 뉴스 검색 결과
         for article in google_articles:
             if is_relevant_article(article):
-                all_articles.append(article)
-                google_count += 1
+                counts['google'] += 1
+                yield article
 
-        # 네이버 뉴스 검색 (추가)
+        # 네이버 뉴스 검색 결과
         # 네이버 API는 검색어로 이미 필터링됨 → 시간 필터만 적용
-        naver_articles = get_naver_news_search(query, display=10)
         for article in naver_articles:
             if not is_too_old_article(article):
-                all_articles.append(article)
-                naver_count += 1
+                counts['naver'] += 1
+                yield article
+
+
+def print_collect_counts(counts):
+    """iter_collected_news 소스별 개수 + 목록 캐시 사용 현황 출력"""
+    print(f"   -> 관련 기사 {counts['google'] + counts['naver']}개 필터링 완료 (구글: {counts['google']}, 네이버: {counts['naver']})")
+    cache_stats = listing_cache.stats
+    if cache_stats['fresh'] or cache_stats['not_modified']:
+        print(f"   -> 목록 캐시: 재사용 {cache_stats['fresh']}, 304 {cache_stats['not_modified']}, 다운로드 {cache_stats['fetched']}")
+
+
+def collect_all_news(silent=False, max_workers=None):
+    """
+    구글 뉴스에서 ONDA 관련 뉴스 수집
+
+    모든 쿼리 x 소스(구글/네이버) 요청을 병렬로 보내고,
+    결과는 순차 실행 때와 같은 순서(쿼리 순 -> 구글 -> 네이버)로 병합
+    """
+    counts = {}
+    all_articles = list(iter_collected_news(silent=silent, max_workers=max_workers, counts=counts))
 
     if not silent:
-        print(f"   -> 관련 기사 {len(all_articles)}개 필터링 완료 (구글: {google_count}, 네이버: {naver_count})")
+        print_collect_counts(counts)
 
     return all_articles
 
 
+def iter_scored(articles, counts=None):
+    """
+    관련도 점수/카테고리 + 산업 임팩트 점수 (스트리밍 단계 - 기사마다 계산 후 바로 yield)
+    처리한 개수는 counts['scored']에 누적
+    """
+    counts = counts if counts is not None else {}
+    counts.setdefault('scored', 0)
+
+    for article in articles:
+        article['score'] = calculate_relevance_score(article)
+        article['category'] = categorize_article(article)
+        calculate_industry_impact_score(article)
+        counts['scored'] += 1
+        yield article
+
+
 def calculate_relevance_score(article):
     """
     ONDA 비즈니스 관련도에 따라 점수 계산
     숙박/OTA/여행 맥락에서만 점수 부여
     """
-    text = (article['title'] + ' ' + article['summary']).lower()
+    hits = get_article_features(article).hits
 
     score = 0
     matched_keywords = []
 
     # ONDA 직접 언급 (최고 점수 100점)
-    if '온다' in text or 'onda' in text:
+    if 'onda' in hits:
         score += 100
         matched_keywords.append('ONDA')
 
     # OTA 플랫폼 언급 (각 25점) - 핵심 경쟁사/파트너
-    for keyword in OTA_KEYWORDS:
-        if keyword.lower() in text:
-            score += 25
-            matched_keywords.append(keyword)
+    for i in hits.get('ota', ()):
+        score += 25
+        matched_keywords.append(OTA_KEYWORDS[i])
 
     # 트래블테크/호스피탈리티 (각 20점)
-    for keyword in TRAVELTECH_KEYWORDS:
-        if keyword.lower() in text:
-            score += 20
-            matched_keywords.append(keyword)
+    for i in hits.get('traveltech', ()):
+        score += 20
+        matched_keywords.append(TRAVELTECH_KEYWORDS[i])
 
     # 숙박업 키워드 (각 15점)
-    for keyword in ACCOMMODATION_KEYWORDS:
-        if keyword.lower() in text:
-            score += 15
-            matched_keywords.append(keyword)
+    for i in hits.get('accommodation', ()):
+        score += 15
+        matched_keywords.append(ACCOMMODATION_KEYWORDS[i])
 
     # 정책/규제 키워드 (각 12점)
-    for keyword in POLICY_KEYWORDS:
-        if keyword.lower() in text:
-            score += 12
-            matched_keywords.append(keyword)
+    for i in hits.get('policy', ()):
+        score += 12
+        matched_keywords.append(POLICY_KEYWORDS[i])
 
     # 투자/펀딩 - 숙박/여행 관련 기사에서만 보너스 (15점)
-    has_travel_context = any(kw.lower() in text for kw in OTA_KEYWORDS + ACCOMMODATION_KEYWORDS + TRAVELTECH_KEYWORDS)
-    if has_travel_context:
-        investment_keywords = ['투자유치', '펀딩', '시리즈a', '시리즈b', '시리즈c']
-        for kw in investment_keywords:
-            if kw in text:
-                score += 15
-                matched_keywords.append(f'투자:{kw}')
-                break
+    has_travel_context = 'ota' in hits or 'accommodation' in hits or 'traveltech' in hits
+    if has_travel_context and 'relevance_investment' in hits:
+        kw = RELEVANCE_INVESTMENT_BONUS_KEYWORDS[hits['relevance_investment'][0]]
+        score += 15
+        matched_keywords.append(f'투자:{kw}')
 
     # 정책/규제 보너스 - 숙박 관련일 때만 (10점)
-    if has_travel_context:
-        policy_bonus = ['규제 완화', '규제 강화', '법안', '허용', '금지', '단속']
-        for kw in policy_bonus:
-            if kw in text:
-                score += 10
-                matched_keywords.append(f'정책:{kw}')
-                break
+    if has_travel_context and 'relevance_policy' in hits:
+        kw = RELEVANCE_POLICY_BONUS_KEYWORDS[hits['relevance_policy'][0]]
+        score += 10
+        matched_keywords.append(f'정책:{kw}')
 
     article['matched_keywords'] = list(set(matched_keywords))
     return score
@@ -1083,74 +1957,55 @@ def calculate_industry_impact_score(article):
     2. 규제/정책 변화: 비즈니스 직접 영향
     3. 신기술/서비스 런칭: 경쟁 동향
     4. 시장 데이터: 숫자가 있는 뉴스 (신뢰도/중요도 높음)
+
+    키워드 목록은 모듈 상단 키워드 그룹 참고 (SCORING_MATCHER로 한 번에 매칭)
     """
-    text = (article['title'] + ' ' + article.get('summary', '')).lower()
-    title = article['title'].lower()
+    features = get_article_features(article)
+    text = features.text
+    hits = features.hits
+    title_hits = features.title_hits
+
+    def count(group):
+        return len(hits.get(group, ()))
 
     impact_score = 0
     impact_factors = []
 
     # 1. 투자/M&A (40점) - 가장 높은 가중치
-    investment_match = 0
-    for kw in INVESTMENT_KEYWORDS:
-        if kw.lower() in text:
-            investment_match += 1
+    investment_match = count('investment')
     if investment_match > 0:
         impact_score += min(40, investment_match * 15)
         impact_factors.append('투자/M&A')
 
     # 2. 규제/정책 변화 (45점) - 정책 기사 우선순위 상향
-    regulation_match = 0
-    for kw in REGULATION_KEYWORDS:
-        if kw.lower() in text:
-            regulation_match += 1
+    regulation_match = count('regulation')
     if regulation_match > 0:
         impact_score += min(45, regulation_match * 15)
         impact_factors.append('규제/정책')
 
     # 2-1. 숙박업 직접 관련 정책만 보너스 (+35점)
     # 숙박업법, 공유숙박 등 숙박업 직접 관련 정책만 높은 점수
-    accommodation_policy_keywords = [
-        '숙박업법', '공유숙박', '생활숙박', '숙박업 규제', '숙박시설',
-        '호텔업', '숙박업 허가', '숙박업 등록', '객실 규제'
-    ]
-    accom_policy_match = 0
-    for kw in accommodation_policy_keywords:
-        if kw in text:
-            accom_policy_match += 1
+    accom_policy_match = count('accommodation_policy')
     if accom_policy_match > 0:
         impact_score += min(35, accom_policy_match * 15)
         impact_factors.append('숙박정책')
 
     # 2-2. 일반 관광 정책은 낮은 점수 (+15점)
     # 숙박과 직접 관련 없는 관광 정책은 낮은 가중치
-    general_tourism_keywords = [
-        '관광진흥', '관광정책', 'K-관광', '관광산업', '인바운드', '아웃바운드',
-        '관광객 유치', '관광 활성화'
-    ]
-    general_tourism_match = 0
-    for kw in general_tourism_keywords:
-        if kw in text:
-            general_tourism_match += 1
+    general_tourism_match = count('general_tourism')
     if general_tourism_match > 0 and accom_policy_match == 0:
         # 숙박 정책이 없을 때만 일반 관광 점수 부여 (낮은 점수)
         impact_score += min(15, general_tourism_match * 8)
         impact_factors.append('일반관광정책')
 
     # 3. 신기술/서비스 런칭 (25점)
-    newtech_match = 0
-    for kw in NEWTECH_KEYWORDS:
-        if kw.lower() in text:
-            newtech_match += 1
+    newtech_match = count('newtech')
     if newtech_match > 0:
         impact_score += min(25, newtech_match * 10)
         impact_factors.append('신규서비스')
 
     # 4. 시장 데이터/실적 (30점) - 숫자가 있으면 보너스
-    market_match = 0
-    for kw in MARKET_DATA_KEYWORDS:
-        if kw.lower() in text:
-            market_match += 1
+    market_match = count('market_data')
     if market_match > 0:
         impact_score += min(30, market_match * 10)
         impact_factors.append('시장데이터')
@@ -1169,47 +2024,18 @@ def calculate_industry_impact_score(article):
 
     # 6. 제목에 핵심 키워드가 있으면 보너스 (+10점)
     # 제목에 있는 키워드가 더 중요
-    title_keywords = INVESTMENT_KEYWORDS + REGULATION_KEYWORDS[:5] + ['출시', '런칭', '오픈']
-    for kw in title_keywords:
-        if kw.lower() in title:
-            impact_score += 10
-            break
+    if 'title_impact' in title_hits:
+        impact_score += 10
 
     # 6-1. 제목에 회사명/업계 키워드가 있으면 보너스 (+30점)
     # 제목에 특정 회사나 업계가 명시되면 뉴스 가치가 높음
-    title_company_keywords = [
-        # 주요 OTA/플랫폼
-        '야놀자', '여기어때', '에어비앤비', '아고다', '부킹닷컴', '트립닷컴',
-        '마이리얼트립', '호텔스닷컴', '익스피디아', '트립어드바이저',
-        # 호텔 체인
-        '메리어트', '힐튼', '아코르', '하얏트', '신라호텔', '롯데호텔',
-        # 업계 키워드
-        '숙박업', '호텔업', 'OTA', '여행업', '관광업', '호스피탈리티'
-    ]
-    for kw in title_company_keywords:
-        if kw.lower() in title:
-            impact_score += 30
-            impact_factors.append(f'제목회사:{kw}')
-            break
+    if 'title_company' in title_hits:
+        impact_score += 30
+        impact_factors.append(f"제목회사:{TITLE_COMPANY_KEYWORDS[title_hits['title_company'][0]]}")
 
     # 6-2. B2B 숙박 IT/솔루션 관련 보너스 (+50점)
     # ONDA 핵심 비즈니스와 직접 관련된 B2B 솔루션/IT 키워드
-    b2b_solution_keywords = [
-        # 숙박 솔루션
-        'pms', 'cms', 'rms', '채널매니저', '채널 매니저', '예약 시스템',
-        '숙박 솔루션', '호텔 솔루션', '숙박업 솔루션', '통합 관리',
-        '객실 관리', '예약 관리', '재고 관리', '요금 관리',
-        # B2B 키워드
-        'b2b', 'saas', 'api', '연동', '플랫폼 연동', 'ota 연동',
-        # 업계 행사
-        '호텔페어', '호텔쇼', '관광박람회', 'itb', 'wtm',
-        # 기술 키워드
-        '자동화', 'ai 도입', '디지털 전환', 'dx', '클라우드'
-    ]
-    b2b_match = 0
-    for kw in b2b_solution_keywords:
-        if kw.lower() in text:
-            b2b_match += 1
+    b2b_match = count('b2b_solution')
     if b2b_match >= 2:
         impact_score += 50
         impact_factors.append('B2B솔루션')
@@ -1219,22 +2045,7 @@ def calculate_industry_impact_score(article):
 
     # 6-3. 숙박업계 AI 활용 관련 보너스 (+70점)
     # 호스피탈리티 업계의 AI 도입, 디지털 전환 관련 기사는 매우 중요
-    ai_hospitality_keywords = [
-        # AI + 숙박/호텔 조합
-        'ai 호텔', 'ai 숙박', 'ai 예약', 'ai 플랫폼', 'ai 도입',
-        '인공지능 호텔', '인공지능 숙박', '인공지능 예약',
-        # 숙박업 디지털 전환
-        '숙박 ai', '호텔 ai', '숙박플랫폼', '플랫폼 탈출',
-        '직접 예약', 'd2c', '자체 예약', '수수료 절감',
-        # 챗봇/자동화
-        '호텔 챗봇', '숙박 챗봇', '예약 챗봇', '자동 응대',
-        # 데이터/분석
-        '수요 예측', '가격 최적화', '동적 가격', '레비뉴 매니지먼트'
-    ]
-    ai_hosp_match = 0
-    for kw in ai_hospitality_keywords:
-        if kw.lower() in text:
-            ai_hosp_match += 1
+    ai_hosp_match = count('ai_hospitality')
     if ai_hosp_match >= 2:
         impact_score += 70
         impact_factors.append('AI숙박업')
@@ -1242,112 +2053,17 @@ def calculate_industry_impact_score(article):
         impact_score += 40
         impact_factors.append('AI숙박업')
 
-    # 7. 회사별 중요도 점수 (업계 기업 소식 우선)
-    # Tier 0: 자사 ONDA (+80점) - 상향
-    # Tier 1: 국내 대형 OTA (+60점) - 상향: 야놀자, 여기어때, 마이리얼트립
-    # Tier 2: 국내 주요 플랫폼 (+50점) - 상향: 네이버, 카카오, 쏘카, 인터파크트리플
-    # Tier 3: 글로벌 대형 OTA (+50점) - 상향: 에어비앤비, 부킹홀딩스, 익스피디아, 트립닷컴
-    # Tier 4: 글로벌 메타서치/검색 (+40점) - 상향
-    # Tier 5: 국내 중소 플랫폼 (+45점) - 상향
-    # Tier 6: 글로벌 숙박/호텔 플랫폼 (+35점) - 상향
-    # Tier 7: 호텔 체인/숙박업체 (+40점) - 신규 추가
-    # 업계 키워드: PMS, CMS, GDS 등 (+35점)
-
-    company_tiers = {
-        # Tier 0: 자사 (최고 우선순위)
-        0: {
-            'score': 80,
-            'label': '자사',
-            'keywords': ['온다', 'onda']
-        },
-        # Tier 1: 국내 대형 OTA (시총/기업가치 높음)
-        1: {
-            'score': 60,
-            'label': '국내대형OTA',
-            'keywords': ['야놀자', 'nol', '놀유니버스', '여기어때', '마이리얼트립', '마리트']
-        },
-        # Tier 2: 국내 주요 플랫폼 (대기업/상장사)
-        2: {
-            'score': 50,
-            'label': '국내플랫폼',
-            'keywords': ['네이버', '카카오', '쏘카', '인터파크트리플', '인터파크', '위메프', '티몬']
-        },
-        # Tier 3: 글로벌 대형 OTA (시총 수십~수백조)
-        3: {
-            'score': 50,
-            'label': '글로벌대형OTA',
-            'keywords': ['에어비앤비', 'airbnb', '부킹닷컴', 'booking.com', '부킹홀딩스',
-                        '익스피디아', 'expedia', '트립닷컴', 'trip.com']
-        },
-        # Tier 4: 글로벌 메타서치/검색엔진 (트래픽 대형)
-        4: {
-            'score': 40,
-            'label': '메타서치',
-            'keywords': ['구글호텔', 'google hotel', '트립어드바이저', 'tripadvisor',
-                        '스카이스캐너', 'skyscanner', '카약', 'kayak', '트리바고', 'trivago',
-                        '호텔스컴바인', '메타서치', '여행 검색 엔진', '호텔 검색 플랫폼']
-        },
-        # Tier 5: 국내 중소 플랫폼 (국내라 해외보다 우선)
-        5: {
-            'score': 45,
-            'label': '국내중소OTA',
-            'keywords': ['트립비토즈', '타이드스퀘어', '크리에이트립', '세시간전',
-                        '더케이교직원나라', '교직원나라']
-        },
-        # Tier 6: 글로벌 숙박/호텔 플랫폼
-        6: {
-            'score': 35,
-            'label': '글로벌숙박',
-            'keywords': ['아고다', 'agoda', '호텔스닷컴', 'hotels.com']
-        },
-        # Tier 7: 호텔 체인/숙박업체 (점수 낮춤 - B2B 고객 아님)
-        7: {
-            'score': 15,
-            'label': '호텔체인',
-            'keywords': ['메리어트', 'marriott', '힐튼', 'hilton', '아코르', 'accor',
-                        'ihg', '하얏트', 'hyatt', '신라호텔', '롯데호텔', '파라다이스호텔',
-                        '조선호텔', '그랜드하얏트', '호텔신라', '워커힐']
-        },
-        # Tier 8: 중소형 숙박 (ONDA 주요 고객층)
-        8: {
-            'score': 35,
-            'label': '중소형숙박',
-            'keywords': ['펜션', '모텔', '게스트하우스', '민박', '풀빌라', '호스텔',
-                        '중소형 숙박', '소형 숙박', '개인 숙박', '독채', '한옥스테이']
-        },
-    }
-
-    # 업계 키워드 (회사 특정 안되어도 업계 전체 이슈면 중요)
-    industry_keywords = {
-        'score': 35,
-        'label': '업계이슈',
-        'keywords': ['여행/숙박/호텔업계', '여행/숙박/호텔산업', '숙박 위탁 운영', '숙박 예약',
-                    '생활형 숙박시설', 'gds', 'pms', 'cms', 'ota', '온라인여행사',
-                    '호스피탈리티', '숙박업', '숙박산업', '호텔산업', '객실 점유율',
-                    'adr', 'revpar', '채널매니저', '예약 시스템']
-    }
-
-    company_found = False
-
-    # Tier 순서대로 체크 (낮은 Tier = 높은 우선순위)
-    for tier in sorted(company_tiers.keys()):
-        if company_found:
-            break
-        tier_info = company_tiers[tier]
-        for keyword in tier_info['keywords']:
-            if keyword.lower() in text:
-                impact_score += tier_info['score']
-                impact_factors.append(f"{tier_info['label']}:{keyword}")
-                company_found = True
-                break
-
+    # 7. 회사별 중요도 점수 (업계 기업 소식 우선, COMPANY_TIERS 참고)
+    # Tier 순서대로 펼친 목록에서 가장 앞의 매칭 = 가장 높은 우선순위 회사
+    if 'company_tier' in hits:
+        tier_info, keyword = COMPANY_TIER_KEYWORDS[hits['company_tier'][0]]
+        impact_score += tier_info['score']
+        impact_factors.append(f"{tier_info['label']}:{keyword}")
     # 회사가 특정되지 않았으면 업계 키워드 체크
-    if not company_found:
-        for keyword in industry_keywords['keywords']:
-            if keyword.lower() in text:
-                impact_score += industry_keywords['score']
-                impact_factors.append(f"{industry_keywords['label']}:{keyword}")
-                break
+    elif 'industry' in hits:
+        keyword = INDUSTRY_KEYWORDS['keywords'][hits['industry'][0]]
+        impact_score += INDUSTRY_KEYWORDS['score']
+        impact_factors.append(f"{INDUSTRY_KEYWORDS['label']}:{keyword}")
 
     # 8. 24시간 이내 기사 보너스 (+25점)
     if article.get('is_recent', False):
@@ -1356,15 +2072,7 @@ def calculate_industry_impact_score(article):
 
     # 9. 프로모션/이벤트/할인 기사 페널티 (-40점)
     # 일반적인 마케팅 기사는 뉴스 가치가 낮음
-    promo_keywords = [
-        '할인', '프로모션', '이벤트', '쿠폰', '특가', '세일',
-        '얼리버드', '최대 할인', '% 할인', '무료', '경품',
-        '추첨', '응모', '선착순', '한정', '페스타', '위크'
-    ]
-    promo_count = 0
-    for kw in promo_keywords:
-        if kw in text:
-            promo_count += 1
+    promo_count = count('promo')
 
     if promo_count >= 2:
         # 프로모션 키워드가 2개 이상이면 큰 페널티
@@ -1377,25 +2085,10 @@ def calculate_industry_impact_score(article):
 
     # 9-1. 호텔 B2C 기사 페널티 (-50점)
     # 호텔 패키지, 뷔페, F&B, 다이닝 등은 B2B 숙박 IT와 관련 낮음
-    hotel_b2c_keywords = [
-        # 패키지/상품
-        '패키지', '상품 출시', '신년 패키지', '연말 패키지', '겨울 패키지',
-        '해돋이', '새해맞이', '연말연시',
-        # F&B/다이닝
-        '뷔페', 'f&b', '다이닝', '레스토랑', '조식', '브런치',
-        '먹거리', '맛집', '미식', '셰프', '메뉴',
-        # 호텔 시설/서비스 (B2C)
-        '스파', '수영장', '피트니스', '웨딩', '연회', '컨벤션',
-        '호캉스', '스테이케이션', '휴식'
-    ]
-    hotel_b2c_count = 0
-    for kw in hotel_b2c_keywords:
-        if kw in text:
-            hotel_b2c_count += 1
+    hotel_b2c_count = count('hotel_b2c')
 
     # 호텔업계 + B2C 키워드 조합이면 페널티
-    hotel_industry_keywords = ['호텔업계', '호텔·리조트', '특급호텔', '5성급', '호텔 업계']
-    has_hotel_industry = any(kw in text for kw in hotel_industry_keywords)
+    has_hotel_industry = 'hotel_industry' in hits
 
     if has_hotel_industry and hotel_b2c_count >= 2:
         impact_score -= 60
@@ -1408,61 +2101,16 @@ def calculate_industry_impact_score(article):
         impact_factors.append('호텔B2C기사')
 
     # 10. 중요 발표 보너스 (기자간담회, 신제품 출시 등)
-    major_event_keywords = [
-        '기자간담회', '기자회견', '컨퍼런스', '신제품', '신규 서비스',
-        '플랫폼 개편', '리브랜딩', '합작', '제휴', 'MOU', '협약'
-    ]
-    for kw in major_event_keywords:
-        if kw in text:
-            impact_score += 15
-            impact_factors.append('주요발표')
-            break
+    if 'major_event' in hits:
+        impact_score += 15
+        impact_factors.append('주요발표')
 
     # 10-1. 지방정부/지방공기업 페널티 (-100점 ~ -500점)
     # 지자체, 지방관광공사, 도청, 시청 등 지방 이슈는 ONDA 비즈니스와 관련 낮음
     # 단, 직접적인 숙박업 지원책/모집 공고는 예외
-    local_gov_keywords = [
-        '지자체', '도청', '시청', '군청', '구청',
-        '도지사', '시장', '군수', '구청장',
-        '지방관광공사', '도관광공사', '시관광공사',
-        # 지방관광공사/재단 (전체 - 인천 등 누락분 추가)
-        '경기관광공사', '강원관광재단', '충남관광재단', '충북관광재단',
-        '전남관광재단', '전북관광재단', '경남관광재단', '경북관광공사',
-        '인천관광공사', '부산관광공사', '대구관광재단', '대전관광공사',
-        '광주관광재단', '울산관광재단', '제주관광공사', '세종관광재단',
-        # 지역 이슈
-        '지역 관광', '지역 축제', '지역 행사', '군 축제', '읍면동',
-        '관광안내소', '관광 인프라', '지역 명소', '옹진군', '선재도'
-    ]
-
-    # 신년사/취임사 등 일반 행정 기사는 강력히 제외
-    ceremonial_keywords = [
-        '신년사', '취임사', '이취임', '시무식', '기념식',
-        '신년 인사', '신년 메시지', '새해 인사', '새해 메시지',
-        '시정연설', '도정연설', '군정연설', '구정연설'
-    ]
-
-    # 직접적 지원책 키워드 (이 경우 페널티 감소) - 숙박업 직접 관련만
-    direct_support_keywords = [
-        '숙박업 지원', '숙박시설 지원', '숙박업체 지원',
-        '소상공인 지원', '창업 지원', '융자', '대출 지원',
-        '숙박업 보조금', '숙박 지원금'
-    ]
-
-    local_gov_count = 0
-    for kw in local_gov_keywords:
-        if kw in text:
-            local_gov_count += 1
-
-    ceremonial_count = 0
-    for kw in ceremonial_keywords:
-        if kw in text:
-            ceremonial_count += 1
-
-    direct_support_count = 0
-    for kw in direct_support_keywords:
-        if kw in text:
-            direct_support_count += 1
+    local_gov_count = count('local_gov')
+    ceremonial_count = count('ceremonial')
+    direct_support_count = count('direct_support')
 
     # 신년사/취임사 등은 강력한 페널티 (-500점, 사실상 제외)
     if ceremonial_count > 0:
@@ -1478,16 +2126,7 @@ def calculate_industry_impact_score(article):
 
     # 11. 비판/이슈 기사 보너스 (+40점)
     # 기자 취재 기사, 플랫폼 횡포/갑질, 논란 등은 뉴스 가치 높음
-    critical_keywords = [
-        '갑질', '횡포', '논란', '피해', '불만', '분쟁', '고발',
-        '제재', '과징금', '벌금', '소송', '고소', '수사', '조사',
-        '의혹', '비판', '문제점', '부작용', '위법', '불법',
-        '독점', '불공정', '폭리', '착취', '임금체불', '해고'
-    ]
-    critical_count = 0
-    for kw in critical_keywords:
-        if kw in text:
-            critical_count += 1
+    critical_count = count('critical')
 
     if critical_count >= 2:
         # 비판 키워드가 2개 이상이면 큰 보너스
@@ -1500,11 +2139,8 @@ def calculate_industry_impact_score(article):
 
     # 11-1. 해외 사건/사고 기사 페널티 (-100점)
     # 해외 리조트 화재, 사고 등은 국내 숙박 IT 업계와 직접 관련 없음
-    incident_keywords = ['폭발', '화재', '사망', '부상', '참사', '재난', '테러', '총격', '붕괴', '침몰', '추락']
-    foreign_keywords = ['스위스', '미국', '일본', '중국', '유럽', '태국', '베트남', '프랑스', '독일', '영국', '호주', '뉴질랜드', '캐나다', '멕시코', '브라질', '인도네시아', '필리핀', '말레이시아', '이탈리아', '스페인']
-
-    has_incident = any(kw in text for kw in incident_keywords)
-    has_foreign = any(kw in text for kw in foreign_keywords)
+    has_incident = 'incident' in hits
+    has_foreign = 'foreign' in hits
 
     # 해외 + 사건/사고 조합이면 페널티
     if has_incident and has_foreign:
@@ -1518,30 +2154,7 @@ def calculate_industry_impact_score(article):
     # 12. 정치 기사 페널티 (-500점, 완전 제외)
     # 정치인 개인의 사적 이슈, 수사, 기소, 스캔들 등은 산업 뉴스와 무관
     # 정책 기사(산업에 영향)와 정치 기사(개인 이슈)를 구분
-    politics_keywords = [
-        # 정치인/정당 관련 (한국)
-        '대통령', '전 대통령', '국회의원', '장관', '전 장관',
-        '여당', '야당', '민주당', '국민의힘', '정치인',
-        # 해외 정치인 (추가)
-        '트럼프', 'trump', '바이든', 'biden', '오바마', '시진핑',
-        '푸틴', '마크롱', '기시다', '백악관', 'white house',
-        # 정치 스캔들/수사 관련 (강화)
-        '기소', '구속', '체포', '영장', '검찰', '경찰 수사',
-        '뇌물', '횡령', '배임', '비리', '스캔들', '탄핵',
-        '청문회', '국정감사', '특검', '공소', '재판', '불구속',
-        '피의자', '혐의', '압수수색',
-        # 성범죄/스캔들 관련 (추가)
-        '엡스타인', 'epstein', '성범죄', '성추행', '성폭행',
-        # 정치인 가족/측근 (강화)
-        '문다혜', '문재인', '윤석열', '김건희',
-        '딸', '아들', '부인', '남편', '측근', '비서', '사위', '며느리',
-        # 선거 관련
-        '대선', '총선', '지방선거', '후보', '공천', '출마'
-    ]
-    politics_count = 0
-    for kw in politics_keywords:
-        if kw in text:
-            politics_count += 1
+    politics_count = count('politics')
 
     # 정치 키워드가 1개라도 있으면 강력한 페널티
     if politics_count >= 2:
@@ -1554,42 +2167,8 @@ def calculate_industry_impact_score(article):
     # 12-1. 호스피탈리티/숙박 맥락 검증 페널티 (-80점)
     # 야놀자 등 키워드가 매칭되어도 실제 숙박/여행 관련 내용이 아니면 페널티
     # 예: 야구장에서 야놀자 광고가 언급되는 경우
-    hospitality_context_keywords = [
-        # 숙박 관련
-        '숙박', '호텔', '객실', '예약', '체크인', '체크아웃', '숙소',
-        '리조트', '펜션', '게스트하우스', '모텔', '민박', '풀빌라',
-        # 여행 관련
-        '여행', '관광', '투어', '휴양', '휴가', '여행객', '관광객',
-        # 플랫폼/서비스 관련
-        'OTA', '플랫폼', '앱', '예약 서비스', '숙박 플랫폼',
-        # 업계 관련
-        '호스피탈리티', '숙박업', '호텔업', '여행업', '관광업',
-        # 비즈니스 관련
-        '투자', '펀딩', '인수', '합병', '실적', '매출', '영업이익'
-    ]
-
-    # 비관련 맥락 키워드 (이 키워드가 많으면 숙박/여행과 관련 없을 가능성)
-    unrelated_context_keywords = [
-        # 스포츠
-        '야구', '축구', '농구', '배구', '경기장', '스타디움', '관중',
-        '프로야구', 'KBO', 'K리그', '올림픽', '월드컵',
-        # 연예/엔터
-        '드라마', '영화', '콘서트', '공연', '연예인', '아이돌', '배우',
-        # 정치
-        '국회', '정당', '선거', '후보',
-        # 기타
-        '주식', '코스피', '코스닥', '부동산', '아파트', '분양'
-    ]
-
-    hospitality_context_count = 0
-    for kw in hospitality_context_keywords:
-        if kw in text:
-            hospitality_context_count += 1
-
-    unrelated_context_count = 0
-    for kw in unrelated_context_keywords:
-        if kw in text:
-            unrelated_context_count += 1
+    hospitality_context_count = count('hospitality_context')
+    unrelated_context_count = count('unrelated_context')
 
     # 호스피탈리티 맥락이 거의 없고 비관련 맥락이 많으면 페널티
     if hospitality_context_count <= 1 and unrelated_context_count >= 2:
@@ -1626,18 +2205,8 @@ def calculate_industry_impact_score(article):
     return impact_score
 
 
-def calculate_similarity(title1, title2):
-    """
-    두 제목의 유사도 계산 (강화된 버전)
-    """
-    # 특수문자 제거하고 단어로 분리
-    def clean_and_split(text):
-        text = re.sub(r'[^\w\s]', '', text.lower())
-        return set(text.split())
-
-    words1 = clean_and_split(title1)
-    words2 = clean_and_split(title2)
-
+def similarity_from_tokens(words1, key_hits1, words2, key_hits2):
+    """미리 분리한 단어/핵심 패턴으로 calculate_similarity 계산"""
     if not words1 or not words2:
         return 0
 
@@ -1646,69 +2215,40 @@ def calculate_similarity(title1, title2):
 
     jaccard = len(common) / len(total) if total else 0
 
-    # 핵심 키워드 중복 체크 (회사명, 금액 등)
-    key_patterns = [
-        r'야놀자', r'여기어때', r'에어비앤비', r'아고다', r'부킹', r'트립닷컴',
-        r'마이리얼트립', r'nol', r'\d+억', r'\d+조', r'\d+%'
-    ]
-
-    title1_lower = title1.lower()
-    title2_lower = title2.lower()
-
-    shared_keys = 0
-    for pattern in key_patterns:
-        if re.search(pattern, title1_lower) and re.search(pattern, title2_lower):
-            shared_keys += 1
-
     # 핵심 키워드가 2개 이상 공유되면 유사도 높임
-    if shared_keys >= 2:
+    if len(key_hits1 & key_hits2) >= 2:
         jaccard = max(jaccard, 0.6)
 
     return jaccard
 
 
+def calculate_similarity(title1, title2):
+    """
+    두 제목의 유사도 계산 (강화된 버전)
+    """
+    return similarity_from_tokens(
+        title_words(title1), key_pattern_hits(title1),
+        title_words(title2), key_pattern_hits(title2)
+    )
+
+
 def extract_article_topic(article):
     """
     기사의 핵심 토픽 추출 (중복 판단용)
+    회사명/금액/이벤트 타입 (title_normalizer.topic_from_text, 텍스트 기준 캐시)
     """
     text = (article['title'] + ' ' + article.get('summary', '')).lower()
-
-    # 회사명 추출
-    companies = []
-    company_patterns = ['야놀자', '여기어때', '에어비앤비', '아고다', '부킹닷컴',
-                       '트립닷컴', '마이리얼트립', 'nol', '놀', '온다', 'onda']
-    for company in company_patterns:
-        if company in text:
-            companies.append(company)
-
-    # 금액 추출
-    amounts = re.findall(r'\d+억|\d+조|\d+만', text)
-
-    # 이벤트 타입 추출
-    event_type = None
-    if any(kw in text for kw in ['투자', '펀딩', '시리즈']):
-        event_type = 'investment'
-    elif any(kw in text for kw in ['인수', '합병', 'm&a']):
-        event_type = 'ma'
-    elif any(kw in text for kw in ['출시', '런칭', '오픈']):
-        event_type = 'launch'
-    elif any(kw in text for kw in ['실적', '매출', '영업이익']):
-        event_type = 'earnings'
+    companies, amounts, event_type = topic_from_text(text)
 
     return {
-        'companies': companies,
-        'amounts': amounts,
+        'companies': list(companies),
+        'amounts': list(amounts),
         'event_type': event_type
     }
 
 
-def is_same_story(article1, article2):
-    """
-    두 기사가 같은 사건/스토리인지 판단 (강화된 버전)
-    """
-    topic1 = extract_article_topic(article1)
-    topic2 = extract_article_topic(article2)
-
+def same_story_from_tokens(topic1, title_company1, words1, topic2, title_company2, words2):
+    """미리 추출한 토픽/제목 회사/제목 단어로 is_same_story 판단"""
     # 같은 회사 + 같은 이벤트 타입 = 같은 스토리
     shared_companies = set(topic1['companies']) & set(topic2['companies'])
     if shared_companies and topic1['event_type'] == topic2['event_type'] and topic1['event_type'] is not None:
@@ -1719,70 +2259,227 @@ def is_same_story(article1, article2):
     if shared_companies and shared_amounts:
         return True
 
-    # 제목의 첫 번째 회사명이 같고 비슷한 주제면 같은 스토리
-    title1 = article1['title'].lower()
-    title2 = article2['title'].lower()
-
-    # 제목에서 회사명 추출
-    companies_in_title = ['야놀자', '여기어때', '에어비앤비', '아고다', '부킹닷컴',
-                          '트립닷컴', '마이리얼트립', 'nol', '놀유니버스', '온다']
-    title1_company = None
-    title2_company = None
-    for company in companies_in_title:
-        if company in title1 and title1_company is None:
-            title1_company = company
-        if company in title2 and title2_company is None:
-            title2_company = company
-
     # 같은 회사가 제목에 있으면 중복 가능성 높음
-    if title1_company and title1_company == title2_company:
-        # 제목의 공통 단어가 3개 이상이면 중복
-        words1 = set(re.sub(r'[^\w\s]', '', title1).split())
-        words2 = set(re.sub(r'[^\w\s]', '', title2).split())
-        common_words = words1 & words2
-        # 불용어 제외
-        stopwords = {'의', '를', '을', '이', '가', '은', '는', '에', '에서', '와', '과', '로', '으로', '도', '만', '더', '등'}
-        meaningful_common = common_words - stopwords
+    if title_company1 and title_company1 == title_company2:
+        # 제목의 공통 단어가 3개 이상이면 중복 (불용어 제외)
+        meaningful_common = (words1 & words2) - STORY_STOPWORDS
         if len(meaningful_common) >= 3:
             return True
 
     return False
 
 
+def is_same_story(article1, article2):
+    """
+    두 기사가 같은 사건/스토리인지 판단 (강화된 버전)
+    """
+    return get_article_features(article1).same_story(get_article_features(article2))
+
+
+# ============================================
+# 기사 특징 (기사당 한 번만 계산하여 모든 단계에서 재사용)
+# ============================================
+
+class ArticleFeatures:
+    """
+    기사 제목/요약에서 뽑은 특징 (점수 계산, 중복 제거, 다양성, TOP 20 재검사 공용)
+
+    기사 dict는 JSON으로 저장되므로 특징은 기사에 넣지 않고
+    get_article_features()가 (제목, 요약) 기준으로 캐시
+    """
+
+    __slots__ = (
+        'title', 'text', 'title_lower', 'words', 'key_hits', 'core_keywords', 'entities',
+        'title_company', 'topic', 'amounts', 'event_type', 'hits', 'title_hits',
+        'main_company', 'article_topic',
+    )
+
+    def __init__(self, title, summary=''):
+        self.title = title
+        self.text = (title + ' ' + summary).lower()
+        self.title_lower = title.lower()
+
+        # 제목 토큰/엔티티 (중복 판단용)
+        self.words = title_words(title)
+        self.key_hits = key_pattern_hits(title)
+        self.core_keywords = extract_core_keywords(title)
+        self.entities = find_core_entities(title)
+        self.title_company = find_title_company(title)
+
+        # 토픽 (회사/금액/이벤트 타입)
+        self.topic = extract_article_topic({'title': title, 'summary': summary})
+        self.amounts = self.topic['amounts']
+        self.event_type = self.topic['event_type']
+
+        # 키워드 그룹 매칭 (본문 + 제목)
+        self.hits = match_keywords(self.text)
+        self.title_hits = match_keywords(self.title_lower)
+
+        self.main_company = None
+        if 'main_company' in self.hits:
+            self.main_company = MAIN_COMPANY_ALIASES[self.hits['main_company'][0]][0]
+        self.article_topic = None
+        if 'article_topic' in self.hits:
+            self.article_topic = ARTICLE_TOPIC_KEYWORDS[self.hits['article_topic'][0]][0]
+
+    def similarity(self, other):
+        """calculate_similarity와 동일"""
+        return similarity_from_tokens(self.words, self.key_hits, other.words, other.key_hits)
+
+    def same_story(self, other):
+        """is_same_story와 동일"""
+        return same_story_from_tokens(self.topic, self.title_company, self.words,
+                                      other.topic, other.title_company, other.words)
+
+    def same_core_keywords(self, other):
+        """has_same_core_keywords와 동일"""
+        return core_keywords_match(self.core_keywords, self.entities, other.core_keywords, other.entities)
+
+    def is_duplicate_of(self, other, threshold):
+        """remove_duplicates의 중복 규칙 (유사도 / 같은 스토리 / 핵심 키워드 공유)"""
+        return (self.similarity(other) >= threshold
+                or self.same_story(other)
+                or self.same_core_keywords(other))
+
+
+FeatureCacheInfo = namedtuple('FeatureCacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class ArticleFeatureCache:
+    """
+    실행 단위 기사 특징 캐시 ((제목, 요약) -> ArticleFeatures)
+
+    크기 제한 없이 실행 중 본 기사를 모두 보관 - 기사 수와 관계없이 특징은 한 번만 계산하고
+    이후 단계(히스토리/점수/중복 제거/다양성)가 같은 객체를 재사용
+    실행 시작 시 cache_clear()로 비움 (main), cache_info()는 lru_cache와 같은 형식
+    """
+
+    def __init__(self):
+        self._features = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, title, summary):
+        key = (title, summary)
+        features = self._features.get(key)
+        if features is not None:
+            self.hits += 1
+            return features
+        self.misses += 1
+        # 동시에 같은 기사를 처음 본 스레드가 여럿이어도 저장되는 객체는 하나
+        return self._features.setdefault(key, ArticleFeatures(title, summary))
+
+    def cache_clear(self):
+        self._features = {}
+        self.hits = 0
+        self.misses = 0
+
+    def cache_info(self):
+        return FeatureCacheInfo(self.hits, self.misses, None, len(self._features))
+
+
+ARTICLE_FEATURES = ArticleFeatureCache()
+
+
+def get_article_features(article):
+    """기사 특징 (같은 제목/요약이면 캐시된 객체 반환 - 읽기 전용으로 사용)"""
+    return ARTICLE_FEATURES.get(article['title'], article.get('summary', '') or '')
+
+
+def _word_pairs(words):
+    return combinations(sorted(words), 2)
+
+
+def dedup_block_keys(features):
+    """
+    규칙 기반 후보 버킷 키 (각 규칙이 참이 되려면 반드시 공유해야 하는 키)
+    - ('pp', 패턴쌍): 핵심 패턴 2개 공유 시 유사도 보정
+    - ('ce', 회사, 이벤트) / ('ca', 회사, 금액): 같은 스토리 (회사+이벤트, 회사+금액)
+    - ('tc', 제목 회사, 단어쌍): 같은 스토리 (제목 회사 + 공통 단어 3개 이상)
+    - ('kk', 키워드쌍): 핵심 키워드 2개 이상 공유
+    키워드가 2개 이하인 제목은 키워드 1개만 겹쳐도 중복이므로 별도 처리 (remove_duplicates 참고)
+    """
+    keys = {('pp',) + pair for pair in combinations(sorted(features.key_hits), 2)}
+
+    for company in features.topic['companies']:
+        if features.event_type is not None:
+            keys.add(('ce', company, features.event_type))
+        keys.update(('ca', company, amount) for amount in features.amounts)
+
+    if features.title_company:
+        meaningful = features.words - STORY_STOPWORDS
+        keys.update(('tc', features.title_company) + pair for pair in _word_pairs(meaningful))
+
+    keys.update(('kk',) + pair for pair in _word_pairs(features.core_keywords))
+    return keys
+
+
 def remove_duplicates(articles, threshold=0.35):
     """
     중복 기사 제거 (강화된 버전)
     - 유사도 임계값 낮춤 (0.5 -> 0.35)
     - 같은 스토리 판단 로직 추가
     - 핵심 키워드 공유 체크 추가
+
+    모든 기사 쌍을 비교하지 않고 후보 버킷 안에서만 규칙을 적용:
+    - 제목 유사도: 제목 단어 역색인 (임계값 > 0이면 공통 단어가 하나 이상 있어야 함)
+    - 같은 스토리/핵심 키워드/패턴 보정: 규칙별 버킷 키 (dedup_block_keys)
+    후보는 중복일 수 있는 기사를 모두 포함하고, 먼저 남은 기사부터 비교하므로 결과는 전체 비교와 같음
     """
-    unique = []
+    word_postings = {}
+    postings = {}
+    small_keyword_postings = {}  # 핵심 키워드 2개 이하인 기사: 키워드 1개 공유로도 중복
+    keyword_postings = {}
+    kept = {}  # 순번 -> (기사, 특징), 삽입 순서 = 결과 순서
+    next_pos = 0
 
     for article in articles:
-        is_duplicate = False
-
-        for existing in unique:
-            # 1. 제목 유사도 체크
-            similarity = calculate_similarity(article['title'], existing['title'])
-
-            # 2. 같은 스토리인지 체크 (회사+이벤트 또는 회사+금액)
-            same_story = is_same_story(article, existing)
-
-            # 3. 핵심 키워드 공유 체크 (회사명 + 공통 키워드)
-            same_keywords = has_same_core_keywords(article['title'], existing['title'])
+        features = get_article_features(article)
+        block_keys = dedup_block_keys(features)
+        core_keywords = features.core_keywords
 
-            if similarity >= threshold or same_story or same_keywords:
-                is_duplicate = True
+        if threshold <= 0:
+            candidates = set(kept)  # 모든 쌍이 유사도 기준을 통과
+        else:
+            candidates = set()
+            for word in features.words:
+                candidates.update(word_postings.get(word, ()))
+        for key in block_keys:
+            candidates.update(postings.get(key, ()))
+        for keyword in core_keywords:
+            candidates.update(small_keyword_postings.get(keyword, ()))
+            if len(core_keywords) <= 2:
+                candidates.update(keyword_postings.get(keyword, ()))
+
+        for pos in sorted(candidates):
+            entry = kept.get(pos)
+            if entry is None:  # 이미 더 높은 점수 기사로 교체됨
+                continue
+            existing, existing_features = entry
+            if features.is_duplicate_of(existing_features, threshold):
                 # 점수가 더 높은 것 유지
                 if article.get('score', 0) > existing.get('score', 0):
-                    unique.remove(existing)
-                    unique.append(article)
+                    del kept[pos]
+                else:
+                    article = None
                 break
 
-        if not is_duplicate:
-            unique.append(article)
+        if article is None:
+            continue
+
+        pos = next_pos
+        next_pos += 1
+        kept[pos] = (article, features)
+        for word in features.words:
+            word_postings.setdefault(word, []).append(pos)
+        for key in block_keys:
+            postings.setdefault(key, []).append(pos)
+        for keyword in core_keywords:
+            keyword_postings.setdefault(keyword, []).append(pos)
+            if len(core_keywords) <= 2:
+                small_keyword_postings.setdefault(keyword, []).append(pos)
 
-    return unique
+    return [article for article, _ in kept.values()]
 
 
 def get_main_company(article):
@@ -1790,53 +2487,8 @@ def get_main_company(article):
     기사의 주요 회사명 추출 (OTA/플랫폼 중심)
     Tier 순서대로 체크하여 가장 중요한 회사 반환
     """
-    text = (article['title'] + ' ' + article.get('summary', '')).lower()
-
-    # 회사 그룹 정의 (같은 그룹은 동일 회사로 취급)
-    # 주의: 순서가 중요함! 더 구체적인 키워드를 먼저 체크
-    company_groups = [
-        # Tier 1: 국내 대형 OTA (야놀자를 먼저 체크해야 "야놀자리서치...온다" 같은 기사에서 야놀자로 분류됨)
-        ('야놀자', ['야놀자', 'nol', '놀유니버스', '놀 유니버스', '야놀자리서치', '야놀자클라우드']),
-        # Tier 0: 자사 (온다는 동사로 오인될 수 있어 나중에 체크)
-        ('온다', ['onda']),  # '온다'는 동사와 혼동되므로 영문만 사용
-        ('여기어때', ['여기어때', '위드이노베이션']),
-        ('마이리얼트립', ['마이리얼트립', '마리트']),
-        # Tier 2: 국내 주요 플랫폼
-        ('네이버', ['네이버']),
-        ('카카오', ['카카오']),
-        ('쏘카', ['쏘카', 'socar']),
-        ('인터파크', ['인터파크트리플', '인터파크']),
-        ('티몬', ['티몬', 'tmon']),
-        ('위메프', ['위메프']),
-        # Tier 3: 글로벌 대형 OTA
-        ('에어비앤비', ['에어비앤비', 'airbnb']),
-        ('부킹닷컴', ['부킹닷컴', 'booking.com', '부킹홀딩스', '부킹']),
-        ('익스피디아', ['익스피디아', 'expedia']),
-        ('트립닷컴', ['트립닷컴', 'trip.com']),
-        # Tier 4: 글로벌 메타서치
-        ('구글호텔', ['구글호텔', 'google hotel']),
-        ('트립어드바이저', ['트립어드바이저', 'tripadvisor']),
-        ('스카이스캐너', ['스카이스캐너', 'skyscanner']),
-        ('카약', ['카약', 'kayak']),
-        ('트리바고', ['트리바고', 'trivago']),
-        ('호텔스컴바인', ['호텔스컴바인']),
-        # Tier 5: 국내 중소 OTA
-        ('트립비토즈', ['트립비토즈']),
-        ('타이드스퀘어', ['타이드스퀘어']),
-        ('크리에이트립', ['크리에이트립']),
-        ('세시간전', ['세시간전']),
-        ('더케이교직원나라', ['더케이교직원나라', '교직원나라']),
-        # Tier 6: 글로벌 숙박
-        ('아고다', ['아고다', 'agoda']),
-        ('호텔스닷컴', ['호텔스닷컴', 'hotels.com']),
-    ]
-
-    for main_company, aliases in company_groups:
-        for alias in aliases:
-            if alias in text:
-                return main_company
-
-    return None
+    # 회사 그룹은 MAIN_COMPANY_GROUPS 참고 (순서가 중요함 - 가장 앞의 매칭 우선)
+    return get_article_features(article).main_company
 
 
 def get_article_topic(article):
@@ -1844,29 +2496,8 @@ def get_article_topic(article):
     기사의 주요 주제/이슈 추출
     같은 이슈에 대한 기사가 여러 개일 때 다양성 확보용
     """
-    text = (article['title'] + ' ' + article.get('summary', '')).lower()
-
-    # 주요 이슈/주제 키워드 그룹
-    topic_groups = [
-        ('생활숙박시설', ['생활숙박시설', '생숙', '레지던스', '주거용', '불법숙박', '숙박시설 규제']),
-        ('외국인관광객', ['외국인 관광객', '외래 관광객', '인바운드', '방한 관광객', '관광객 유치']),
-        ('항공', ['항공', '비행기', '공항', '노선', '취항', '항공권']),
-        ('크루즈', ['크루즈', '유람선', '선박']),
-        ('카지노', ['카지노', '복합리조트', 'ir']),
-        ('면세점', ['면세점', '면세']),
-        ('호캉스', ['호캉스', '스테이케이션', '호텔 패키지']),
-        ('투자유치', ['투자 유치', '시리즈', '펀딩', '투자금']),
-        ('인수합병', ['인수', '합병', 'm&a', '매각']),
-        ('ipo', ['ipo', '상장', '기업공개']),
-        ('실적발표', ['실적', '매출', '영업이익', '분기']),
-    ]
-
-    for topic_name, keywords in topic_groups:
-        for kw in keywords:
-            if kw in text:
-                return topic_name
-
-    return None
+    # 주요 이슈/주제 키워드 그룹은 ARTICLE_TOPIC_GROUPS 참고 (순서대로 우선)
+    return get_article_features(article).article_topic
 
 
 def diversify_by_company(articles, max_per_company=1, silent=False):
@@ -1946,31 +2577,51 @@ def categorize_article(article):
     """
     기사 카테고리 분류
     """
-    text = (article['title'] + ' ' + article['summary']).lower()
+    hits = get_article_features(article).hits
 
     # OTA 관련
-    for kw in OTA_KEYWORDS:
-        if kw.lower() in text:
-            return "OTA/플랫폼"
+    if 'ota' in hits:
+        return "OTA/플랫폼"
 
     # 정책 관련
-    for kw in POLICY_KEYWORDS:
-        if kw.lower() in text:
-            return "정책/규제"
+    if 'policy' in hits:
+        return "정책/규제"
 
     # 트래블테크
-    for kw in TRAVELTECH_KEYWORDS:
-        if kw.lower() in text:
-            return "트래블테크"
+    if 'traveltech' in hits:
+        return "트래블테크"
 
     # 숙박업
-    for kw in ACCOMMODATION_KEYWORDS:
-        if kw.lower() in text:
-            return "숙박업계"
+    if 'accommodation' in hits:
+        return "숙박업계"
 
     return "기타"
 
 
+# LLM 프롬프트 템플릿 버전 (프롬프트 수정 시 올리면 llm_cache의 기존 응답 무효화)
+PROMPT_VERSIONS = {
+    'editor_top3': 1,
+    'short_summary': 1,
+    'ai_summary': 1,
+}
+
+
+def _openai_text(response):
+    """OpenAI 응답 텍스트 (토큰 사용량은 run_metrics에 기록)"""
+    usage = getattr(response, 'usage', None)
+    if usage is not None:
+        run_metrics.record_llm_tokens('gpt-4o-mini', usage.prompt_tokens, usage.completion_tokens)
+    return response.choices[0].message.content
+
+
+def _anthropic_text(response):
+    """Anthropic 응답 텍스트 (토큰 사용량은 run_metrics에 기록)"""
+    usage = getattr(response, 'usage', None)
+    if usage is not None:
+        run_metrics.record_llm_tokens('claude-3-haiku-20240307', usage.input_tokens, usage.output_tokens)
+    return response.content[0].text
+
+
 def ai_editor_select_top3(articles, silent=False):
     """
     [Option A] AI 에디터 레이어
@@ -2036,17 +2687,21 @@ def ai_editor_select_top3(articles, silent=False):
             import openai
             openai.api_key = openai_key
 
-            response = openai.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "당신은 B2B 호스피탈리티 업계 전문 뉴스 에디터입니다. JSON 형식으로만 응답하세요."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=800,
-                temperature=0.3,
-                response_format={"type": "json_object"}
+            system_prompt = "당신은 B2B 호스피탈리티 업계 전문 뉴스 에디터입니다. JSON 형식으로만 응답하세요."
+            response_text = llm_cache.cached(
+                'editor_top3', PROMPT_VERSIONS['editor_top3'], 'gpt-4o-mini', system_prompt + '\n' + prompt,
+                lambda: _openai_text(openai.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=800,
+                    temperature=0.3,
+                    response_format={"type": "json_object"}
+                ))
             )
-            result = json.loads(response.choices[0].message.content)
+            result = json.loads(response_text)
         except Exception as e:
             if not silent:
                 print(f"   OpenAI API 오류: {e}")
@@ -2056,15 +2711,18 @@ def ai_editor_select_top3(articles, silent=False):
             import anthropic
             client = anthropic.Anthropic(api_key=anthropic_key)
 
-            response = client.messages.create(
-                model="claude-3-haiku-20240307",
-                max_tokens=800,
-                messages=[
-                    {"role": "user", "content": prompt + "\n\nJSON 형식으로만 응답하세요."}
-                ]
+            claude_prompt = prompt + "\n\nJSON 형식으로만 응답하세요."
+            response_text = llm_cache.cached(
+                'editor_top3', PROMPT_VERSIONS['editor_top3'], 'claude-3-haiku-20240307', claude_prompt,
+                lambda: _anthropic_text(client.messages.create(
+                    model="claude-3-haiku-20240307",
+                    max_tokens=800,
+                    messages=[
+                        {"role": "user", "content": claude_prompt}
+                    ]
+                ))
             )
             # Claude 응답에서 JSON 추출
-            response_text = response.content[0].text
             # JSON 부분만 추출
             json_start = response_text.find('{')
             json_end = response_text.rfind('}') + 1
@@ -2102,10 +2760,83 @@ def ai_editor_select_top3(articles, silent=False):
     return sorted_articles[:3]
 
 
-def generate_short_summary(article, max_chars=100):
+# ============================================
+# 요약 생성 병렬 처리 설정
+# ============================================
+
+# 요약 단계 동시 처리 수 (원문 가져오기 + LLM 호출)
+SUMMARY_MAX_WORKERS = int(os.environ.get('ONDA_SUMMARY_WORKERS', '6'))
+
+# LLM 호출 속도 제한 (분당 요청 수, 환경변수 ONDA_LLM_RPM)
+LLM_REQUESTS_PER_MINUTE = float(os.environ.get('ONDA_LLM_RPM', '60'))
+
+
+class RateLimiter:
+    """
+    스레드 안전 속도 제한기 (요청 간 최소 간격 보장)
+    여러 워커가 동시에 LLM을 호출해도 분당 요청 수를 넘지 않음
+    """
+
+    def __init__(self, requests_per_minute):
+        self.interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """다음 요청 가능 시점까지 대기"""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+llm_rate_limiter = RateLimiter(LLM_REQUESTS_PER_MINUTE)
+
+
+def generate_short_summaries(articles, max_chars=100, max_workers=SUMMARY_MAX_WORKERS, silent=False):
+    """
+    여러 기사의 짧은 요약을 병렬 생성
+
+    1. 원문을 동시에 가져오고 (발행일 검증 단계에서 받은 페이지는 캐시 재사용)
+    2. LLM 호출을 병렬로 실행 (llm_rate_limiter로 분당 요청 수 제한)
+
+    Returns:
+        list: 입력 순서와 같은 순서의 요약 문자열
+    """
+    if not articles:
+        return []
+
+    total = len(articles)
+    with ThreadPoolExecutor(max_workers=min(max_workers, total)) as executor:
+        contents = list(executor.map(lambda a: fetch_article_content(a['link']), articles))
+
+        futures = {
+            executor.submit(generate_short_summary, article, max_chars, content): idx
+            for idx, (article, content) in enumerate(zip(articles, contents))
+        }
+
+        summaries = [None] * total
+        done = 0
+        for future in as_completed(futures):
+            idx = futures[future]
+            summaries[idx] = future.result()
+            done += 1
+            if not silent:
+                print(f"   [{done}/{total}] {articles[idx]['title'][:30]}... 요약 완료")
+
+    return summaries
+
+
+def generate_short_summary(article, max_chars=100, content=None):
     """
     60-100자 짧은 요약 생성 (온다 뉴스레터 스타일)
     구체적인 숫자를 포함한 임팩트 있는 한 줄 요약
+
+    content: 미리 가져온 기사 원문 (없으면 직접 가져옴)
     """
     import os
 
@@ -2113,7 +2844,8 @@ def generate_short_summary(article, max_chars=100):
     if article.get('ai_summary'):
         return article['ai_summary']
 
-    content = fetch_article_content(article['link'])
+    if content is None:
+        content = fetch_article_content(article['link'])
     if not content:
         content = article.get('summary', article['title'])
 
@@ -2143,15 +2875,21 @@ def generate_short_summary(article, max_chars=100):
             import openai
             openai.api_key = openai_key
 
-            response = openai.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=150,
-                temperature=0.3
-            )
-            summary = response.choices[0].message.content.strip()
+            def call_openai():
+                llm_rate_limiter.acquire()
+                response = openai.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=150,
+                    temperature=0.3
+                )
+                return _openai_text(response)
+
+            summary = llm_cache.cached(
+                'short_summary', PROMPT_VERSIONS['short_summary'], 'gpt-4o-mini', prompt, call_openai
+            ).strip()
             # 따옴표 제거
             summary = summary.strip('"\'')
             if len(summary) <= 120:
@@ -2164,14 +2902,20 @@ def generate_short_summary(article, max_chars=100):
             import anthropic
             client = anthropic.Anthropic(api_key=anthropic_key)
 
-            response = client.messages.create(
-                model="claude-3-haiku-20240307",
-                max_tokens=150,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
-            summary = response.content[0].text.strip()
+            def call_anthropic():
+                llm_rate_limiter.acquire()
+                response = client.messages.create(
+                    model="claude-3-haiku-20240307",
+                    max_tokens=150,
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ]
+                )
+                return _anthropic_text(response)
+
+            summary = llm_cache.cached(
+                'short_summary', PROMPT_VERSIONS['short_summary'], 'claude-3-haiku-20240307', prompt, call_anthropic
+            ).strip()
             summary = summary.strip('"\'')
             if len(summary) <= 120:
                 return summary
@@ -2195,77 +2939,14 @@ def generate_short_summary(article, max_chars=100):
 def fetch_article_content(url):
     """
     기사 원문 가져오기
+    발행일 검증 단계에서 이미 받은 페이지는 article_cache에서 재사용
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-    }
+    page = article_cache.get_page(url, timeout=10)
+    if page is None:
+        return ""
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-
-        # 인코딩 처리 개선: HTML 내 charset 선언 우선 확인
-        encoding = None
-
-        # 1. Content-Type 헤더에서 charset 확인
-        content_type = response.headers.get('Content-Type', '').lower()
-        if 'charset=' in content_type:
-            charset_match = re.search(r'charset=([^\s;]+)', content_type)
-            if charset_match:
-                encoding = charset_match.group(1)
-
-        # 2. HTML meta 태그에서 charset 확인 (가장 신뢰성 높음)
-        if not encoding:
-            html_head = response.content[:2000].decode('latin-1', errors='replace')
-            charset_match = re.search(r'charset=["\']?([^"\'\s>]+)', html_head, re.I)
-            if charset_match:
-                encoding = charset_match.group(1)
-
-        # 3. UTF-8 디코드 시도
-        if not encoding:
-            try:
-                response.content.decode('utf-8')
-                encoding = 'utf-8'
-            except UnicodeDecodeError:
-                pass
-
-        # 4. 최종 fallback
-        if not encoding:
-            encoding = response.apparent_encoding or 'utf-8'
-
-        response.encoding = encoding
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # 불필요한 태그 제거
-        for tag in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe']):
-            tag.decompose()
-
-        # 기사 본문 찾기 (여러 선택자 시도)
-        content = ""
-        selectors = [
-            'article',
-            'div.article_body',
-            'div.article-body',
-            'div.news_body',
-            'div.article_txt',
-            'div#articleBodyContents',
-            'div.content',
-            'div.article-content',
-            'div.view_txt',
-            'div.newsct_article',
-        ]
-
-        for sel in selectors:
-            elem = soup.select_one(sel)
-            if elem:
-                content = elem.get_text(separator=' ', strip=True)
-                break
-
-        # 못 찾으면 body에서 가장 긴 텍스트 블록 찾기
-        if not content or len(content) < 100:
-            paragraphs = soup.find_all('p')
-            content = ' '.join([p.get_text(strip=True) for p in paragraphs if len(p.get_text(strip=True)) > 50])
-
-        return content[:3000]  # 최대 3000자
+        return page_content(page)
     except Exception as e:
         return ""
 
@@ -2291,16 +2972,21 @@ def generate_ai_summary(article, max_chars=400):
             import openai
             openai.api_key = openai_key
 
-            response = openai.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "당신은 B2B 호스피탈리티/숙박업 전문 뉴스 에디터입니다. 기사를 ONDA(숙박 플랫폼 연동 솔루션 기업) 관점에서 핵심만 요약해주세요."},
-                    {"role": "user", "content": f"다음 기사를 400자 이내로 완결된 문장으로 요약해주세요. 핵심 내용, 영향, 시사점을 포함해주세요.\n\n제목: {article['title']}\n\n내용:\n{content[:2000]}"}
-                ],
-                max_tokens=500,
-                temperature=0.3
+            system_prompt = "당신은 B2B 호스피탈리티/숙박업 전문 뉴스 에디터입니다. 기사를 ONDA(숙박 플랫폼 연동 솔루션 기업) 관점에서 핵심만 요약해주세요."
+            user_prompt = f"다음 기사를 400자 이내로 완결된 문장으로 요약해주세요. 핵심 내용, 영향, 시사점을 포함해주세요.\n\n제목: {article['title']}\n\n내용:\n{content[:2000]}"
+            response_text = llm_cache.cached(
+                'ai_summary', PROMPT_VERSIONS['ai_summary'], 'gpt-4o-mini', system_prompt + '\n' + user_prompt,
+                lambda: _openai_text(openai.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    max_tokens=500,
+                    temperature=0.3
+                ))
             )
-            return response.choices[0].message.content.strip()
+            return response_text.strip()
         except Exception as e:
             pass
 
@@ -2309,14 +2995,18 @@ def generate_ai_summary(article, max_chars=400):
             import anthropic
             client = anthropic.Anthropic(api_key=anthropic_key)
 
-            response = client.messages.create(
-                model="claude-3-haiku-20240307",
-                max_tokens=500,
-                messages=[
-                    {"role": "user", "content": f"당신은 B2B 호스피탈리티/숙박업 전문 뉴스 에디터입니다. 다음 기사를 400자 이내로 완결된 문장으로 요약해주세요. 핵심 내용, 영향, 시사점을 포함해주세요.\n\n제목: {article['title']}\n\n내용:\n{content[:2000]}"}
-                ]
+            claude_prompt = f"당신은 B2B 호스피탈리티/숙박업 전문 뉴스 에디터입니다. 다음 기사를 400자 이내로 완결된 문장으로 요약해주세요. 핵심 내용, 영향, 시사점을 포함해주세요.\n\n제목: {article['title']}\n\n내용:\n{content[:2000]}"
+            response_text = llm_cache.cached(
+                'ai_summary', PROMPT_VERSIONS['ai_summary'], 'claude-3-haiku-20240307', claude_prompt,
+                lambda: _anthropic_text(client.messages.create(
+                    model="claude-3-haiku-20240307",
+                    max_tokens=500,
+                    messages=[
+                        {"role": "user", "content": claude_prompt}
+                    ]
+                ))
             )
-            return response.content[0].text.strip()
+            return response_text.strip()
         except Exception as e:
             pass
 
@@ -2355,6 +3045,10 @@ def generate_summary(article):
     return summary
 
 
+# 실행 계측 결과 파일 (latest_news.json과 같은 위치)
+RUN_METRICS_PATH = os.environ.get('ONDA_RUN_METRICS_PATH', 'run_metrics.json')
+
+
 def main():
     parser = argparse.ArgumentParser(description='ONDA 뉴스 스크래퍼')
     parser.add_argument('--email', action='store_true', help='이메일로 결과 전송')
@@ -2365,8 +3059,19 @@ def main():
     parser.add_argument('--slack-final', action='store_true', help='Slack으로 최종본 발송 (클라이언트용)')
     parser.add_argument('--slack-webhook', type=str, help='Slack Webhook URL (없으면 SLACK_WEBHOOK_URL 환경변수 사용)')
     parser.add_argument('--force', action='store_true', help='주말에도 강제 실행')
+    parser.add_argument('--workers', type=int, default=None, help=f'뉴스 수집 동시 요청 수 (기본 {COLLECT_MAX_WORKERS})')
+    parser.add_argument('--article-cache', type=str, default=None, help='기사 페이지 디스크 캐시 폴더 (실행 간 재사용)')
+    parser.add_argument('--freshness-deadline', type=float, default=FRESHNESS_DEADLINE_SECONDS,
+                        help=f'발행일 검증 전체 제한 시간(초, 기본 {FRESHNESS_DEADLINE_SECONDS})')
+    parser.add_argument('--freshness-timeout-policy', choices=FRESHNESS_TIMEOUT_POLICIES, default='pass',
+                        help='발행일 검증 기한 초과 기사 처리 (pass: 통과, drop: 제외, defer: 맨 뒤로)')
+    parser.add_argument('--freshness-lookahead', type=int, default=FRESHNESS_LOOKAHEAD,
+                        help=f'보충 후보 미리 검증 개수 (기본 {FRESHNESS_LOOKAHEAD})')
     args = parser.parse_args()
 
+    if args.article_cache:
+        article_cache.enable_disk_cache(args.article_cache)
+
     # 주말(토,일) 스킵 - 강제 실행 옵션이 없는 경우
     if is_weekend() and not args.force:
         print("=" * 80)
@@ -2378,6 +3083,21 @@ def main():
         print("\n강제 실행: python onda_news_scraper.py --force")
         return
 
+    run_metrics.reset()
+    ARTICLE_FEATURES.cache_clear()
+    try:
+        run_pipeline(args)
+    finally:
+        if run_metrics.has_stages():
+            run_metrics.record_cache_info('article_features', ARTICLE_FEATURES.cache_info())
+            run_metrics.record_cache_info('keyword_match', SCORING_MATCHER._cached_match.cache_info())
+            run_metrics.write(RUN_METRICS_PATH)
+            if not args.silent:
+                run_metrics.print_summary()
+
+
+def run_pipeline(args):
+    """수집 -> 필터 -> 점수 -> 중복 제거 -> 발행일 검증 -> 요약 -> 저장 (단계별로 run_metrics에 기록)"""
     if not args.silent:
         print("=" * 80)
         print("ONDA 뉴스 스크래퍼 - B2B Hospitality Tech")
@@ -2388,77 +3108,68 @@ def main():
         print()
 
     # 0. 스크랩 히스토리 로드
-    history = load_scrape_history()
+    with run_metrics.stage('history_load') as stage:
+        history = load_scrape_history()
+        stage['items_out'] = len(history['articles'])
     if not args.silent:
         print(f"[0단계] 스크랩 히스토리 로드... ({len(history['articles'])}개 기존 기사)")
 
-    # 1. 뉴스 수집
+    # 1~3. 수집 -> 이전 스크랩 제외 -> 비뉴스/오래된 기사 제외 -> 점수 -> 중복 제거
+    # 기사 단위 스트리밍: 앞 쿼리 결과부터 필터/점수/중복 제거를 시작하고 뒤 쿼리는 계속 수집
+    # (전체 시간 ~ 가장 느린 수집 + 마지막 결과 처리, 기사 순서/결과는 단계별 실행과 같음)
     if not args.silent:
-        print("[1단계] 뉴스 수집 중...")
-
-    articles = collect_all_news(silent=args.silent)
-
+        print("[1단계] 뉴스 수집 중 (필터/점수/중복 제거 동시 진행)...")
+
+    counts = {}
+    with run_metrics.stage('collect_stream') as stage:
+        stream = iter_collected_news(silent=args.silent, max_workers=args.workers, counts=counts)
+        if not args.no_history:
+            stream = iter_unscraped(stream, history, counts)
+        stream = iter_news_articles(stream, counts)
+        stream = iter_scored(stream, counts)
+        articles = remove_duplicates(stream, threshold=0.35)
+        stage['items_in'] = counts['google'] + counts['naver']
+        stage['items_out'] = len(articles)
+
+    collected = counts['google'] + counts['naver']
     if not args.silent:
-        print(f"   -> {len(articles)}개 기사 수집 완료")
+        print_collect_counts(counts)
+        print(f"   -> {collected}개 기사 수집 완료")
 
     # 1.5 이미 스크랩한 기사 제외
-    if not args.no_history:
-        if not args.silent:
-            print("[1.5단계] 이전 스크랩 기사 필터링 중...")
-        before_filter = len(articles)
-        articles = filter_already_scraped(articles, history, silent=args.silent)
-        if not args.silent:
-            filtered = before_filter - len(articles)
-            print(f"   -> {filtered}개 이전 기사 제외 ({before_filter}개 -> {len(articles)}개)\n")
-    else:
-        if not args.silent:
+    after_history = collected - counts.get('scraped', 0)
+    if not args.silent:
+        if not args.no_history:
+            print("[1.5단계] 이전 스크랩 기사 필터링...")
+            if counts['scraped'] > 0:
+                print(f"   -> 이전 스크랩 기사 {counts['scraped']}개 제외")
+            print(f"   -> {counts['scraped']}개 이전 기사 제외 ({collected}개 -> {after_history}개)\n")
+        else:
             print("   -> 히스토리 체크 스킵\n")
 
     # 1.6 비뉴스 소스 및 24시간 이상 기사 필터링
     if not args.silent:
-        print("[1.6단계] 비뉴스/오래된 기사 필터링 중...")
-    before_filter = len(articles)
-    articles = filter_non_news_and_old_articles(articles, silent=args.silent)
-    if not args.silent:
-        filtered = before_filter - len(articles)
-        print(f"   -> 총 {filtered}개 제외 ({before_filter}개 -> {len(articles)}개)\n")
-
-    # 2. 관련도 점수 계산
-    if not args.silent:
-        print("[2단계] 관련도 분석 중...")
-
-    for article in articles:
-        article['score'] = calculate_relevance_score(article)
-        article['category'] = categorize_article(article)
-
-    if not args.silent:
-        print(f"   -> 키워드 점수 계산 완료")
-
-    # 2.5 산업 임팩트 점수 계산 (Option C)
-    if not args.silent:
-        print("[2.5단계] 산업 임팩트 분석 중...")
-
-    for article in articles:
-        calculate_industry_impact_score(article)
+        print("[1.6단계] 비뉴스/오래된 기사 필터링...")
+        print_non_news_counts(counts)
+        print(f"   -> 총 {after_history - counts['scored']}개 제외 ({after_history}개 -> {counts['scored']}개)\n")
 
+    # 2. 관련도 점수 + 2.5 산업 임팩트 점수 (Option C)
     if not args.silent:
-        print(f"   -> 임팩트 점수 계산 완료\n")
+        print("[2단계] 관련도/산업 임팩트 분석...")
+        print(f"   -> 키워드/임팩트 점수 계산 완료\n")
 
     # 3. 중복 제거 (1차 - 전체 기사)
+    removed = counts['scored'] - len(articles)
     if not args.silent:
-        print("[3단계] 중복 기사 제거 중...")
-
-    before_count = len(articles)
-    articles = remove_duplicates(articles, threshold=0.35)
-    removed = before_count - len(articles)
-
-    if not args.silent:
-        print(f"   -> {removed}개 중복 제거 ({before_count}개 -> {len(articles)}개)\n")
+        print("[3단계] 중복 기사 제거...")
+        print(f"   -> {removed}개 중복 제거 ({counts['scored']}개 -> {len(articles)}개)\n")
 
     # 3.5 신선도 패널티 적용 (많이 보도된 주제 점수 감소)
     if not args.silent:
         print("[3.5단계] 신선도 분석 중...")
-    articles = apply_freshness_penalty(articles)
+    with run_metrics.stage('freshness_penalty', len(articles)) as stage:
+        articles = apply_freshness_penalty(articles)
+        stage['items_out'] = len(articles)
     if not args.silent:
         print(f"   -> 신선도 패널티 적용 완료\n")
 
@@ -2471,7 +3182,9 @@ def main():
     # 4.5 회사별 다양성 적용 (같은 회사 기사는 1개만 TOP에 선정)
     if not args.silent:
         print("[4단계] 회사별 다양성 적용 중...")
-    articles_sorted = diversify_by_company(articles_sorted, max_per_company=1, silent=args.silent)
+    with run_metrics.stage('diversify', len(articles_sorted)) as stage:
+        articles_sorted = diversify_by_company(articles_sorted, max_per_company=1, silent=args.silent)
+        stage['items_out'] = len(articles_sorted)
     if not args.silent:
         print()
 
@@ -2483,52 +3196,40 @@ def main():
         print("[5단계] TOP 20 내 중복/다양성 재검사 중...")
 
     final_top = []
+    final_features = []
     topic_in_top = {}  # 주제별 카운트
 
-    for article in top_articles:
-        is_dup = False
-        for existing in final_top:
-            # 더 엄격한 유사도 체크 (0.25)
-            sim = calculate_similarity(article['title'], existing['title'])
-            same = is_same_story(article, existing)
-            if sim >= 0.25 or same:
-                is_dup = True
-                break
+    def add_if_not_duplicate(article):
+        features = get_article_features(article)
+        # 더 엄격한 유사도 체크 (0.25) + 같은 스토리
+        is_dup = any(
+            features.similarity(existing) >= 0.25 or features.same_story(existing)
+            for existing in final_features
+        )
 
         # 같은 주제가 이미 있으면 스킵 (주제별 다양성)
-        topic = get_article_topic(article)
+        topic = features.article_topic
         if topic and topic_in_top.get(topic, 0) >= 1:
             is_dup = True
 
         if not is_dup:
             final_top.append(article)
+            final_features.append(features)
             if topic:
                 topic_in_top[topic] = topic_in_top.get(topic, 0) + 1
 
-    # 부족하면 다음 순위에서 채움
-    if len(final_top) < 20:
+    with run_metrics.stage('top20_recheck', len(top_articles)) as stage:
+        for article in top_articles:
+            add_if_not_duplicate(article)
+
+        # 부족하면 다음 순위에서 채움
         for article in articles_sorted[20:]:
             if len(final_top) >= 20:
                 break
-            is_dup = False
-            for existing in final_top:
-                sim = calculate_similarity(article['title'], existing['title'])
-                same = is_same_story(article, existing)
-                if sim >= 0.25 or same:
-                    is_dup = True
-                    break
-
-            # 같은 주제가 이미 있으면 스킵
-            topic = get_article_topic(article)
-            if topic and topic_in_top.get(topic, 0) >= 1:
-                is_dup = True
+            add_if_not_duplicate(article)
 
-            if not is_dup:
-                final_top.append(article)
-                if topic:
-                    topic_in_top[topic] = topic_in_top.get(topic, 0) + 1
-
-    top_articles = final_top[:20]
+        top_articles = final_top[:20]
+        stage['items_out'] = len(top_articles)
 
     if not args.silent:
         print(f"   -> TOP 20 중복 제거 완료 (최종 {len(top_articles)}개)\n")
@@ -2537,40 +3238,30 @@ def main():
     if not args.silent:
         print("[5.5단계] 실제 발행일 검증 중...")
 
-    verified_articles = []
-    removed_old = 0
-
-    for article in top_articles:
-        is_fresh, actual_date = verify_article_freshness(article, max_days=2)
-        if is_fresh:
-            verified_articles.append(article)
-        else:
-            removed_old += 1
-            if not args.silent:
-                print(f"   ⚠ 오래된 기사 제외: {actual_date} - {article['title'][:30]}...")
-
-    # 제외된 만큼 다음 순위에서 보충
-    if len(verified_articles) < 20 and removed_old > 0:
-        for article in articles_sorted[20:]:
-            if len(verified_articles) >= 20:
-                break
-            # 이미 포함되어 있는지 확인
-            if any(a['title'] == article['title'] for a in verified_articles):
-                continue
-            is_fresh, actual_date = verify_article_freshness(article, max_days=2)
-            if is_fresh:
-                verified_articles.append(article)
-
-    top_articles = verified_articles[:20]
+    with run_metrics.stage('publish_date_verify', len(top_articles)) as stage:
+        top_articles, removed_old, timed_out = verify_articles_freshness(
+            top_articles,
+            backfill_candidates=articles_sorted[20:],
+            target=20,
+            max_days=2,
+            deadline=args.freshness_deadline,
+            timeout_policy=args.freshness_timeout_policy,
+            lookahead=args.freshness_lookahead,
+            silent=args.silent
+        )
+        stage['items_out'] = len(top_articles)
 
     if not args.silent:
-        print(f"   -> 발행일 검증 완료 ({removed_old}개 오래된 기사 제외)\n")
+        timeout_note = f", {timed_out}개 기한 초과({args.freshness_timeout_policy})" if timed_out else ""
+        print(f"   -> 발행일 검증 완료 ({removed_old}개 오래된 기사 제외{timeout_note})\n")
 
     # 6. AI 에디터로 TOP 3 선정 (Option A)
     if not args.silent:
         print("[4단계] AI 에디터 TOP 3 선정 중...")
 
-    top3_articles = ai_editor_select_top3(top_articles, silent=args.silent)
+    with run_metrics.stage('ai_editor', len(top_articles)) as stage:
+        top3_articles = ai_editor_select_top3(top_articles, silent=args.silent)
+        stage['items_out'] = len(top3_articles)
 
     if not args.silent:
         ai_selected = sum(1 for a in top3_articles if a.get('ai_selected', False))
@@ -2580,12 +3271,16 @@ def main():
     if not args.silent:
         print("[5단계] TOP 20 기사 요약 생성 중...")
 
-    for idx, article in enumerate(top_articles[:20], 1):
-        if not args.silent:
-            print(f"   [{idx}/20] {article['title'][:30]}... 요약 중")
-        # AI 에디터가 이미 요약했으면 스킵, 아니면 생성
+    # AI 에디터가 이미 요약한 기사는 스킵, 나머지는 병렬 생성
+    pending = [a for a in top_articles[:20] if not a.get('ai_summary')]
+    with run_metrics.stage('summaries', len(pending)) as stage:
+        pending_summaries = generate_short_summaries(pending, max_chars=100, silent=args.silent)
+        stage['items_out'] = len(pending_summaries)
+    summary_by_id = {id(a): summary for a, summary in zip(pending, pending_summaries)}
+
+    for article in top_articles[:20]:
         if not article.get('ai_summary'):
-            article['short_summary'] = generate_short_summary(article, max_chars=100)
+            article['short_summary'] = summary_by_id[id(article)]
         else:
             article['short_summary'] = article['ai_summary']
 
@@ -2619,7 +3314,8 @@ def main():
         subject = f"ONDA 뉴스 브리핑 - {datetime.now().strftime('%Y년 %m월 %d일')}"
         html_content = create_onda_html_email(top_articles)
 
-        success = send_email_gmail(args.to, subject, html_content)
+        with run_metrics.stage('email', len(top_articles)):
+            success = send_email_gmail(args.to, subject, html_content)
 
         if success:
             if not args.silent:
@@ -2660,8 +3356,9 @@ def main():
         'top_20': top_20_articles,
         'scraped_at': datetime.now().isoformat()
     }
-    with open('latest_news.json', 'w', encoding='utf-8') as f:
-        json_module.dump(latest_news_data, f, ensure_ascii=False, indent=2)
+    with run_metrics.stage('save', len(top_3_articles) + len(top_20_articles)):
+        with open('latest_news.json', 'w', encoding='utf-8') as f:
+            json_module.dump(latest_news_data, f, ensure_ascii=False, indent=2, default=json_default)
     if not args.silent:
         print(f"   -> latest_news.json 저장 완료 (TOP 3 + TOP 20 별도 구성)")
 
@@ -0,0 +1,235 @@
+"""
+실행 계측 (단계별 시간/HTTP/캐시/LLM 사용량)
+
+아침 실행에서 시간이 어디에 쓰이는지 숫자로 확인하기 위한 계측
+- stage(): 단계별 소요 시간, 입력/출력 기사 수, 단계 중 HTTP 호출/바이트/LLM 호출 수
+- HTTP: 호스트별 호출 수, 받은 바이트, 응답 시간, 오류 수 (http_client에서 기록)
+- 캐시: 이름별 hit/miss (article_cache, listing_cache, llm_cache 등)
+- LLM: 모델별 호출 수, 응답 시간, 토큰 수
+- timer(): 파싱 등 반복 작업의 누적 시간
+
+스레드 안전 (수집/요약 워커에서 동시에 기록)
+
+사용:
+    with run_metrics.stage('collect') as stage:
+        articles = collect_all_news()
+        stage['items_out'] = len(articles)
+
+    run_metrics.write('run_metrics.json')
+    run_metrics.print_summary()
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+
+_lock = threading.Lock()
+_state = {}
+
+
+def reset():
+    """계측 초기화 (실행 시작 시)"""
+    with _lock:
+        _state.clear()
+        _state.update({
+            'started_at': datetime.now().isoformat(),
+            'started_clock': time.perf_counter(),
+            'stages': [],
+            'http': {},
+            'cache': {},
+            'llm': {},
+            'timers': {},
+            'totals': {'http_calls': 0, 'http_bytes': 0, 'llm_calls': 0},
+        })
+
+
+reset()
+
+
+# ============================================
+# 기록
+# ============================================
+
+def record_http(host, bytes_received, seconds, error=False):
+    """HTTP 요청 하나 (스트리밍 응답은 bytes_received=0, 받은 만큼 add_http_bytes로 기록)"""
+    with _lock:
+        entry = _state['http'].setdefault(host, {'calls': 0, 'bytes': 0, 'seconds': 0.0, 'errors': 0})
+        entry['calls'] += 1
+        entry['bytes'] += bytes_received
+        entry['seconds'] += seconds
+        entry['errors'] += 1 if error else 0
+        _state['totals']['http_calls'] += 1
+        _state['totals']['http_bytes'] += bytes_received
+
+
+def add_http_bytes(host, bytes_received):
+    """스트리밍으로 받은 바이트 추가"""
+    with _lock:
+        entry = _state['http'].setdefault(host, {'calls': 0, 'bytes': 0, 'seconds': 0.0, 'errors': 0})
+        entry['bytes'] += bytes_received
+        _state['totals']['http_bytes'] += bytes_received
+
+
+def record_cache(name, hit):
+    """캐시 조회 결과"""
+    with _lock:
+        entry = _state['cache'].setdefault(name, {'hit': 0, 'miss': 0})
+        entry['hit' if hit else 'miss'] += 1
+
+
+def record_cache_info(name, info):
+    """functools.lru_cache의 cache_info() 결과 기록 (누적값으로 덮어씀)"""
+    with _lock:
+        _state['cache'][name] = {'hit': info.hits, 'miss': info.misses}
+
+
+def record_llm_call(model, seconds):
+    """모델 호출 하나 (캐시 miss로 실제 호출한 경우)"""
+    with _lock:
+        entry = _state['llm'].setdefault(model, {'calls': 0, 'seconds': 0.0, 'prompt_tokens': 0, 'completion_tokens': 0})
+        entry['calls'] += 1
+        entry['seconds'] += seconds
+        _state['totals']['llm_calls'] += 1
+
+
+def record_llm_tokens(model, prompt_tokens, completion_tokens):
+    """모델 응답의 토큰 사용량"""
+    with _lock:
+        entry = _state['llm'].setdefault(model, {'calls': 0, 'seconds': 0.0, 'prompt_tokens': 0, 'completion_tokens': 0})
+        entry['prompt_tokens'] += prompt_tokens or 0
+        entry['completion_tokens'] += completion_tokens or 0
+
+
+def add_time(name, seconds):
+    """반복 작업 누적 시간 (예: html_parse)"""
+    with _lock:
+        entry = _state['timers'].setdefault(name, {'count': 0, 'seconds': 0.0})
+        entry['count'] += 1
+        entry['seconds'] += seconds
+
+
+@contextmanager
+def timer(name):
+    """with 블록 시간을 add_time으로 기록"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_time(name, time.perf_counter() - start)
+
+
+@contextmanager
+def stage(name, items_in=None):
+    """
+    파이프라인 단계 하나 (순차 실행 기준)
+
+    yield하는 dict에 items_out(출력 기사 수)을 넣으면 함께 기록
+    """
+    with _lock:
+        totals_before = dict(_state['totals'])
+    info = {'name': name, 'items_in': items_in, 'items_out': None}
+    start = time.perf_counter()
+    try:
+        yield info
+    finally:
+        seconds = time.perf_counter() - start
+        with _lock:
+            totals = _state['totals']
+            _state['stages'].append({
+                'name': name,
+                'seconds': round(seconds, 4),
+                'items_in': info['items_in'],
+                'items_out': info['items_out'],
+                'http_calls': totals['http_calls'] - totals_before['http_calls'],
+                'http_bytes': totals['http_bytes'] - totals_before['http_bytes'],
+                'llm_calls': totals['llm_calls'] - totals_before['llm_calls'],
+            })
+
+
+# ============================================
+# 출력
+# ============================================
+
+def snapshot():
+    """현재까지의 계측 결과 (JSON 저장 형식)"""
+    with _lock:
+        data = {
+            'started_at': _state['started_at'],
+            'total_seconds': round(time.perf_counter() - _state['started_clock'], 4),
+            'stages': [dict(entry) for entry in _state['stages']],
+            'http': {host: dict(entry) for host, entry in _state['http'].items()},
+            'cache': {name: dict(entry) for name, entry in _state['cache'].items()},
+            'llm': {model: dict(entry) for model, entry in _state['llm'].items()},
+            'timers': {name: dict(entry) for name, entry in _state['timers'].items()},
+            'totals': dict(_state['totals']),
+        }
+    for section in ('http', 'llm', 'timers'):
+        for entry in data[section].values():
+            entry['seconds'] = round(entry['seconds'], 4)
+    return data
+
+
+def has_stages():
+    with _lock:
+        return bool(_state['stages'])
+
+
+def write(path='run_metrics.json'):
+    """계측 결과를 JSON 파일로 저장"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(snapshot(), f, ensure_ascii=False, indent=2)
+
+
+def _format_bytes(size):
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.0f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
+
+
+def print_summary(top_hosts=8):
+    """단계별 표 + HTTP/캐시/LLM 요약 출력"""
+    data = snapshot()
+
+    print("\n" + "=" * 80)
+    print(f"실행 계측 (전체 {data['total_seconds']:.1f}초)")
+    print("=" * 80)
+    print(f"{'단계':<22}{'시간(s)':>9}{'비율':>7}{'입력':>7}{'출력':>7}{'HTTP':>7}{'받은 양':>10}{'LLM':>6}")
+    total = data['total_seconds'] or 1
+    for entry in data['stages']:
+        items_in = '' if entry['items_in'] is None else entry['items_in']
+        items_out = '' if entry['items_out'] is None else entry['items_out']
+        print(f"{entry['name']:<22}{entry['seconds']:>9.2f}{entry['seconds'] / total:>7.0%}"
+              f"{items_in:>7}{items_out:>7}{entry['http_calls']:>7}"
+              f"{_format_bytes(entry['http_bytes']):>10}{entry['llm_calls']:>6}")
+
+    if data['http']:
+        print(f"\nHTTP (호출 많은 호스트 {top_hosts}개)")
+        hosts = sorted(data['http'].items(), key=lambda item: item[1]['calls'], reverse=True)
+        for host, entry in hosts[:top_hosts]:
+            average = entry['seconds'] / entry['calls'] if entry['calls'] else 0
+            errors = f", 오류 {entry['errors']}" if entry['errors'] else ""
+            print(f"  {host:<40}{entry['calls']:>5}회 {_format_bytes(entry['bytes']):>9} 평균 {average:.2f}s{errors}")
+
+    if data['cache']:
+        print("\n캐시")
+        for name, entry in data['cache'].items():
+            lookups = entry['hit'] + entry['miss']
+            ratio = entry['hit'] / lookups if lookups else 0
+            print(f"  {name:<28} hit {entry['hit']:>6} / miss {entry['miss']:>6} ({ratio:.0%})")
+
+    if data['llm']:
+        print("\nLLM")
+        for model, entry in data['llm'].items():
+            print(f"  {model:<28} {entry['calls']:>4}회 {entry['seconds']:>7.1f}s "
+                  f"토큰 {entry['prompt_tokens']} + {entry['completion_tokens']}")
+
+    if data['timers']:
+        print("\n누적 시간")
+        for name, entry in data['timers'].items():
+            print(f"  {name:<28} {entry['count']:>6}회 {entry['seconds']:>7.2f}s")
+    print("=" * 80)
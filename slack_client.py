@@ -0,0 +1,315 @@
+"""
+Slack Web API 클라이언트 (순서대로 발송 + 속도 제한 + 재시도)
+
+초안 20개 기사를 순서대로 한 건씩 발송하면서 429(Retry-After)를 무시하던 문제 해결
+- 공용 세션(http_client) 사용
+- 메서드별 속도 제한 (Slack tier 기준 토큰 버킷) + 429 응답 시 Retry-After 동안 같은 메서드 전체 대기
+- 재시도는 발송되지 않은 것이 확실할 때만:
+  429 / 연결 타임아웃은 바로 재시도
+  타임아웃/5xx 등 발송 여부가 불확실하면 메시지 metadata의 키로 채널 기록을 확인한 뒤 재시도
+- post_messages(): 목록 순서대로 한 건씩 발송 (채널에 보이는 순서가 그대로 목록 순서)
+- 메시지별 응답 시간(latency)/시도 횟수 기록
+- collect_reactions(): 여러 메시지의 reactions를 conversations.history 한두 번으로 수집
+  (기록에서 찾지 못한 메시지만 reactions.get 병렬 호출)
+
+설정 (환경변수):
+    ONDA_SLACK_WORKERS: reactions.get 동시 호출 수 (기본 4)
+    ONDA_SLACK_MAX_RETRIES: 메시지당 최대 재시도 (기본 3)
+    ONDA_SLACK_API_URL: Web API 주소 (기본 https://slack.com/api, 로컬 모의 서버 사용 시 변경)
+
+사용:
+    client = SlackClient(bot_token)
+    header = client.call('chat.postMessage', {'channel': channel_id, 'text': '...'})
+    results = client.post_messages(channel_id, [{'text': '...'}, ...])
+    reactions = client.collect_reactions(channel_id, ts_list, oldest=header_ts)
+"""
+
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+import http_client
+
+
+SLACK_API_URL = os.environ.get('ONDA_SLACK_API_URL', 'https://slack.com/api').rstrip('/')
+
+# 429는 _request에서 Retry-After + 토큰 버킷으로 처리 (공용 세션의 429 재시도 제외)
+http_client.register_self_rate_limited(SLACK_API_URL + '/')
+
+SLACK_MAX_WORKERS = int(os.environ.get('ONDA_SLACK_WORKERS', '4'))
+SLACK_MAX_RETRIES = int(os.environ.get('ONDA_SLACK_MAX_RETRIES', '3'))
+
+# 메서드별 속도 제한 (분당 호출 수, 버스트)
+# chat.postMessage는 채널당 초당 1건 + 짧은 버스트 허용, 나머지는 Slack tier 기준
+SLACK_RATE_LIMITS = {
+    'chat.postMessage': (60, 20),
+    'conversations.history': (50, 5),
+    'conversations.replies': (50, 5),
+    'reactions.get': (50, 10),
+}
+DEFAULT_RATE_LIMIT = (20, 5)  # Tier 2
+
+# 429에 Retry-After가 없을 때 대기 시간(초)
+DEFAULT_RETRY_AFTER = 1.0
+
+# 요청이 처리되었는지 알 수 없는 오류 (발송 여부 확인 후 재시도)
+UNCERTAIN_ERRORS = ('internal_error', 'fatal_error', 'service_unavailable', 'request_timeout')
+
+# conversations.history 한 페이지 최대 메시지 수
+HISTORY_PAGE_SIZE = 200
+
+# 멱등 재시도 확인용 metadata 이벤트 타입
+IDEMPOTENCY_EVENT_TYPE = 'onda_message'
+
+
+class RateLimiter:
+    """토큰 버킷 (분당 rate, 최대 burst) + 429 대기"""
+
+    def __init__(self, per_minute, burst):
+        self.interval = 60.0 / per_minute
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """호출 가능할 때까지 대기"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) / self.interval)
+                self.updated = now
+                wait = self.blocked_until - now
+                if wait <= 0:
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) * self.interval
+            time.sleep(wait)
+
+    def block(self, seconds):
+        """429 - 같은 메서드의 모든 호출을 seconds 동안 멈춤"""
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+class SlackClient:
+    """Slack Web API 호출 (메서드별 속도 제한 공유)"""
+
+    def __init__(self, token, max_workers=None, max_retries=None):
+        self.token = token
+        self.max_workers = max_workers or SLACK_MAX_WORKERS
+        self.max_retries = SLACK_MAX_RETRIES if max_retries is None else max_retries
+        self._limiters = {}
+        self._limiters_lock = threading.Lock()
+
+    def _limiter(self, method):
+        with self._limiters_lock:
+            limiter = self._limiters.get(method)
+            if limiter is None:
+                limiter = RateLimiter(*SLACK_RATE_LIMITS.get(method, DEFAULT_RATE_LIMIT))
+                self._limiters[method] = limiter
+            return limiter
+
+    def _request(self, method, payload=None, params=None):
+        """
+        API 한 번 호출 (429면 Retry-After 동안 대기 후 다시 호출 - 429는 처리되지 않은 요청)
+        그 외 오류/예외는 그대로 반환/전달, 429 재호출 횟수는 응답의 'rate_limited'에 기록
+        """
+        limiter = self._limiter(method)
+        headers = {'Authorization': f'Bearer {self.token}'}
+        url = f'{SLACK_API_URL}/{method}'
+
+        for rate_limited in range(self.max_retries + 1):
+            limiter.acquire()
+            if payload is not None:
+                headers['Content-Type'] = 'application/json; charset=utf-8'
+                response = http_client.post(url, headers=headers, json=payload)
+            else:
+                response = http_client.get(url, headers=headers, params=params)
+
+            if response.status_code != 429:
+                if response.status_code >= 500:
+                    result = {'ok': False, 'error': f'http_{response.status_code}', 'uncertain': True}
+                else:
+                    result = response.json()
+                result['rate_limited'] = rate_limited
+                return result
+
+            retry_after = response.headers.get('Retry-After')
+            try:
+                retry_after = float(retry_after)
+            except (TypeError, ValueError):
+                retry_after = DEFAULT_RETRY_AFTER
+            print(f"  [Slack] {method} 속도 제한 - {retry_after:.0f}초 대기")
+            limiter.block(retry_after)
+
+        return {'ok': False, 'error': 'ratelimited', 'rate_limited': self.max_retries + 1}
+
+    def call(self, method, payload=None, params=None):
+        """
+        API 호출 (payload가 있으면 JSON POST, 없으면 GET)
+
+        Returns:
+            dict: Slack 응답 (네트워크 오류 시 {'ok': False, 'error': ...})
+        """
+        try:
+            return self._request(method, payload, params)
+        except requests.RequestException as e:
+            return {'ok': False, 'error': f'{type(e).__name__}: {e}'}
+
+    # ------------------------------------------------------------------
+    # 멱등 발송
+    # ------------------------------------------------------------------
+
+    def find_message(self, channel, key, oldest):
+        """oldest 이후 채널 메시지 중 metadata 키가 같은 메시지 (없으면 None, 확인 실패 시 False)"""
+        result = self.call('conversations.history', params={
+            'channel': channel,
+            'oldest': f'{oldest:.6f}',
+            'include_all_metadata': 'true',
+            'limit': HISTORY_PAGE_SIZE,
+        })
+        if not result.get('ok'):
+            return False
+        for message in result.get('messages', []):
+            metadata = message.get('metadata') or {}
+            if (metadata.get('event_type') == IDEMPOTENCY_EVENT_TYPE
+                    and (metadata.get('event_payload') or {}).get('key') == key):
+                return message
+        return None
+
+    def post_message(self, channel, message, key=None):
+        """
+        chat.postMessage (발송되지 않은 것이 확실할 때만 재시도)
+
+        Args:
+            message: chat.postMessage 인자 (channel 제외)
+            key: 멱등 키 (metadata로 첨부, 발송 여부 확인용)
+
+        Returns:
+            dict: {ok, ts, error, latency(초), attempts}
+        """
+        key = key or uuid.uuid4().hex
+        payload = dict(message, channel=channel)
+        payload['metadata'] = {'event_type': IDEMPOTENCY_EVENT_TYPE, 'event_payload': {'key': key}}
+
+        started = time.time()
+        start_clock = time.perf_counter()
+        result = {'ok': False, 'error': 'not_sent'}
+        attempts = 0
+
+        while attempts <= self.max_retries:
+            attempts += 1
+            try:
+                result = self._request('chat.postMessage', payload)
+                attempts += result.get('rate_limited', 0)
+            except requests.exceptions.ConnectTimeout as e:
+                # 연결 전 실패 - 발송되지 않음
+                result = {'ok': False, 'error': f'ConnectTimeout: {e}'}
+                continue
+            except requests.RequestException as e:
+                result = {'ok': False, 'error': f'{type(e).__name__}: {e}', 'uncertain': True}
+
+            if result.get('ok') or result.get('error') == 'ratelimited':
+                break
+            if not (result.get('uncertain') or result.get('error') in UNCERTAIN_ERRORS):
+                break  # invalid_auth, channel_not_found 등 - 재시도해도 실패
+
+            # 발송 여부 불확실 - 채널 기록에서 확인
+            found = self.find_message(channel, key, started - 1)
+            if found:
+                result = {'ok': True, 'ts': found.get('ts')}
+                break
+            if found is False:
+                break  # 확인 불가 - 중복 발송 위험이 있어 재시도하지 않음
+
+        return {
+            'ok': bool(result.get('ok')),
+            'ts': result.get('ts'),
+            'error': None if result.get('ok') else result.get('error'),
+            'latency': time.perf_counter() - start_clock,
+            'attempts': attempts,
+        }
+
+    # ------------------------------------------------------------------
+    # 여러 메시지 발송 (순서 유지)
+    # ------------------------------------------------------------------
+
+    def post_messages(self, channel, messages):
+        """
+        여러 메시지를 목록 순서대로 한 건씩 발송 (채널에 보이는 순서 = 목록 순서)
+
+        chat.postMessage는 채널당 초당 1건 정도로 제한되어 동시 발송해도 빨라지지 않음
+        - 앞 메시지 응답을 받은 뒤 다음 메시지 발송 (속도 제한/429 대기/멱등 재시도는 post_message)
+
+        Returns:
+            list: 목록 순서대로 {ok, ts, error, latency, attempts}
+        """
+        run_key = uuid.uuid4().hex[:12]
+        return [self.post_message(channel, message, key=f'{run_key}:{i}') for i, message in enumerate(messages)]
+
+    # ------------------------------------------------------------------
+    # reactions 수집
+    # ------------------------------------------------------------------
+
+    def _history_reactions(self, channel, wanted, oldest, latest):
+        """oldest~latest 구간 채널 기록에서 wanted 메시지들의 reactions (페이지 순회)"""
+        found = {}
+        params = {
+            'channel': channel,
+            'oldest': oldest,
+            'latest': latest,
+            'inclusive': 'true',
+            'limit': HISTORY_PAGE_SIZE,
+        }
+        while True:
+            result = self.call('conversations.history', params=params)
+            if not result.get('ok'):
+                print(f"  [Slack] conversations.history 오류: {result.get('error')}")
+                return found
+            for message in result.get('messages', []):
+                if message.get('ts') in wanted:
+                    found[message['ts']] = message.get('reactions', [])
+            cursor = (result.get('response_metadata') or {}).get('next_cursor')
+            if not result.get('has_more') or not cursor or len(found) == len(wanted):
+                return found
+            params = dict(params, cursor=cursor)
+
+    def _single_reactions(self, channel, ts):
+        result = self.call('reactions.get', params={'channel': channel, 'timestamp': ts})
+        if not result.get('ok'):
+            print(f"  [Slack] reactions.get 오류 ({ts}): {result.get('error')}")
+            return None
+        return result.get('message', {}).get('reactions', [])
+
+    def collect_reactions(self, channel, ts_list, oldest=None):
+        """
+        여러 메시지의 reactions 한 번에 수집
+
+        oldest(예: 초안 헤더 ts)~마지막 메시지 구간의 conversations.history로 가져오고
+        기록에서 찾지 못한 메시지(권한 부족, 스레드 답글 등)만 reactions.get 병렬 호출
+
+        Returns:
+            dict: {ts: reactions 목록} - 조회 실패한 메시지는 제외
+        """
+        wanted = set(ts_list)
+        if not wanted:
+            return {}
+
+        ordered = sorted(wanted, key=float)
+        found = self._history_reactions(channel, wanted, oldest or ordered[0], ordered[-1])
+
+        missing = [ts for ts in ts_list if ts not in found]
+        if missing:
+            print(f"  [Slack] 기록에서 찾지 못한 메시지 {len(missing)}개 - reactions.get으로 확인")
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for ts, reactions in zip(missing, executor.map(lambda ts: self._single_reactions(channel, ts), missing)):
+                    if reactions is not None:
+                        found[ts] = reactions
+        return found
@@ -7,11 +7,14 @@ ONDA News Slack Sender (v2 - 이모지 기반 피드백)
 3. 08:00 - 이모지 확인 후 최종 발송
 """
 
-import requests
 import json
 import os
+import time
 from datetime import datetime, timezone, timedelta
 
+from article_record import json_default
+from slack_client import SlackClient
+
 
 def get_bot_token(bot_token=None):
     """Bot Token 가져오기"""
@@ -406,8 +409,11 @@ def send_draft_articles(articles, channel_id=None, bot_token=None):
     20개 기사를 개별 메시지로 발송 (이모지 선택용)
     각 메시지에 번호 이모지 추가
 
+    헤더와 기사 메시지를 SlackClient로 순서대로 한 건씩 발송
+    (속도 제한, 발송 여부가 불확실하면 채널 기록 확인 후 재시도 - 중복 발송 없음)
+
     Returns:
-        dict: {success, message_ts_list, header_ts}
+        dict: {success, message_ts_list, header_ts, failed, latency}
     """
     bot_token = get_bot_token(bot_token)
     channel_id = get_channel_id(channel_id)
@@ -415,10 +421,8 @@ def send_draft_articles(articles, channel_id=None, bot_token=None):
     if not bot_token:
         return {'success': False, 'message': 'Bot token not found'}
 
-    headers = {
-        'Authorization': f'Bearer {bot_token}',
-        'Content-Type': 'application/json'
-    }
+    client = SlackClient(bot_token)
+    started = time.perf_counter()
 
     kst = timezone(timedelta(hours=9))
     today = datetime.now(kst).strftime('%Y년 %m월 %d일')
@@ -439,27 +443,22 @@ def send_draft_articles(articles, channel_id=None, bot_token=None):
         {"type": "divider"}
     ]
 
-    response = requests.post(
-        'https://slack.com/api/chat.postMessage',
-        headers=headers,
-        json={
-            'channel': channel_id,
-            'blocks': header_blocks,
-            'text': f'ONDA 뉴스 브리핑 - {today}'
-        }
-    )
+    result = client.post_message(channel_id, {
+        'blocks': header_blocks,
+        'text': f'ONDA 뉴스 브리핑 - {today}'
+    })
 
-    result = response.json()
-    if not result.get('ok'):
-        return {'success': False, 'message': result.get('error', 'Header send failed')}
+    if not result['ok']:
+        return {'success': False, 'message': result['error'] or 'Header send failed'}
 
     header_ts = result.get('ts')
-    message_ts_list = []
 
     # 2. 각 기사를 개별 메시지로 발송
     number_emojis = ['1️⃣', '2️⃣', '3️⃣', '4️⃣', '5️⃣', '6️⃣', '7️⃣', '8️⃣', '9️⃣', '🔟',
                      '1️⃣1️⃣', '1️⃣2️⃣', '1️⃣3️⃣', '1️⃣4️⃣', '1️⃣5️⃣', '1️⃣6️⃣', '1️⃣7️⃣', '1️⃣8️⃣', '1️⃣9️⃣', '2️⃣0️⃣']
 
+    messages = []
+    titles = []
     for i, article in enumerate(articles[:20]):
         emoji = number_emojis[i] if i < len(number_emojis) else f"#{i+1}"
         title = article.get('title', '제목 없음')
@@ -470,23 +469,34 @@ def send_draft_articles(articles, channel_id=None, bot_token=None):
 
         text = f"{emoji} *<{link}|{title}>*\n_{source} | {category}_\n{summary}..."
 
-        response = requests.post(
-            'https://slack.com/api/chat.postMessage',
-            headers=headers,
-            json={
-                'channel': channel_id,
-                'text': text,
-                'unfurl_links': False
-            }
-        )
+        messages.append({'text': text, 'unfurl_links': False})
+        titles.append(title)
+
+    results = client.post_messages(channel_id, messages)
 
-        result = response.json()
-        if result.get('ok'):
+    message_ts_list = []
+    failed = []
+    for i, result in enumerate(results):
+        if result['ok']:
             message_ts_list.append({
-                'ts': result.get('ts'),
+                'ts': result['ts'],
                 'index': i,
-                'title': title
+                'title': titles[i]
             })
+        else:
+            failed.append({'index': i, 'title': titles[i], 'error': result['error']})
+            print(f"[Slack] 기사 {i + 1} 발송 실패 ({result['attempts']}회 시도): {result['error']}")
+
+    latencies = [result['latency'] for result in results]
+    latency = {
+        'total': time.perf_counter() - started,
+        'avg': sum(latencies) / len(latencies) if latencies else 0,
+        'max': max(latencies, default=0),
+        'per_message': latencies,
+    }
+    print(f"[Slack] {len(message_ts_list)}/{len(results)}개 발송 - 전체 {latency['total']:.1f}초, "
+          f"메시지당 평균 {latency['avg']:.2f}초 / 최대 {latency['max']:.2f}초, "
+          f"재시도 {sum(result['attempts'] - 1 for result in results)}회")
 
     # 3. 메시지 정보 저장 (08:00에 이모지 확인용)
     save_draft_info(channel_id, header_ts, message_ts_list, articles)
@@ -495,7 +505,9 @@ def send_draft_articles(articles, channel_id=None, bot_token=None):
         'success': True,
         'header_ts': header_ts,
         'message_ts_list': message_ts_list,
-        'message': f'{len(message_ts_list)}개 기사 발송 완료'
+        'failed': failed,
+        'latency': latency,
+        'message': f'{len(message_ts_list)}개 기사 발송 완료' + (f' ({len(failed)}개 실패)' if failed else '')
     }
 
 
@@ -510,7 +522,7 @@ def save_draft_info(channel_id, header_ts, message_ts_list, articles):
     }
 
     with open('draft_info.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        json.dump(data, f, ensure_ascii=False, indent=2, default=json_default)
 
 
 # =============================================================================
@@ -521,6 +533,9 @@ def get_starred_articles(channel_id=None, bot_token=None):
     """
     ⭐ 이모지가 달린 기사들 확인
 
+    reactions는 conversations.history로 한 번에 수집 (SlackClient.collect_reactions)
+    Slack은 이모지를 단 시각을 알려주지 않으므로 결과는 초안 순서(기사 순위) 기준
+
     Returns:
         list: 선택된 기사 인덱스 리스트 (최대 3개)
     """
@@ -534,46 +549,23 @@ def get_starred_articles(channel_id=None, bot_token=None):
     except FileNotFoundError:
         return []
 
-    headers = {
-        'Authorization': f'Bearer {bot_token}',
-        'Content-Type': 'application/json'
-    }
-
-    starred_indices = []
+    message_ts_list = draft_info.get('message_ts_list', [])
 
-    print(f"[DEBUG] Checking {len(draft_info.get('message_ts_list', []))} messages for reactions...")
-
-    # 각 메시지의 reactions 확인
-    for msg_info in draft_info.get('message_ts_list', []):
-        ts = msg_info.get('ts')
-        idx = msg_info.get('index')
+    client = SlackClient(bot_token)
+    reactions_by_ts = client.collect_reactions(
+        channel_id, [msg_info.get('ts') for msg_info in message_ts_list], oldest=draft_info.get('header_ts')
+    )
 
-        response = requests.get(
-            'https://slack.com/api/reactions.get',
-            headers=headers,
-            params={
-                'channel': channel_id,
-                'timestamp': ts
-            }
-        )
-
-        result = response.json()
-        if result.get('ok'):
-            message = result.get('message', {})
-            reactions = message.get('reactions', [])
-
-            # ⭐ (star) 이모지 확인
-            for reaction in reactions:
-                if reaction.get('name') == 'star':
-                    print(f"[DEBUG] Found ⭐ on message index {idx}: {msg_info.get('title', '')[:30]}")
-                    starred_indices.append(idx)
-                    break
-        else:
-            print(f"[DEBUG] API error for message {idx}: {result.get('error')}")
+    starred_indices = []
+    for msg_info in message_ts_list:
+        # ⭐ (star) 이모지 확인
+        reactions = reactions_by_ts.get(msg_info.get('ts'), [])
+        if any(reaction.get('name') == 'star' for reaction in reactions):
+            starred_indices.append(msg_info.get('index'))
 
-    print(f"[DEBUG] Starred indices: {starred_indices}")
+    print(f"[Slack] 초안 {len(message_ts_list)}개 중 ⭐ {len(starred_indices)}개: {starred_indices}")
 
-    # 최대 3개만 반환 (먼저 선택된 순서)
+    # 최대 3개만 반환 (초안 순서)
     return starred_indices[:3]
 
 
@@ -611,11 +603,6 @@ def send_final_news(top3_indices=None, channel_id=None, bot_token=None, full_new
     # TOP 3 기사 추출
     top3_articles = [articles[i] for i in top3_indices if i < len(articles)]
 
-    headers = {
-        'Authorization': f'Bearer {bot_token}',
-        'Content-Type': 'application/json'
-    }
-
     kst = timezone(timedelta(hours=9))
     today = datetime.now(kst).strftime('%Y년 %m월 %d일')
 
@@ -671,26 +658,20 @@ def send_final_news(top3_indices=None, channel_id=None, bot_token=None, full_new
         })
 
     # 발송
-    response = requests.post(
-        'https://slack.com/api/chat.postMessage',
-        headers=headers,
-        json={
-            'channel': channel_id,
-            'blocks': blocks,
-            'text': f'ONDA 뉴스 브리핑 - {today}'
-        }
-    )
+    result = SlackClient(bot_token).post_message(channel_id, {
+        'blocks': blocks,
+        'text': f'ONDA 뉴스 브리핑 - {today}'
+    })
 
-    result = response.json()
-    if result.get('ok'):
+    if result['ok']:
         return {
             'success': True,
-            'ts': result.get('ts'),
+            'ts': result['ts'],
             'top3_indices': top3_indices,
             'selection_note': selection_note
         }
     else:
-        return {'success': False, 'message': result.get('error')}
+        return {'success': False, 'message': result['error']}
 
 
 # =============================================================================
@@ -0,0 +1,125 @@
+"""
+제목 정규화/토큰화 (중복 판단용)
+
+중복 제거는 기사 쌍마다 제목 유사도/같은 스토리/핵심 키워드를 비교하므로
+토큰화 비용이 기사 수의 제곱으로 늘어남
+- 정규식과 불용어/엔티티 목록은 import 시 한 번만 컴파일
+- 토큰화 결과는 제목(또는 텍스트) 기준으로 캐시 (lru_cache)
+- 캐시된 결과를 공유하므로 frozenset/tuple로 반환 (수정 불가)
+
+벤치마크: python benchmarks/bench_title_similarity.py
+"""
+
+import re
+from functools import lru_cache
+
+
+CACHE_SIZE = 16384
+
+# 특수문자 (제목 단어 분리 전 제거)
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
+# 제목 유사도 보정용 핵심 키워드 패턴 (회사명, 금액 등)
+SIMILARITY_KEY_PATTERNS = [
+    r'야놀자', r'여기어때', r'에어비앤비', r'아고다', r'부킹', r'트립닷컴',
+    r'마이리얼트립', r'nol', r'\d+억', r'\d+조', r'\d+%'
+]
+_SIMILARITY_KEY_RES = [re.compile(pattern) for pattern in SIMILARITY_KEY_PATTERNS]
+
+# 핵심 키워드 비교용 불용어 (의미 없는 단어)
+CORE_KEYWORD_STOPWORDS = frozenset({
+    '의', '를', '을', '이', '가', '은', '는', '에', '에서', '와', '과',
+    '로', '으로', '도', '만', '더', '등', '및', '또', '그', '저', '이런',
+    '것', '수', '중', '후', '전', '약', '각', '매', '내', '외', '상', '하',
+    '대', '소', '신', '구', '위', '아래', '앞', '뒤', '간', '별', '당',
+    '말', '년', '월', '일', '시', '분', '초', '명', '개', '곳', '번',
+    '절반', '이상', '최대', '최소', '약', '경험', '집중', '새해', '올해'
+})
+
+# 중요 회사명/브랜드 (이것만 같아도 같은 주제일 가능성 높음)
+CORE_IMPORTANT_ENTITIES = [
+    '야놀자', '야놀자리서치', '여기어때', '에어비앤비', '부킹닷컴', '익스피디아',
+    '트립닷컴', '아고다', '호텔스닷컴', '마이리얼트립', '온다', 'onda',
+    '네이버', '카카오', '쏘카', '인터파크'
+]
+_CORE_ENTITIES_LOWER = [entity.lower() for entity in CORE_IMPORTANT_ENTITIES]
+
+# 핵심 키워드 추출 시 제거할 숫자/% 와 특수문자
+_NUMBER_RE = re.compile(r'\d+\.?\d*%?')
+_NON_WORD_RE = re.compile(r'[^\w\s가-힣]')
+
+# 제목에서 찾는 회사명 (같은 스토리 판단용, 먼저 나오는 것 우선)
+STORY_TITLE_COMPANIES = ['야놀자', '여기어때', '에어비앤비', '아고다', '부킹닷컴',
+                         '트립닷컴', '마이리얼트립', 'nol', '놀유니버스', '온다']
+
+STORY_STOPWORDS = frozenset({'의', '를', '을', '이', '가', '은', '는', '에', '에서', '와', '과', '로', '으로', '도', '만', '더', '등'})
+
+# 토픽 추출 (회사명, 금액, 이벤트 타입)
+TOPIC_COMPANIES = ['야놀자', '여기어때', '에어비앤비', '아고다', '부킹닷컴',
+                   '트립닷컴', '마이리얼트립', 'nol', '놀', '온다', 'onda']
+_AMOUNT_RE = re.compile(r'\d+억|\d+조|\d+만')
+TOPIC_EVENT_TYPES = [
+    ('investment', ['투자', '펀딩', '시리즈']),
+    ('ma', ['인수', '합병', 'm&a']),
+    ('launch', ['출시', '런칭', '오픈']),
+    ('earnings', ['실적', '매출', '영업이익']),
+]
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def title_words(title):
+    """특수문자 제거하고 단어로 분리 (소문자)"""
+    return frozenset(_PUNCTUATION_RE.sub('', title.lower()).split())
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def key_pattern_hits(title):
+    """제목에 등장하는 핵심 키워드 패턴 번호 집합"""
+    title_lower = title.lower()
+    return frozenset(i for i, pattern in enumerate(_SIMILARITY_KEY_RES) if pattern.search(title_lower))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def extract_core_keywords(title):
+    """핵심 키워드 추출 (2글자 이상, 숫자/% 제외, 불용어 제외)"""
+    # 숫자와 % 제거
+    title_clean = _NUMBER_RE.sub('', title)
+    # 특수문자 제거 (한글, 영문, 숫자만 남김)
+    title_clean = _NON_WORD_RE.sub(' ', title_clean)
+    # 2글자 이상, 불용어 제외
+    return frozenset(w for w in title_clean.lower().split() if len(w) >= 2 and w not in CORE_KEYWORD_STOPWORDS)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def find_core_entities(title):
+    """제목에서 중요 엔티티(회사명) 찾기"""
+    title_lower = title.lower()
+    return frozenset(entity for entity in _CORE_ENTITIES_LOWER if entity in title_lower)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def find_title_company(title):
+    """제목의 첫 번째 회사명 (STORY_TITLE_COMPANIES 순서 기준)"""
+    title_lower = title.lower()
+    for company in STORY_TITLE_COMPANIES:
+        if company in title_lower:
+            return company
+    return None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def topic_from_text(text):
+    """
+    소문자 텍스트의 토픽 (회사명 튜플, 금액 튜플, 이벤트 타입)
+    이벤트 타입은 TOPIC_EVENT_TYPES 순서대로 첫 번째 매칭
+    """
+    companies = tuple(company for company in TOPIC_COMPANIES if company in text)
+    amounts = tuple(_AMOUNT_RE.findall(text))
+
+    event_type = None
+    for name, keywords in TOPIC_EVENT_TYPES:
+        if any(kw in text for kw in keywords):
+            event_type = name
+            break
+
+    return companies, amounts, event_type